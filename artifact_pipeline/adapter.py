@@ -1,3 +1,5 @@
+import itertools
+import math
 import os
 import sys
 
@@ -14,12 +16,55 @@ from simulate_cribbage_games import (  # noqa: E402
     Index,
     DECK_SET,
     score_hand_and_starter,
-    fifteens_points,
-    pairs_points,
-    runs_points,
-    flush_points,
-    nobs_points,
     cached_pairs_runs_and_fifteens_points,
+    hand_plus_starter_index_multiset_rank,
+    HAND_PLUS_STARTER_PAIRS_RUNS_AND_FIFTEENS_POINTS,
+    index_multiset_rank,
+    index_multiset_count,
+    KEPT_INDICES_POINTS_BY_STARTER_INDEX,
+    FLUSH_AND_NOBS_POINTS_BY_STARTER_SUIT,
+    kept_indices_total_points_over_starter_indices,
+    kept_card_ids_points_by_starter_index,
+    kept_card_ids_flush_and_nobs_points_by_starter_suit,
+    kept_card_ids_total_points_over_starters,
+    CARD_ID_INDICES,
+    CARD_ID_SUITS,
+    card_id,
+    card_from_id,
+    index_and_suit_card_id,
+    CardMask,
+    EMPTY_CARD_MASK,
+    FULL_DECK_CARD_MASK,
+    card_ids_mask,
+    card_mask_contains,
+    card_mask_remove,
+    card_mask_difference,
+    card_mask_count,
+    card_mask_card_ids,
+    sample_card_mask_card_ids,
+    SuitPermutation,
+    suit_canonical_index_suit_pairs,
+    suit_canonical_card_ids,
+    suit_permuted_card_ids,
+    score_card_ids_hand_and_starter,
+    score_card_ids_hand_and_starter_breakdown,
+    score_card_ids_hand_over_starters,
+    score_card_ids_hands_and_starters,
+    HandPointsBreakdown,
+    CacheUsage,
+    register_cache_usage,
+    functools_cache_usage,
+    get_cache_usages,
+    print_cache_usages,
+    dump_cache_usages,
+    registered_cache,
+    register_cache_clearer,
+    calc_cache_maxsize,
+    parse_calc_cache_maxsizes,
+    parse_memory_size,
+    configure_calc_cache_maxsizes,
+    configure_calc_cache_memory_ceiling,
+    enforce_calc_cache_memory_ceiling,
     BEST_STATIC_SELECT_PONE_KEPT_CARDS,
     BEST_STATIC_SELECT_DEALER_KEPT_CARDS,
     DEFAULT_SELECT_PLAY,
@@ -31,19 +76,85 @@ __all__ = [
     "DECK_SET",
     "score_hand_and_starter",
     "score_hand_and_starter_breakdown",
+    "score_card_ids_hand_and_starter_breakdown",
+    "hand_points_breakdown_to_dict",
     "cached_pairs_runs_and_fifteens_points",
+    "hand_plus_starter_index_multiset_rank",
+    "HAND_PLUS_STARTER_PAIRS_RUNS_AND_FIFTEENS_POINTS",
+    "index_multiset_rank",
+    "KEPT_INDICES_POINTS_BY_STARTER_INDEX",
+    "FLUSH_AND_NOBS_POINTS_BY_STARTER_SUIT",
+    "kept_indices_total_points_over_starter_indices",
+    "kept_card_ids_points_by_starter_index",
+    "kept_card_ids_flush_and_nobs_points_by_starter_suit",
+    "kept_card_ids_total_points_over_starters",
+    "CARD_ID_INDICES",
+    "CARD_ID_SUITS",
+    "card_id",
+    "card_from_id",
+    "index_and_suit_card_id",
+    "CardMask",
+    "EMPTY_CARD_MASK",
+    "FULL_DECK_CARD_MASK",
+    "card_ids_mask",
+    "card_mask_contains",
+    "card_mask_remove",
+    "card_mask_difference",
+    "card_mask_count",
+    "card_mask_card_ids",
+    "sample_card_mask_card_ids",
+    "SuitPermutation",
+    "suit_canonical_index_suit_pairs",
+    "suit_canonical_card_ids",
+    "suit_permuted_card_ids",
+    "score_card_ids_hand_and_starter",
     "BEST_STATIC_SELECT_PONE_KEPT_CARDS",
     "BEST_STATIC_SELECT_DEALER_KEPT_CARDS",
     "legacy_select_play_rank",
     "get_canonical_pairs",
+    "SIX_RANK_MULTISETS",
+    "SIX_RANK_MULTISET_COUNT",
+    "rank_six_rank_multiset",
+    "unrank_six_rank_multiset",
+    "KEPT_RANK_HANDS",
+    "KEPT_RANK_HAND_COUNT",
+    "rank_kept_rank_hand",
+    "unrank_kept_rank_hand",
+    "ANALYTICAL_PAIR_COUNT",
+    "rank_analytical_pair",
+    "unrank_analytical_pair",
+    "CANONICAL_PAIR_COUNT",
+    "rank_canonical_pair",
+    "unrank_canonical_pair",
     "score_hand_over_starters",
+    "score_card_ids_hand_over_starters",
+    "score_card_ids_hands_and_starters",
+    "HandPointsBreakdown",
+    "CacheUsage",
+    "register_cache_usage",
+    "functools_cache_usage",
+    "get_cache_usages",
+    "print_cache_usages",
+    "dump_cache_usages",
+    "registered_cache",
+    "register_cache_clearer",
+    "calc_cache_maxsize",
+    "parse_calc_cache_maxsizes",
+    "parse_memory_size",
+    "configure_calc_cache_maxsizes",
+    "configure_calc_cache_memory_ceiling",
+    "enforce_calc_cache_memory_ceiling",
 ]
 
 
 def legacy_select_play_rank(playable_ranks, current_play_count, sequence):
     """Select a rank using the immutable legacy simulator's default policy."""
-    playable_cards = [Card(rank, 0) for rank in playable_ranks]
-    sequence_cards = [Card(rank, 0) for rank in sequence]
+    playable_cards = [
+        card_from_id(index_and_suit_card_id(rank, 0)) for rank in playable_ranks
+    ]
+    sequence_cards = [
+        card_from_id(index_and_suit_card_id(rank, 0)) for rank in sequence
+    ]
     selected_index = DEFAULT_SELECT_PLAY(
         playable_cards, current_play_count, sequence_cards
     )
@@ -76,78 +187,115 @@ def get_canonical_pairs():
     return pairs
 
 
-def score_hand_and_starter_breakdown(kept_hand, starter, is_crib=False):
-    """Score a hand and starter with cribbage-rule point categories."""
-    hand_plus_starter = [*kept_hand, starter]
-    sorted_indices = tuple(sorted(card.index for card in hand_plus_starter))
-    fifteens = fifteens_points(hand_plus_starter)
-    pairs = pairs_points(sorted_indices)
-    runs = runs_points(sorted_indices)
-    flushes = flush_points(kept_hand, starter, is_crib=is_crib)
-    nobs = nobs_points(kept_hand, starter)
-    total = fifteens + pairs + runs + flushes + nobs
-    return {
-        "total": total,
-        "fifteens": fifteens,
-        "pairs": pairs,
-        "runs": runs,
-        "flushes": flushes,
-        "nobs": nobs,
-    }
-
-
-JACK_INDEX = 10
-
-
-def insert_sorted(sorted_4, x):
-    """
-    Inserts value x into a sorted 4-element tuple to produce a sorted 5-element tuple.
-    Avoids overhead of sorting list of 5 elements.
-    """
-    if x <= sorted_4[0]:
-        return (x, sorted_4[0], sorted_4[1], sorted_4[2], sorted_4[3])
-    if x <= sorted_4[1]:
-        return (sorted_4[0], x, sorted_4[1], sorted_4[2], sorted_4[3])
-    if x <= sorted_4[2]:
-        return (sorted_4[0], sorted_4[1], x, sorted_4[2], sorted_4[3])
-    if x <= sorted_4[3]:
-        return (sorted_4[0], sorted_4[1], sorted_4[2], x, sorted_4[3])
-    return (sorted_4[0], sorted_4[1], sorted_4[2], sorted_4[3], x)
+# Dense rank/unrank indexes for the rank-only hand classes, so tables over them
+# can be flat lists and processes can exchange ints instead of tuples.  Each
+# order matches the enumeration the pipeline already uses for that class.
+# Multisets are ranked through the legacy colex index_multiset_rank and a
+# lookup table into the dense lexicographic order.
+def _dense_rank_multisets(length, max_rank_count):
+    multisets = tuple(
+        ranks
+        for ranks in itertools.combinations_with_replacement(
+            range(len(Index.indices)), length
+        )
+        if all(ranks.count(rank) <= max_rank_count for rank in set(ranks))
+    )
+    dense_ranks = [-1] * index_multiset_count(length)
+    for dense_rank, ranks in enumerate(multisets):
+        dense_ranks[index_multiset_rank(ranks)] = dense_rank
+    return multisets, dense_ranks
 
 
-def score_hand_over_starters(kept_hand, starters):
-    """
-    Score a kept hand of 4 cards against a list of starter cards.
-    Pre-computes hand-invariant properties to optimize performance.
-    """
-    sorted_kept_indices = sorted([c.index for c in kept_hand])
-
-    kept_hand_suits = [c.suit for c in kept_hand]
-    is_flush = (
-        kept_hand_suits[0]
-        == kept_hand_suits[1]
-        == kept_hand_suits[2]
-        == kept_hand_suits[3]
+SIX_RANK_MULTISETS, _SIX_RANK_MULTISET_DENSE_RANKS = _dense_rank_multisets(6, 4)
+SIX_RANK_MULTISET_COUNT = len(SIX_RANK_MULTISETS)
+KEPT_RANK_HANDS, _KEPT_RANK_HAND_DENSE_RANKS = _dense_rank_multisets(4, 4)
+KEPT_RANK_HAND_COUNT = len(KEPT_RANK_HANDS)
+ANALYTICAL_PAIR_COUNT = math.comb(len(Index.indices) + 1, 2)
+CANONICAL_PAIR_COUNT = len(Index.indices) ** 2
+
+
+def rank_six_rank_multiset(sorted_ranks):
+    """Return the dense index in range(18,395) of six sorted dealt ranks."""
+    dense_rank = _SIX_RANK_MULTISET_DENSE_RANKS[index_multiset_rank(sorted_ranks)]
+    if dense_rank < 0:
+        raise ValueError(f"More than four cards of one rank: {sorted_ranks}")
+    return dense_rank
+
+
+def unrank_six_rank_multiset(dense_rank):
+    """Return the six sorted dealt ranks at a dense six-rank multiset index."""
+    return SIX_RANK_MULTISETS[dense_rank]
+
+
+def rank_kept_rank_hand(sorted_ranks):
+    """Return the dense index in range(1,820) of four sorted kept ranks."""
+    return _KEPT_RANK_HAND_DENSE_RANKS[index_multiset_rank(sorted_ranks)]
+
+
+def unrank_kept_rank_hand(dense_rank):
+    """Return the four sorted kept ranks at a dense kept hand index."""
+    return KEPT_RANK_HANDS[dense_rank]
+
+
+def rank_analytical_pair(low_rank, high_rank):
+    """Return the get_analytical_pairs() position of a low/high rank pair."""
+    return (
+        low_rank * len(Index.indices)
+        - low_rank * (low_rank - 1) // 2
+        + high_rank
+        - low_rank
     )
-    flush_suit = kept_hand_suits[0] if is_flush else -1
 
-    jack_suits = {c.suit for c in kept_hand if c.index == JACK_INDEX}
 
-    scores = {}
-    for starter in starters:
-        # 1. Pairs, runs, fifteens points (cached)
-        hand_combo = insert_sorted(sorted_kept_indices, starter.index)
-        pts = cached_pairs_runs_and_fifteens_points(hand_combo)
+def unrank_analytical_pair(dense_rank):
+    """Return the low/high rank pair at a get_analytical_pairs() position."""
+    low_rank = 0
+    while dense_rank >= len(Index.indices) - low_rank:
+        dense_rank -= len(Index.indices) - low_rank
+        low_rank += 1
+    return low_rank, low_rank + dense_rank
+
+
+def rank_canonical_pair(low_rank, high_rank, is_suited):
+    """Return the get_canonical_pairs() position of a low/high rank pair."""
+    block_start = low_rank * (2 * len(Index.indices) - low_rank)
+    if low_rank == high_rank:
+        return block_start
+    return block_start + 2 * (high_rank - low_rank) - is_suited
+
+
+def unrank_canonical_pair(dense_rank):
+    """Return (low rank, high rank, is suited) at a get_canonical_pairs() position."""
+    low_rank = 0
+    while dense_rank >= 2 * (len(Index.indices) - low_rank) - 1:
+        dense_rank -= 2 * (len(Index.indices) - low_rank) - 1
+        low_rank += 1
+    if not dense_rank:
+        return low_rank, low_rank, False
+    return low_rank, low_rank + (dense_rank + 1) // 2, bool(dense_rank % 2)
+
+
+def score_hand_and_starter_breakdown(kept_hand, starter, is_crib=False):
+    """Score a hand and starter with cribbage-rule point categories."""
+    return hand_points_breakdown_to_dict(
+        score_card_ids_hand_and_starter_breakdown(
+            [card_id(card) for card in kept_hand], card_id(starter), is_crib=is_crib
+        )
+    )
 
-        # 2. Flush points
-        # is_crib=False because we are scoring the opponent's kept hand, not a crib.
-        if is_flush:
-            pts += 5 if starter.suit == flush_suit else 4
 
-        # 3. Nobs points
-        if starter.suit in jack_suits:
-            pts += 1
+def hand_points_breakdown_to_dict(breakdown):
+    """Convert a legacy HandPointsBreakdown tuple to a point-type dict."""
+    return {"total": breakdown.total, **breakdown._asdict()}
 
-        scores[starter] = pts
 
-    return scores
+def score_hand_over_starters(kept_hand, starters):
+    """
+    Score a kept hand of 4 cards against a list of starter cards.
+    Returns a dict mapping each starter card to its score.
+    """
+    scores = score_card_ids_hand_over_starters(
+        [card_id(card) for card in kept_hand],
+        [card_id(starter) for starter in starters],
+    )
+    return dict(zip(starters, scores))
@@ -17,6 +17,7 @@ Relationship to the Monte Carlo Generator:
 """
 
 import argparse
+from collections import OrderedDict
 from functools import lru_cache
 import itertools
 import json
@@ -24,15 +25,35 @@ import math
 import os
 import sys
 from typing import Iterable, List, Tuple
+import weakref
 
 if __package__ in (None, ""):  # pragma: no cover
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # pylint: disable=wrong-import-position
 from artifact_pipeline.adapter import (  # noqa: E402
+    ANALYTICAL_PAIR_COUNT,
+    KEPT_RANK_HANDS,
+    SIX_RANK_MULTISETS,
+    CacheUsage,
     Index,
     cached_pairs_runs_and_fifteens_points,
+    calc_cache_maxsize,
+    configure_calc_cache_maxsizes,
+    configure_calc_cache_memory_ceiling,
+    dump_cache_usages,
+    enforce_calc_cache_memory_ceiling,
     get_canonical_pairs,
+    parse_calc_cache_maxsizes,
+    parse_memory_size,
+    print_cache_usages,
+    rank_analytical_pair,
+    rank_kept_rank_hand,
+    register_cache_clearer,
+    register_cache_usage,
+    registered_cache,
+    unrank_analytical_pair,
+    unrank_canonical_pair,
 )
 
 DEFAULT_OUTPUT_PATH = "expected_crib_points.analytical.json"
@@ -46,15 +67,36 @@ DEFAULT_IBR_MAX_ITERATIONS = 100
 DEFAULT_FULL_HAND_POLICY_MAX_ITERATIONS = 3
 _POLICY_SCORE_CACHE_KEY = ("__policy_score_cache__",)
 _POLICY_TOTAL_WEIGHT_CACHE_KEY = ("__policy_total_weight_cache__",)
+# Each entry holds the (subset, candidate) key plus two totals and two 13-rank
+# removal tuples.
+_APPROXIMATE_POLICY_SCORE_CACHE_ENTRY_BYTES = (
+    3 * 8
+    + sys.getsizeof(((), 0))
+    + sys.getsizeof((0.0, (), 0.0, ()))
+    + 2 * sys.getsizeof((0.0,) * 13)
+    + 28 * sys.getsizeof(0.0)
+)
+
+
+class _PolicyScoreCache(OrderedDict):
+    """Least recently used subset candidate score cache tracked by weak reference."""
+
+    __hash__ = object.__hash__
+
+    def __init__(self, maxsize=None):
+        super().__init__()
+        self.maxsize = maxsize
+
+
+_LIVE_POLICY_SCORE_CACHES: "weakref.WeakSet[_PolicyScoreCache]" = weakref.WeakSet()
+_POLICY_SCORE_CACHE_LOOKUPS = {"hits": 0, "misses": 0}
 
 
 def get_analytical_pairs():
     """Generate the 91 unique suit-free rank pairs (indices 0..12)."""
-    pairs = []
-    for r1 in range(13):
-        for r2 in range(r1, 13):
-            pairs.append((r1, r2))
-    return pairs
+    return [
+        unrank_analytical_pair(pair_rank) for pair_rank in range(ANALYTICAL_PAIR_COUNT)
+    ]
 
 
 def get_card_removal_weight(removed_cards, selected_cards):
@@ -69,7 +111,7 @@ def get_card_removal_weight(removed_cards, selected_cards):
     return weight
 
 
-@lru_cache(maxsize=None)
+@registered_cache
 def score_combination_suit_free(kept_indices, starter_index, true_nobs=True):
     """
     Calculate the exact suit-free score of a 5-card rank index combination.
@@ -95,18 +137,37 @@ def score_combination_suit_free(kept_indices, starter_index, true_nobs=True):
     return base_points + nobs_ev
 
 
+def _policy_score_cache_usage():
+    """Report lookups and live entries across all policy score caches."""
+    size = sum(len(score_cache) for score_cache in _LIVE_POLICY_SCORE_CACHES)
+    return CacheUsage(
+        _POLICY_SCORE_CACHE_LOOKUPS["hits"],
+        _POLICY_SCORE_CACHE_LOOKUPS["misses"],
+        size,
+        size * _APPROXIMATE_POLICY_SCORE_CACHE_ENTRY_BYTES,
+    )
+
+
+def _clear_policy_score_caches():
+    """Empty every live policy score cache."""
+    for score_cache in _LIVE_POLICY_SCORE_CACHES:
+        score_cache.clear()
+
+
+register_cache_usage("policy_score_cache", _policy_score_cache_usage)
+register_cache_clearer("policy_score_cache", _clear_policy_score_caches)
+
+
 def get_hand_combinations_with_weights():
     """
-    Precompute all 18,564 unique dealt 6-card hand rank combinations
+    Precompute all 18,395 unique dealt 6-card hand rank combinations
     along with their standard combinations weight.
     """
     hands = []
-    # Generate all sorted multisets of size 6 from 13 ranks
-    for comb in itertools.combinations_with_replacement(range(13), 6):
-        # Count multiplicity of each rank to ensure it is <= 4 in the deck
+    # All sorted multisets of size 6 from 13 ranks with no rank dealt more
+    # than 4 times, in dense six-rank multiset index order
+    for comb in SIX_RANK_MULTISETS:
         counts = [comb.count(r) for r in range(13)]
-        if any(c > 4 for c in counts):
-            continue
 
         # Compute standard combinatorial weight
         weight = 1
@@ -249,7 +310,9 @@ def _build_policy_subset_aggregates(selected_discards, hand_rank_counts):
             _freeze_policy_subset_entries(dealer_entries),
             _freeze_policy_subset_entries(pone_entries),
         )
-    frozen_aggregates[_POLICY_SCORE_CACHE_KEY] = {}
+    score_cache = _PolicyScoreCache(calc_cache_maxsize("policy_score_cache"))
+    _LIVE_POLICY_SCORE_CACHES.add(score_cache)
+    frozen_aggregates[_POLICY_SCORE_CACHE_KEY] = score_cache
     frozen_aggregates[_POLICY_TOTAL_WEIGHT_CACHE_KEY] = {}
     return frozen_aggregates
 
@@ -309,7 +372,13 @@ def _get_policy_subset_candidate_totals(
     score_cache = policy_subset_aggregates[_POLICY_SCORE_CACHE_KEY]
     cache_key = (subset_key, candidate_idx)
     if cache_key in score_cache:
+        _POLICY_SCORE_CACHE_LOOKUPS["hits"] += 1
+        if score_cache.maxsize is not None:
+            score_cache.move_to_end(cache_key)
         return score_cache[cache_key]
+    _POLICY_SCORE_CACHE_LOOKUPS["misses"] += 1
+    if score_cache.maxsize is not None and len(score_cache) >= score_cache.maxsize:
+        score_cache.popitem(last=False)
 
     dealer_entries, pone_entries = policy_subset_aggregates[subset_key]
     dealer_totals = _score_policy_subset_role(
@@ -637,21 +706,15 @@ def _run_analytical_ibr(
     crib_scores = precompute_exact_crib_scores(true_nobs=true_nobs)
     crib_score_matrices = _build_crib_score_matrices(crib_scores, num_pairs)
 
-    # 2. Precompute kept hand expected values for each of the 18,564 hands
+    # 2. Precompute kept hand expected values for each of the 18,395 hands
     # Precomputing all unique 4-card kept rank combinations allows us to evaluate
     # kept EV algebraically without inner loop iterations.
-    unique_kept = []
-    for comb in itertools.combinations_with_replacement(range(13), 4):
-        unique_kept.append(comb)
-
-    kept_totals = {}
-    kept_card_scores = {}
-    for kept in unique_kept:
-        card_scores = [
-            score_combination_suit_free(kept, r, true_nobs=true_nobs) for r in range(13)
-        ]
-        kept_totals[kept] = sum(card_scores)
-        kept_card_scores[kept] = card_scores
+    # Both tables are flat lists in dense kept rank hand index order.
+    kept_card_scores = [
+        [score_combination_suit_free(kept, r, true_nobs=true_nobs) for r in range(13)]
+        for kept in KEPT_RANK_HANDS
+    ]
+    kept_totals = [sum(card_scores) for card_scores in kept_card_scores]
 
     hand_kept_evs = []
     for hand, weight in hands:
@@ -663,13 +726,13 @@ def _run_analytical_ibr(
             kept = list(hand)
             kept.remove(d[0])
             kept.remove(d[1])
-            kept_tup = tuple(kept)
+            kept_rank = rank_kept_rank_hand(kept)
 
             # Sum_{r} (4 - count_hand[r]) * score(kept, r) = 4 * TotalScore(kept) - Sum_{c in hand} score(kept, c)
-            total_score = 4.0 * kept_totals[kept_tup] - sum(
-                kept_card_scores[kept_tup][card] for card in hand
+            total_score = 4.0 * kept_totals[kept_rank] - sum(
+                kept_card_scores[kept_rank][card] for card in hand
             )
-            p_idx = analytical_pairs.index(d)
+            p_idx = rank_analytical_pair(*d)
             discards_ev[p_idx] = total_score / 46.0
         hand_kept_evs.append((hand, weight, discards_ev))
     conditioned_hand_weights = [
@@ -690,6 +753,7 @@ def _run_analytical_ibr(
     iteration = 0
     print(f"Starting pair-conditioned IBR loop (max {max_iterations} iterations)...")
     while iteration < max_iterations:
+        enforce_calc_cache_memory_ceiling()
         selected_discards = _select_discard_indices(
             hand_kept_evs,
             dl_tbl,
@@ -754,6 +818,7 @@ def _run_analytical_ibr(
             f"(max {full_hand_iterations} iterations)..."
         )
         for full_hand_iteration in range(full_hand_iterations):
+            enforce_calc_cache_memory_ceiling()
             policy_subset_aggregates = _build_policy_subset_aggregates(
                 selected_discards, hand_rank_counts
             )
@@ -1011,12 +1076,10 @@ def format_table_as_generation_zero(
         "K": 12,
     }
 
-    for canonical in canonical_pairs:
+    for canonical_rank, canonical in enumerate(canonical_pairs):
         # Convert canonical (e.g. 7_8_Suited) to ranks (e.g. 7, 8)
-        parts = canonical.split("_")
-        r1_name, r2_name = parts[0], parts[1]
-        r1, r2 = ranks_mapping[r1_name], ranks_mapping[r2_name]
-        d_idx = analytical_pairs.index((r1, r2))
+        r1, r2, _is_suited = unrank_canonical_pair(canonical_rank)
+        d_idx = rank_analytical_pair(r1, r2)
 
         pair_data = {}
         for player in ["Dealer", "Pone"]:
@@ -1081,7 +1144,45 @@ def main():
             f"(default: {DEFAULT_FULL_HAND_POLICY_MAX_ITERATIONS})."
         ),
     )
+    parser.add_argument(
+        "--show-calc-cache-usage-stats",
+        action="store_true",
+        help="Print calculation cache usage statistics on completion.",
+    )
+    parser.add_argument(
+        "--calc-cache-usage-stats-directory",
+        help="Directory to write calc_cache_usage_stats.<pid>.json to on completion.",
+    )
+    parser.add_argument(
+        "--calc-cache-maxsizes",
+        default="",
+        help=(
+            "Comma separated name=size least recently used calculation cache "
+            "maximum entry counts (default: CALC_CACHE_MAXSIZES environment "
+            "variable, else unbounded)."
+        ),
+    )
+    parser.add_argument(
+        "--calc-cache-memory-ceiling",
+        default="",
+        help=(
+            "Approximate total calculation cache bytes, with optional K, M or G "
+            "suffix, above which the largest caches are cleared (default: "
+            "CALC_CACHE_MEMORY_CEILING environment variable, else none)."
+        ),
+    )
     args = parser.parse_args()
+    try:
+        if args.calc_cache_maxsizes:
+            configure_calc_cache_maxsizes(
+                parse_calc_cache_maxsizes(args.calc_cache_maxsizes)
+            )
+        if args.calc_cache_memory_ceiling:
+            configure_calc_cache_memory_ceiling(
+                parse_memory_size(args.calc_cache_memory_ceiling)
+            )
+    except ValueError as error:
+        parser.error(str(error))
 
     print(
         f"Starting generic suit-free analytical solver "
@@ -1117,6 +1218,10 @@ def main():
         f"Analytical table generated successfully: {args.output} "
         f"(91 rank pairs converted to 169 canonical suited/unsuited pairs)"
     )
+    if args.show_calc_cache_usage_stats:
+        print_cache_usages()
+    if args.calc_cache_usage_stats_directory:
+        dump_cache_usages(args.calc_cache_usage_stats_directory)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -6,7 +6,6 @@ import argparse
 from dataclasses import dataclass, field
 import gzip
 import hashlib
-import itertools
 import json
 import math
 import random
@@ -20,7 +19,13 @@ if __package__ in (None, ""):  # pragma: no cover
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 # pylint: disable=wrong-import-position
-from artifact_pipeline.adapter import Card, Index, score_hand_and_starter_breakdown
+from artifact_pipeline.adapter import (
+    Index,
+    index_and_suit_card_id,
+    kept_card_ids_flush_and_nobs_points_by_starter_suit,
+    kept_card_ids_points_by_starter_index,
+    suit_canonical_index_suit_pairs,
+)
 from artifact_pipeline.analytical_solver import (
     DEFAULT_FULL_HAND_POLICY_MAX_ITERATIONS,
     DEFAULT_IBR_MAX_ITERATIONS,
@@ -141,10 +146,7 @@ def canonical_suit_key(cards: Iterable[tuple[int, int]]) -> tuple[tuple[int, int
         rank not in range(13) or suit not in range(4) for rank, suit in sorted_cards
     ):
         raise ValueError("physical cards must use ranks 0..12 and suits 0..3")
-    return min(
-        tuple(sorted((rank, permutation[suit]) for rank, suit in sorted_cards))
-        for permutation in itertools.permutations(range(4))
-    )
+    return suit_canonical_index_suit_pairs(sorted_cards)[0]
 
 
 def suit_normalized_six_card_state_count() -> int:
@@ -276,6 +278,20 @@ def _sample_rank_policy_keep(
     return tuple(sorted(kept))
 
 
+def _physical_hand_points(
+    kept: Sequence[tuple[int, int]], starter: tuple[int, int]
+) -> int:
+    """Score physical kept cards and starter from the per-kept-hand tables."""
+    kept_card_ids = [index_and_suit_card_id(rank, suit) for rank, suit in kept]
+    starter_rank, starter_suit = starter
+    return (
+        kept_card_ids_points_by_starter_index(kept_card_ids)[starter_rank]
+        + kept_card_ids_flush_and_nobs_points_by_starter_suit(kept_card_ids)[
+            starter_suit
+        ]
+    )
+
+
 def sample_suit_aware_hand_points(
     known_deal: Sequence[tuple[int, int]],
     opponent_role: str,
@@ -295,11 +311,7 @@ def sample_suit_aware_hand_points(
         kept = _sample_rank_policy_keep(policy, opponent_role, opponent_dealt, rng)
         starter_pool = [card for card in remaining if card not in opponent_dealt]
         starter = rng.choice(starter_pool)
-        score = score_hand_and_starter_breakdown(
-            [Card(rank, suit) for rank, suit in kept],
-            Card(*starter),
-        )["total"]
-        moments.add(float(score))
+        moments.add(float(_physical_hand_points(kept, starter)))
     return moments
 
 
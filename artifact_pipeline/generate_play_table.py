@@ -22,6 +22,16 @@ if __package__ in (None, ""):  # pragma: no cover
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # pylint: disable=wrong-import-position
+from artifact_pipeline.adapter import (  # noqa: E402
+    CARD_ID_INDICES,
+    CARD_ID_SUITS,
+    FULL_DECK_CARD_MASK,
+    CardMask,
+    card_ids_mask,
+    card_mask_difference,
+    index_and_suit_card_id,
+    sample_card_mask_card_ids,
+)
 from artifact_pipeline.analytical_solver import (  # noqa: E402
     _expected_crib_cut_tables,
     _expected_crib_tables,
@@ -48,7 +58,7 @@ from artifact_pipeline.pegging import (  # noqa: E402
 DEFAULT_OUTPUT_PATH = "expected_play_points.json"
 DEFAULT_CLIENT_OUTPUT_PATH = "expected_play_points.client.json"
 GENERATION_METHOD = "artifact_pipeline.generate_play_table.v2"
-PHYSICAL_DECK = tuple((rank, suit) for rank in range(13) for suit in range(4))
+PHYSICAL_CARDS_BY_CARD_ID = tuple(zip(CARD_ID_INDICES, CARD_ID_SUITS))
 
 
 @dataclass(frozen=True)
@@ -160,11 +170,24 @@ def solve_initial_discard_policy(
     )
 
 
+def _physical_cards_mask(cards: Sequence[tuple[int, int]]) -> CardMask:
+    return card_ids_mask(index_and_suit_card_id(rank, suit) for rank, suit in cards)
+
+
+def _sample_physical_cards(
+    deck_mask: CardMask, count: int, rng: random.Random
+) -> list[tuple[int, int]]:
+    return [
+        PHYSICAL_CARDS_BY_CARD_ID[card_id]
+        for card_id in sample_card_mask_card_ids(deck_mask, count, rng)
+    ]
+
+
 def sample_policy_deal(
     rng: random.Random, discard_policy: DiscardPolicy
 ) -> tuple[tuple[int, ...], tuple[int, ...]]:
     """Deal two six-card hands and apply the current discard policy."""
-    dealt = rng.sample(PHYSICAL_DECK, 12)
+    dealt = _sample_physical_cards(FULL_DECK_CARD_MASK, 12, rng)
     pone_dealt = dealt[:6]
     dealer_dealt = dealt[6:]
     pone_kept = discard_policy.keep_physical_cards(PONE, pone_dealt)
@@ -189,9 +212,10 @@ def _sample_target_deal(
     target_hand: Sequence[int], rng: random.Random
 ) -> tuple[tuple[int, int], ...]:
     target_kept = _representative_physical_hand(target_hand)
-    removed = set(target_kept)
-    target_discard_pool = [card for card in PHYSICAL_DECK if card not in removed]
-    target_discards = tuple(rng.sample(target_discard_pool, 2))
+    target_discard_pool = card_mask_difference(
+        FULL_DECK_CARD_MASK, _physical_cards_mask(target_kept)
+    )
+    target_discards = tuple(_sample_physical_cards(target_discard_pool, 2, rng))
     return target_kept + target_discards
 
 
@@ -202,9 +226,10 @@ def sample_opponent_keep(
     rng: random.Random,
 ) -> tuple[int, ...]:
     """Sample an opponent deal after removing a compatible target full deal."""
-    removed = set(_sample_target_deal(target_hand, rng))
-    remaining_deck = [card for card in PHYSICAL_DECK if card not in removed]
-    opponent_dealt = rng.sample(remaining_deck, 6)
+    remaining_deck = card_mask_difference(
+        FULL_DECK_CARD_MASK, _physical_cards_mask(_sample_target_deal(target_hand, rng))
+    )
+    opponent_dealt = _sample_physical_cards(remaining_deck, 6, rng)
     opponent_kept = discard_policy.keep_physical_cards(opponent_role, opponent_dealt)
     return tuple(sorted(card[0] for card in opponent_kept))
 
@@ -37,7 +37,10 @@ from artifact_pipeline.adapter import (  # noqa: E402
     BEST_STATIC_SELECT_PONE_KEPT_CARDS,
     BEST_STATIC_SELECT_DEALER_KEPT_CARDS,
     get_canonical_pairs,
-    score_hand_over_starters,
+    card_id,
+    hand_points_breakdown_to_dict,
+    score_card_ids_hand_over_starters,
+    score_card_ids_hands_and_starters,
 )
 
 DEFAULT_OUTPUT_PATH = "expected_crib_points.json"
@@ -159,12 +162,19 @@ def select_opponent_kept_cards_dynamic(
                     ev_by_rank[r] = policy_mean(stats) if stats is not None else 0.0
             ev_lookups[canonical_pair] = ev_by_rank
 
-    for kept_combination in itertools.combinations(opponent_dealt, 4):
-        kept_hand = list(kept_combination)
+    kept_hands = [
+        list(kept_combination)
+        for kept_combination in itertools.combinations(opponent_dealt, 4)
+    ]
+    starter_card_ids = [card_id(starter) for starter in starters]
+    kept_hands_starter_scores = score_card_ids_hands_and_starters(
+        [[card_id(card) for card in kept_hand] for kept_hand in kept_hands],
+        [starter_card_ids] * len(kept_hands),
+    )
 
-        # 1. Calculate average hand score using our optimized batch scoring helper
-        hand_scores = score_hand_over_starters(kept_hand, starters)
-        total_hand_score = sum(hand_scores.values())
+    for kept_hand, hand_scores in zip(kept_hands, kept_hands_starter_scores):
+        # 1. Calculate average hand score using the batch scoring kernel
+        total_hand_score = sum(hand_scores)
         average_hand_score = total_hand_score / len(starters)
 
         # 2. Calculate average crib score using the pre-computed policy EV table
@@ -692,6 +702,24 @@ def score_crib_sample(
     return cut_card, breakdown["total"]
 
 
+def crib_starter_breakdowns_by_rank(crib_hand, starters):
+    """Score a crib against every starter in one pass, grouped by starter rank."""
+    starter_breakdowns_by_rank = [[] for _ in Index.indices]
+    for starter, breakdown in zip(
+        starters,
+        score_card_ids_hand_over_starters(
+            [card_id(card) for card in crib_hand],
+            [card_id(starter) for starter in starters],
+            is_crib=True,
+            by_category=True,
+        ),
+    ):
+        starter_breakdowns_by_rank[starter.index].append(
+            (starter, hand_points_breakdown_to_dict(breakdown))
+        )
+    return starter_breakdowns_by_rank
+
+
 def score_crib_sample_ev_breakdown(
     discarded_cards,
     remaining_deck,
@@ -711,21 +739,15 @@ def score_crib_sample_ev_breakdown(
     canonical_pair = cards_to_canonical(discarded_cards[0], discarded_cards[1])
 
     results = []
-    for c in range(13):
-        starters = [card for card in remaining_after_deal if card.index == c]
-        if starters:
-            starter_breakdowns = [
-                (
-                    starter,
-                    score_hand_and_starter_breakdown(crib_hand, starter, is_crib=True),
-                )
-                for starter in starters
-            ]
+    for c, starter_breakdowns in enumerate(
+        crib_starter_breakdowns_by_rank(crib_hand, remaining_after_deal)
+    ):
+        if starter_breakdowns:
             results.append(
                 (
                     c,
                     average_starter_breakdowns(starter_breakdowns),
-                    len(starters),
+                    len(starter_breakdowns),
                     relation_breakdowns_for_starters(
                         canonical_pair, starter_breakdowns
                     ),
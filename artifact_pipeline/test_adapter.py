@@ -7,9 +7,34 @@ from artifact_pipeline.adapter import (
     score_hand_and_starter,
     score_hand_and_starter_breakdown,
     cached_pairs_runs_and_fifteens_points,
+    hand_plus_starter_index_multiset_rank,
+    HAND_PLUS_STARTER_PAIRS_RUNS_AND_FIFTEENS_POINTS,
     BEST_STATIC_SELECT_PONE_KEPT_CARDS,
     BEST_STATIC_SELECT_DEALER_KEPT_CARDS,
     score_hand_over_starters,
+    score_card_ids_hand_over_starters,
+    card_id,
+    card_from_id,
+    index_and_suit_card_id,
+    legacy_select_play_rank,
+    KEPT_INDICES_POINTS_BY_STARTER_INDEX,
+    index_multiset_rank,
+    kept_indices_total_points_over_starter_indices,
+    get_canonical_pairs,
+    SIX_RANK_MULTISETS,
+    SIX_RANK_MULTISET_COUNT,
+    rank_six_rank_multiset,
+    unrank_six_rank_multiset,
+    KEPT_RANK_HANDS,
+    KEPT_RANK_HAND_COUNT,
+    rank_kept_rank_hand,
+    unrank_kept_rank_hand,
+    ANALYTICAL_PAIR_COUNT,
+    rank_analytical_pair,
+    unrank_analytical_pair,
+    CANONICAL_PAIR_COUNT,
+    rank_canonical_pair,
+    unrank_canonical_pair,
 )
 
 
@@ -78,6 +103,88 @@ class TestAdapter(unittest.TestCase):
             expected = score_hand_and_starter(kept, starter, is_crib=False)
             self.assertEqual(scores[starter], expected)
 
+    def test_dense_score_table_shared_with_legacy(self):
+        """The adapter exposes the legacy dense rank-multiset score table."""
+        sorted_indices = (4, 4, 4, 4, 10)
+        self.assertEqual(
+            HAND_PLUS_STARTER_PAIRS_RUNS_AND_FIFTEENS_POINTS[
+                hand_plus_starter_index_multiset_rank(sorted_indices)
+            ],
+            cached_pairs_runs_and_fifteens_points(sorted_indices),
+        )
+
+    def test_score_card_ids_hand_over_starters(self):
+        """Test integer card ID batch scoring matches Card object scoring."""
+        kept = [Card(4, 0), Card(4, 1), Card(10, 2), Card(5, 2)]
+        starters = [card for card in DECK_SET if card not in kept]
+
+        scores = score_card_ids_hand_over_starters(
+            [card_id(card) for card in kept], [card_id(card) for card in starters]
+        )
+
+        self.assertEqual(
+            scores,
+            [score_hand_and_starter(kept, starter) for starter in starters],
+        )
+
+    def test_card_id_round_trip(self):
+        """Test integer card IDs map onto the shared legacy deck cards."""
+        card = card_from_id(index_and_suit_card_id(10, 3))
+        self.assertEqual((card.index, card.suit), (10, 3))
+        self.assertEqual(card_id(card), 49)
+
+    def test_legacy_select_play_rank(self):
+        """Test the legacy play policy leads low from rank-only inputs."""
+        self.assertEqual(legacy_select_play_rank([12, 3, 0], 0, []), 3)
+
+    def test_kept_indices_points_by_starter_index(self):
+        """Test the per-kept-hand starter table agrees with the 5-card table."""
+        kept = (4, 4, 4, 10)
+        points_by_starter_index = KEPT_INDICES_POINTS_BY_STARTER_INDEX[
+            index_multiset_rank(kept)
+        ]
+        self.assertEqual(len(points_by_starter_index), 13)
+        self.assertEqual(points_by_starter_index[4], 28)
+        self.assertEqual(
+            kept_indices_total_points_over_starter_indices(
+                kept, [1 if rank == 4 else 0 for rank in range(13)]
+            ),
+            28,
+        )
+
+    def test_hand_class_rank_unrank_round_trips(self):
+        """Test dense hand class indexes are bijective in enumeration order."""
+        self.assertEqual(SIX_RANK_MULTISET_COUNT, 18_395)
+        self.assertEqual(KEPT_RANK_HAND_COUNT, 1_820)
+        self.assertEqual(ANALYTICAL_PAIR_COUNT, 91)
+        self.assertEqual(CANONICAL_PAIR_COUNT, 169)
+        self.assertEqual(SIX_RANK_MULTISETS[-1], (11, 11, 12, 12, 12, 12))
+        for dense_rank in range(SIX_RANK_MULTISET_COUNT):
+            ranks = unrank_six_rank_multiset(dense_rank)
+            self.assertEqual(rank_six_rank_multiset(ranks), dense_rank)
+        with self.assertRaises(ValueError):
+            rank_six_rank_multiset((0, 0, 0, 0, 0, 1))
+        for dense_rank, ranks in enumerate(KEPT_RANK_HANDS):
+            self.assertEqual(unrank_kept_rank_hand(dense_rank), ranks)
+            self.assertEqual(rank_kept_rank_hand(ranks), dense_rank)
+        analytical_pairs = [
+            (low_rank, high_rank)
+            for low_rank in range(13)
+            for high_rank in range(low_rank, 13)
+        ]
+        for dense_rank, pair in enumerate(analytical_pairs):
+            self.assertEqual(unrank_analytical_pair(dense_rank), pair)
+            self.assertEqual(rank_analytical_pair(*pair), dense_rank)
+        for dense_rank, canonical_pair in enumerate(get_canonical_pairs()):
+            low_name, high_name, suit_status = canonical_pair.split("_")
+            pair = (
+                Index.indices.index(low_name),
+                Index.indices.index(high_name),
+                suit_status == "Suited",
+            )
+            self.assertEqual(unrank_canonical_pair(dense_rank), pair)
+            self.assertEqual(rank_canonical_pair(*pair), dense_rank)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -9,6 +9,12 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch
 
+from artifact_pipeline import analyze_opponent_hand_points
+from artifact_pipeline.adapter import (
+    calc_cache_maxsize,
+    configure_calc_cache_maxsizes,
+    get_cache_usages,
+)
 from artifact_pipeline.analytical_solver import (
     get_card_removal_weight,
     get_hand_combinations_with_weights,
@@ -130,6 +136,24 @@ class TestOpponentHandPointAnalysis(unittest.TestCase):
                 incomplete,
             )
 
+    def test_resized_score_cache_reaches_importing_module(self):
+        original_maxsize = calc_cache_maxsize("score_combination_suit_free")
+        configure_calc_cache_maxsizes({"score_combination_suit_free": 10})
+        try:
+            imported_score = analyze_opponent_hand_points.score_combination_suit_free
+            self.assertIs(imported_score, score_combination_suit_free)
+            self.assertEqual(imported_score.cache_parameters()["maxsize"], 10)
+            for starter_index in range(13):
+                imported_score((0, 1, 2, 3), starter_index)
+            self.assertEqual(get_cache_usages()["score_combination_suit_free"].size, 10)
+        finally:
+            configure_calc_cache_maxsizes(
+                {"score_combination_suit_free": original_maxsize}
+            )
+        self.assertEqual(
+            score_combination_suit_free.cache_parameters()["maxsize"], original_maxsize
+        )
+
     def test_exact_table_keys_and_limit(self):
         with patch(
             "artifact_pipeline.analyze_opponent_hand_points.build_policy_subset_aggregates",
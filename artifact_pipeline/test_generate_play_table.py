@@ -143,27 +143,19 @@ class TestGeneratePlayTable(unittest.TestCase):
 
     def test_opponent_deal_excludes_sampled_target_discards(self):
         class ScriptedRandom:  # pylint: disable=too-few-public-methods
-            def __init__(self):
-                self.populations = []
+            def __init__(self, card_ids):
+                self.card_ids = list(card_ids)
 
-            def sample(self, population, count):
-                self.populations.append(tuple(population))
-                if count == 2:
-                    return [(4, 0), (5, 0)]
-                return list(population[:count])
+            def getrandbits(self, _bit_count):
+                return self.card_ids.pop(0)
 
-        rng = ScriptedRandom()
-        sample_opponent_keep((0, 1, 2, 3), DEALER, self.discard_policy, rng)
-        opponent_population = rng.populations[1]
-        for removed_card in (
-            (0, 0),
-            (1, 0),
-            (2, 0),
-            (3, 0),
-            (4, 0),
-            (5, 0),
-        ):
-            self.assertNotIn(removed_card, opponent_population)
+        # Target discards are the card IDs of (4, 0) and (5, 0); every removed
+        # card redrawn for the opponent must be rejected before IDs 13 on.
+        rng = ScriptedRandom([4, 5, 0, 1, 2, 3, 4, 5, 13, 26, 39, 6, 7, 8])
+        opponent = sample_opponent_keep((0, 1, 2, 3), DEALER, self.discard_policy, rng)
+        self.assertEqual(rng.card_ids, [])
+        self.assertEqual(len(opponent), 4)
+        self.assertTrue(set(opponent) <= {0, 6, 7, 8})
 
     def test_generate_full_and_client_table(self):
         table = generate_play_table(
@@ -92,6 +92,8 @@ from artifact_pipeline.analytical_solver import (
     _build_crib_score_matrices,
     _get_policy_subset_total_weight,
     _get_policy_subset_candidate_totals,
+    _clear_policy_score_caches,
+    _policy_score_cache_usage,
     get_analytical_pairs,
     get_card_removal_weight,
     GENERATION_METHOD as ANALYTICAL_GENERATION_METHOD,
@@ -2250,14 +2252,57 @@ class TestGenerateTable(unittest.TestCase):  # pylint: disable=too-many-public-m
         self.assertEqual(
             _get_policy_subset_total_weight(policy_subset_aggregates, ()), 8192
         )
+        usage_before = _policy_score_cache_usage()
         first_totals = _get_policy_subset_candidate_totals(
             policy_subset_aggregates, (), 0, crib_score_matrices
         )
         second_totals = _get_policy_subset_candidate_totals(
             policy_subset_aggregates, (), 0, crib_score_matrices
         )
+        usage_after = _policy_score_cache_usage()
 
         self.assertIs(first_totals, second_totals)
+        self.assertEqual(usage_after.hits - usage_before.hits, 1)
+        self.assertEqual(usage_after.misses - usage_before.misses, 1)
+        self.assertEqual(usage_after.size - usage_before.size, 1)
+        self.assertGreater(usage_after.approximate_bytes, 0)
+
+    def test_analytical_policy_score_cache_is_bounded_and_clearable(self):
+        analytical_pairs = [(0, 0), (0, 1)]
+        crib_scores = {
+            (dealer_idx, pone_idx): {rank: 1.0 for rank in range(13)}
+            for dealer_idx in range(2)
+            for pone_idx in range(2)
+        }
+        selected_discards = [((0, 1, 2, 3, 4, 5), 0, 0)]
+        hand_rank_counts = [((0, 1), (1, 1), (2, 1), (3, 1), (4, 1), (5, 1))]
+        crib_score_matrices = _build_crib_score_matrices(
+            crib_scores, len(analytical_pairs)
+        )
+        with patch(
+            "artifact_pipeline.analytical_solver.calc_cache_maxsize", return_value=1
+        ):
+            policy_subset_aggregates = _build_policy_subset_aggregates(
+                selected_discards, hand_rank_counts
+            )
+        score_cache = policy_subset_aggregates[("__policy_score_cache__",)]
+
+        first_totals = _get_policy_subset_candidate_totals(
+            policy_subset_aggregates, (), 0, crib_score_matrices
+        )
+        self.assertIs(
+            _get_policy_subset_candidate_totals(
+                policy_subset_aggregates, (), 0, crib_score_matrices
+            ),
+            first_totals,
+        )
+        _get_policy_subset_candidate_totals(
+            policy_subset_aggregates, (), 1, crib_score_matrices
+        )
+        self.assertEqual(list(score_cache), [((), 1)])
+
+        _clear_policy_score_caches()
+        self.assertEqual(len(score_cache), 0)
 
     def test_analytical_ibr_full_hand_refinement_with_tiny_fixture(self):
         aggregate_build_count = [0]
@@ -2457,18 +2502,44 @@ class TestGenerateTable(unittest.TestCase):  # pylint: disable=too-many-public-m
                     "2",
                     "--output",
                     output_path,
+                    "--show-calc-cache-usage-stats",
+                    "--calc-cache-usage-stats-directory",
+                    temp_dir,
+                    "--calc-cache-maxsizes",
+                    "policy_score_cache=1000",
+                    "--calc-cache-memory-ceiling",
+                    "1G",
                 ],
-            ), patch("sys.stdout", new_callable=io.StringIO), patch(
+            ), patch("sys.stdout", new_callable=io.StringIO) as stdout, patch(
                 "artifact_pipeline.analytical_solver.run_analytical_ibr",
                 return_value=solver_result,
-            ) as run_ibr_custom:
+            ) as run_ibr_custom, patch(
+                "artifact_pipeline.analytical_solver.configure_calc_cache_maxsizes"
+            ) as configure_maxsizes, patch(
+                "artifact_pipeline.analytical_solver.configure_calc_cache_memory_ceiling"
+            ) as configure_memory_ceiling:
                 analytical_main()
+            configure_maxsizes.assert_called_once_with({"policy_score_cache": 1000})
+            configure_memory_ceiling.assert_called_once_with(1024**3)
+            self.assertIn("score_combination_suit_free: hits=", stdout.getvalue())
+            self.assertTrue(
+                os.path.exists(
+                    os.path.join(temp_dir, f"calc_cache_usage_stats.{os.getpid()}.json")
+                )
+            )
             run_ibr_custom.assert_called_once_with(
                 true_nobs=True,
                 max_iterations=5,
                 convergence_threshold=0.001,
                 full_hand_policy_max_iterations=2,
             )
+            with patch(
+                "sys.argv",
+                ["analytical_solver.py", "--calc-cache-maxsizes", "policy_score_cache"],
+            ), patch("sys.stderr", new_callable=io.StringIO), self.assertRaises(
+                SystemExit
+            ):
+                analytical_main()
 
             with self.assertRaises(ValueError):
                 validate_resume_metadata(metadata, None, output_path)
@@ -0,0 +1,34 @@
+import argparse
+from pathlib import Path
+import sys
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from simulate_cribbage_games import (  # noqa: E402
+    DEFAULT_SCORING_TABLES_PATH,
+    prebuilt_scoring_tables,
+    write_scoring_tables,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Write the prebuilt scoring tables that simulate_cribbage_games.py"
+        " and the artifact pipeline map read-only at import."
+    )
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_SCORING_TABLES_PATH,
+        help=f"scoring tables path (default: {DEFAULT_SCORING_TABLES_PATH})",
+    )
+    args = parser.parse_args()
+    scoring_tables = prebuilt_scoring_tables()
+    write_scoring_tables(args.output, scoring_tables)
+    print(f"Wrote {len(scoring_tables)} scoring tables to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import argparse
+from pathlib import Path
+import sys
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from simulate_cribbage_games import (  # noqa: E402
+    get_configuration_fingerprint,
+    merge_statistics_snapshots,
+    parse_cards,
+    report_players_statistics,
+    write_statistics_snapshot,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Merge the --statistics-snapshot files of independent"
+        " simulate_cribbage_games.py runs of one configuration and report their"
+        " pooled statistics."
+    )
+    parser.add_argument("snapshots", nargs="+", help="statistics snapshot paths")
+    parser.add_argument(
+        "--output",
+        help="merged statistics snapshot path, for merging again later",
+    )
+    parser.add_argument(
+        "--confidence-level",
+        help="statistical confidence level percentage of outputted confidence"
+        " intervals",
+        type=float,
+        default=95,
+    )
+    args = parser.parse_args()
+    try:
+        configuration, players_statistics = merge_statistics_snapshots(args.snapshots)
+    except (OSError, ValueError, KeyError) as error:
+        parser.error(str(error))
+    report_players_statistics(
+        players_statistics,
+        players_statistics.game_count(),
+        parse_cards(",".join(configuration["first_pone_dealt_cards"])),
+        parse_cards(",".join(configuration["first_dealer_dealt_cards"])),
+        parse_cards(",".join(configuration["first_pone_kept_cards"])),
+        parse_cards(",".join(configuration["first_dealer_kept_cards"])),
+        set(),
+        set(),
+        True,
+        args.confidence_level,
+        None,
+    )
+    if args.output:
+        write_statistics_snapshot(args.output, configuration, players_statistics)
+    print(
+        f"Merged {players_statistics.game_count()} games from"
+        f" {len(args.snapshots)} snapshots of configuration"
+        f" {get_configuration_fingerprint(configuration)}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
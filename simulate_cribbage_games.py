@@ -6,17 +6,32 @@ from __future__ import annotations
 import sys
 import random
 import time
-from multiprocessing import Process, Manager, Lock
-from multiprocessing.managers import DictProxy
+from multiprocessing import Process, Pool, Queue as MultiprocessingQueue
+from multiprocessing.pool import Pool as ProcessPool
+from multiprocessing.queues import Queue
+from queue import Empty
 import math
 import argparse
+from array import array
+import glob
+import hashlib
+import inspect
+import json
+import mmap
 import os
+import pickle
+import struct
 from statistics import NormalDist
 import itertools
-from functools import cache
+import operator
+from functools import lru_cache
 from collections import Counter
 from typing import (
+    Any,
     Callable,
+    Iterable,
+    Iterator,
+    Mapping,
     Optional,
     Sequence,
     NewType,
@@ -27,10 +42,10 @@ from typing import (
     NamedTuple,
     Union,
     Set,
+    get_args,
 )
 from enum import Enum
 import shelve
-from runstats import Statistics  # type: ignore
 from diskcache import Cache  # type: ignore
 
 
@@ -61,14 +76,36 @@ DECK_INDEX_COUNT: int = len(Index.indices)
 class Card:
     """A French playing card"""
 
+    # Cards are interned flyweights: constructing, unpickling or copying a card
+    # always yields the one shared instance per index and suit, so equality is
+    # identity and the hash is computed once.  The hash stays that of the
+    # (index, suit) tuple to keep set iteration, and so seeded dealing, unchanged.
+    __slots__ = ("index", "suit", "count", "string", "hash")
+
     suits = "♣♦♥♠"
     english_suits = "CDHS"
-
-    def __init__(self, index, suit):
-        self.index = index
-        self.suit = suit
-        self.count = index_count(index)
-        self.str = f"{Index.indices[index]}{Card.suits[suit]}"
+    interned: Dict[Tuple[int, int], Card] = {}
+
+    index: int
+    suit: int
+    count: int
+    string: str
+    hash: int
+
+    def __new__(cls, index, suit):
+        card = cls.interned.get((index, suit))
+        if card is None:
+            card = super().__new__(cls)
+            card.index = index
+            card.suit = suit
+            card.count = index_count(index)
+            card.string = f"{Index.indices[index]}{Card.suits[suit]}"
+            card.hash = hash((index, suit))
+            cls.interned[(index, suit)] = card
+        return card
+
+    def __reduce__(self):
+        return Card, (self.index, self.suit)
 
     @classmethod
     def from_string(cls, specifier: str) -> Card:
@@ -85,19 +122,16 @@ class Card:
 
         return Card(indices_index, suits_index)
 
-    def __eq__(self, value):
-        return self.index == value.index and self.suit == value.suit
-
     def __lt__(self, other):
         return self.index < other.index or (
             self.index == other.index and self.suit < other.suit
         )
 
     def __hash__(self):
-        return hash((self.index, self.suit))
+        return self.hash
 
     def __str__(self):
-        return self.str
+        return self.string
 
     def __repr__(self):
         return f"Card({self.index}, {self.suit})"
@@ -181,10 +215,213 @@ PlayCount = NewType("PlayCount", int)
 FIFTEEN_COUNT: PlayCount = PlayCount(15)
 
 
+class CacheUsage(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    approximate_bytes: int
+
+
+# Every memoization cache registers a CacheUsage getter here by name so that
+# --show-calc-cache-usage-stats and --calc-cache-usage-stats-directory can
+# report on all of them, including artifact_pipeline caches registered through
+# the adapter.
+CACHE_USAGE_GETTERS: Dict[str, Callable[[], CacheUsage]] = {}
+
+
+def register_cache_usage(name: str, cache_usage_getter: Callable[[], CacheUsage]):
+    CACHE_USAGE_GETTERS[name] = cache_usage_getter
+
+
+# functools caches do not expose their entries, so approximate each one as a
+# dict slot plus a small tuple key and a float result.
+APPROXIMATE_FUNCTOOLS_CACHE_ENTRY_BYTES: int = (
+    3 * 8 + sys.getsizeof((0, 0, 0, 0, 0)) + sys.getsizeof(0.0)
+)
+
+
+def functools_cache_usage(cached_function) -> CacheUsage:
+    cache_info = cached_function.cache_info()
+    return CacheUsage(
+        cache_info.hits,
+        cache_info.misses,
+        cache_info.currsize,
+        cache_info.currsize * APPROXIMATE_FUNCTOOLS_CACHE_ENTRY_BYTES,
+    )
+
+
+def get_cache_usages() -> Dict[str, CacheUsage]:
+    return {
+        name: cache_usage_getter()
+        for name, cache_usage_getter in CACHE_USAGE_GETTERS.items()
+    }
+
+
+def print_cache_usages():
+    for name, cache_usage in get_cache_usages().items():
+        print(
+            f"{name}: hits={cache_usage.hits}, misses={cache_usage.misses},"
+            f" size={cache_usage.size},"
+            f" approximate bytes={cache_usage.approximate_bytes}"
+        )
+
+
+def dump_cache_usages(directory: str) -> str:
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"calc_cache_usage_stats.{os.getpid()}.json")
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as cache_usages_file:
+        json.dump(
+            {
+                "pid": os.getpid(),
+                "caches": {
+                    name: cache_usage._asdict()
+                    for name, cache_usage in get_cache_usages().items()
+                },
+            },
+            cache_usages_file,
+            indent=2,
+        )
+    os.replace(temporary_path, path)
+    return path
+
+
+# Cache maximum sizes are given as comma separated name=size pairs, where size is
+# a positive entry count or none for unbounded and the name * sets the size of
+# every cache not otherwise named, e.g. "*=100000,pairs_points=none".
+CALC_CACHE_MAXSIZES_ENVIRONMENT_VARIABLE = "CALC_CACHE_MAXSIZES"
+CALC_CACHE_MEMORY_CEILING_ENVIRONMENT_VARIABLE = "CALC_CACHE_MEMORY_CEILING"
+DEFAULT_CALC_CACHE_MAXSIZE_NAME = "*"
+MEMORY_SIZE_SUFFIX_BYTES: Dict[str, int] = {"K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def parse_calc_cache_maxsizes(calc_cache_maxsizes: str) -> Dict[str, Optional[int]]:
+    parsed_calc_cache_maxsizes: Dict[str, Optional[int]] = {}
+    for name_and_maxsize in calc_cache_maxsizes.split(","):
+        if not name_and_maxsize.strip():
+            continue
+        name, separator, maxsize = name_and_maxsize.partition("=")
+        if not separator or not name.strip():
+            raise ValueError(
+                f"Cache maximum size {name_and_maxsize!r} is not of the form name=size"
+            )
+        if maxsize.strip().lower() == "none":
+            parsed_calc_cache_maxsizes[name.strip()] = None
+        elif not maxsize.strip().isdigit() or int(maxsize) < 1:
+            raise ValueError(
+                f"Cache maximum size {maxsize.strip()!r} of {name.strip()} is not a"
+                " positive integer or none"
+            )
+        else:
+            parsed_calc_cache_maxsizes[name.strip()] = int(maxsize)
+    return parsed_calc_cache_maxsizes
+
+
+def parse_memory_size(memory_size: str) -> Optional[int]:
+    stripped_memory_size = memory_size.strip().upper()
+    if not stripped_memory_size:
+        return None
+    suffix_bytes = MEMORY_SIZE_SUFFIX_BYTES.get(stripped_memory_size[-1], 1)
+    digits = (
+        stripped_memory_size[:-1]
+        if stripped_memory_size[-1] in MEMORY_SIZE_SUFFIX_BYTES
+        else stripped_memory_size
+    )
+    if not digits.isdigit():
+        raise ValueError(
+            f"Memory size {memory_size!r} is not a byte count with optional K, M or G"
+            " suffix"
+        )
+    return int(digits) * suffix_bytes
+
+
+CALC_CACHE_MAXSIZES: Dict[str, Optional[int]] = parse_calc_cache_maxsizes(
+    os.environ.get(CALC_CACHE_MAXSIZES_ENVIRONMENT_VARIABLE, "")
+)
+CALC_CACHE_MEMORY_CEILING_BYTES: Optional[int] = parse_memory_size(
+    os.environ.get(CALC_CACHE_MEMORY_CEILING_ENVIRONMENT_VARIABLE, "")
+)
+
+
+def calc_cache_maxsize(name: str) -> Optional[int]:
+    return CALC_CACHE_MAXSIZES.get(
+        name, CALC_CACHE_MAXSIZES.get(DEFAULT_CALC_CACHE_MAXSIZE_NAME)
+    )
+
+
+UNCACHED_FUNCTIONS: Dict[str, Callable] = {}
+CACHED_FUNCTIONS: Dict[str, Any] = {}
+CACHE_CLEARERS: Dict[str, Callable[[], None]] = {}
+
+
+def register_cache_clearer(name: str, cache_clearer: Callable[[], None]):
+    CACHE_CLEARERS[name] = cache_clearer
+
+
+def registered_cache(function):
+    name = function.__name__
+    UNCACHED_FUNCTIONS[name] = function
+    CACHED_FUNCTIONS[name] = lru_cache(maxsize=calc_cache_maxsize(name))(function)
+    register_cache_usage(name, lambda: functools_cache_usage(CACHED_FUNCTIONS[name]))
+    register_cache_clearer(name, lambda: CACHED_FUNCTIONS[name].cache_clear())
+    return CACHED_FUNCTIONS[name]
+
+
+def configure_calc_cache_maxsizes(calc_cache_maxsizes: Dict[str, Optional[int]]):
+    unknown_cache_names = set(calc_cache_maxsizes).difference(
+        CACHE_USAGE_GETTERS, [DEFAULT_CALC_CACHE_MAXSIZE_NAME]
+    )
+    if unknown_cache_names:
+        raise ValueError(
+            f"Unknown calculation cache names {sorted(unknown_cache_names)}; known"
+            f" names are {sorted(CACHE_USAGE_GETTERS)}"
+        )
+    CALC_CACHE_MAXSIZES.update(calc_cache_maxsizes)
+    # Callers look each cached function up by global name, so rebind every module
+    # global bound to a resized cache, including those of modules which imported
+    # it by name, to the newly sized cache rather than calling through a wrapper.
+    for name, function in UNCACHED_FUNCTIONS.items():
+        maxsize = calc_cache_maxsize(name)
+        cached_function = CACHED_FUNCTIONS[name]
+        if cached_function.cache_parameters()["maxsize"] == maxsize:
+            continue
+        CACHED_FUNCTIONS[name] = lru_cache(maxsize=maxsize)(function)
+        for module in list(sys.modules.values()):
+            if module is not None and vars(module).get(name) is cached_function:
+                setattr(module, name, CACHED_FUNCTIONS[name])
+
+
+def configure_calc_cache_memory_ceiling(calc_cache_memory_ceiling_bytes: Optional[int]):
+    global CALC_CACHE_MEMORY_CEILING_BYTES
+
+    CALC_CACHE_MEMORY_CEILING_BYTES = calc_cache_memory_ceiling_bytes
+
+
+def enforce_calc_cache_memory_ceiling() -> List[str]:
+    if CALC_CACHE_MEMORY_CEILING_BYTES is None:
+        return []
+    cache_usages = {name: CACHE_USAGE_GETTERS[name]() for name in CACHE_CLEARERS}
+    approximate_bytes = sum(
+        cache_usage.approximate_bytes for cache_usage in cache_usages.values()
+    )
+    cleared_cache_names = []
+    for name in sorted(
+        cache_usages,
+        key=lambda name: cache_usages[name].approximate_bytes,
+        reverse=True,
+    ):
+        if approximate_bytes <= CALC_CACHE_MEMORY_CEILING_BYTES:
+            break
+        CACHE_CLEARERS[name]()
+        approximate_bytes -= cache_usages[name].approximate_bytes
+        cleared_cache_names.append(name)
+    return cleared_cache_names
+
+
 KEPT_CARDS_LEN = 4
 
 
-@cache
+@registered_cache
 def cached_fifteens_points(sorted_hand_plus_starter_counts):
     return FIFTEENS_POINTS * sum(
         map(
@@ -204,7 +441,7 @@ def fifteens_points(hand_plus_starter_cards):
     return cached_fifteens_points(sorted_hand_plus_starter_counts)
 
 
-@cache
+@registered_cache
 def pairs_points(sorted_hand_plus_starter_indices):
     return PAIR_POINTS * sum(
         map(
@@ -229,7 +466,7 @@ def runs_points_of_length(sorted_hand_plus_starter_indices, run_length):
     )
 
 
-@cache
+@registered_cache
 def runs_points(sorted_hand_plus_starter_indices):
     five_run_points = runs_points_of_length(sorted_hand_plus_starter_indices, 5)
     if five_run_points:
@@ -274,17 +511,377 @@ def nobs_points(kept_hand, starter):
     return 0
 
 
-@cache
-def cached_pairs_runs_and_fifteens_points(sorted_kept_indices):
+def index_counts_fifteens_points(sorted_kept_indices):
+    return cached_fifteens_points(
+        tuple(index_count(index) for index in sorted_kept_indices)
+    )
+
+
+def uncached_pairs_runs_and_fifteens_points(sorted_kept_indices):
     return (
         pairs_points(sorted_kept_indices)
         + runs_points(sorted_kept_indices)
-        + cached_fifteens_points(
-            tuple(index_count(index) for index in sorted_kept_indices)
+        + index_counts_fifteens_points(sorted_kept_indices)
+    )
+
+
+HAND_PLUS_STARTER_LEN = KEPT_CARDS_LEN + 1
+MIN_PLAY_RUN_LENGTH = 3
+# Ace through eight already counts 36, so no run of more than seven cards fits
+# under a play count of 31.
+MAX_PLAY_RUN_LENGTH = 7
+
+# INDEX_MULTISET_RANK_TERMS[position][index] is the combinatorial number system
+# term C(index + position, position + 1) of a sorted index multiset, so summing
+# the terms of any sorted n-index tuple gives its dense rank in
+# range(C(DECK_INDEX_COUNT + n - 1, n)).
+INDEX_MULTISET_RANK_TERMS = [
+    [math.comb(index + position, position + 1) for index in range(DECK_INDEX_COUNT)]
+    for position in range(max(HAND_PLUS_STARTER_LEN, MAX_PLAY_RUN_LENGTH))
+]
+
+
+def index_multiset_count(length):
+    return math.comb(DECK_INDEX_COUNT + length - 1, length)
+
+
+def index_multiset_rank(sorted_indices):
+    return sum(
+        INDEX_MULTISET_RANK_TERMS[position][index]
+        for position, index in enumerate(sorted_indices)
+    )
+
+
+(
+    FIRST_INDEX_RANK_TERMS,
+    SECOND_INDEX_RANK_TERMS,
+    THIRD_INDEX_RANK_TERMS,
+    FOURTH_INDEX_RANK_TERMS,
+    FIFTH_INDEX_RANK_TERMS,
+) = INDEX_MULTISET_RANK_TERMS[:HAND_PLUS_STARTER_LEN]
+
+
+def hand_plus_starter_index_multiset_rank(sorted_hand_plus_starter_indices):
+    first, second, third, fourth, fifth = sorted_hand_plus_starter_indices
+    return (
+        FIRST_INDEX_RANK_TERMS[first]
+        + SECOND_INDEX_RANK_TERMS[second]
+        + THIRD_INDEX_RANK_TERMS[third]
+        + FOURTH_INDEX_RANK_TERMS[fourth]
+        + FIFTH_INDEX_RANK_TERMS[fifth]
+    )
+
+
+def build_index_multiset_points_table(length, points_function):
+    table = [0] * index_multiset_count(length)
+    for sorted_indices in itertools.combinations_with_replacement(
+        range(DECK_INDEX_COUNT), length
+    ):
+        table[index_multiset_rank(sorted_indices)] = points_function(sorted_indices)
+    return table
+
+
+def build_hand_plus_starter_pairs_runs_and_fifteens_points_table() -> List[int]:
+    return [
+        fifteens + pairs + runs
+        for fifteens, pairs, runs in zip(
+            HAND_PLUS_STARTER_FIFTEENS_POINTS,
+            HAND_PLUS_STARTER_PAIRS_POINTS,
+            HAND_PLUS_STARTER_RUNS_POINTS,
+        )
+    ]
+
+
+def index_multiset_is_run(sorted_indices) -> int:
+    return int(
+        all(
+            next_index - index == 1
+            for index, next_index in zip(sorted_indices, sorted_indices[1:])
+        )
+    )
+
+
+def build_kept_indices_points_by_starter_index_table() -> List[List[int]]:
+    table: List[List[int]] = [[] for _ in range(index_multiset_count(KEPT_CARDS_LEN))]
+    for sorted_kept_indices in itertools.combinations_with_replacement(
+        range(DECK_INDEX_COUNT), KEPT_CARDS_LEN
+    ):
+        table[index_multiset_rank(sorted_kept_indices)] = [
+            HAND_PLUS_STARTER_PAIRS_RUNS_AND_FIFTEENS_POINTS[
+                hand_plus_starter_index_multiset_rank(
+                    sorted([*sorted_kept_indices, starter_index])
+                )
+            ]
+            for starter_index in range(DECK_INDEX_COUNT)
+        ]
+    return table
+
+
+# Prebuilt scoring tables are stored as one byte per entry in a versioned file
+# which every process maps read-only at import, so that startup skips building
+# them and workers share one physical copy.  The file starts with
+# SCORING_TABLES_MAGIC, the format version, the table count and
+# SCORING_TABLES_DIGEST, followed by a name, byte offset and byte length entry
+# per table.  A missing, malformed or stale file, i.e. one written by other
+# scoring rules or table builders, falls back to building the tables in memory.
+SCORING_TABLES_MAGIC = b"CRIBTBLS"
+SCORING_TABLES_FORMAT_VERSION = 2
+SCORING_TABLES_HEADER = struct.Struct("<8sII32s")
+SCORING_TABLES_ENTRY = struct.Struct("<64sQQ")
+SCORING_TABLES_PATH_ENVIRONMENT_VARIABLE = "SCORING_TABLES_PATH"
+DEFAULT_SCORING_TABLES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    f"scoring_tables.v{SCORING_TABLES_FORMAT_VERSION}.bin",
+)
+
+
+# Every function whose source determines a prebuilt scoring table entry.
+SCORING_TABLES_BUILDERS: Tuple[Callable, ...] = (
+    index_count,
+    cached_fifteens_points,
+    pairs_points,
+    runs_points_of_length,
+    runs_points,
+    index_counts_fifteens_points,
+    index_multiset_count,
+    index_multiset_rank,
+    hand_plus_starter_index_multiset_rank,
+    build_index_multiset_points_table,
+    build_hand_plus_starter_pairs_runs_and_fifteens_points_table,
+    index_multiset_is_run,
+    build_kept_indices_points_by_starter_index_table,
+)
+
+
+def scoring_tables_digest() -> bytes:
+    digest = hashlib.sha256()
+    for builder in SCORING_TABLES_BUILDERS:
+        digest.update(inspect.getsource(builder).encode("utf-8"))
+    digest.update(
+        repr(
+            (
+                Index.indices,
+                MAX_CARD_COUNTING_VALUE,
+                FIFTEEN_COUNT,
+                FIFTEENS_POINTS,
+                PAIR_POINTS,
+                KEPT_CARDS_LEN,
+                MIN_PLAY_RUN_LENGTH,
+                MAX_PLAY_RUN_LENGTH,
+            )
+        ).encode("utf-8")
+    )
+    return digest.digest()
+
+
+SCORING_TABLES_DIGEST: bytes = scoring_tables_digest()
+
+
+def load_scoring_tables(path: str) -> Optional[Dict[str, memoryview]]:
+    try:
+        with open(path, "rb") as scoring_tables_file:
+            mapping = mmap.mmap(
+                scoring_tables_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+    except (OSError, ValueError):
+        return None
+    try:
+        magic, format_version, table_count, digest = SCORING_TABLES_HEADER.unpack_from(
+            mapping
+        )
+        if (
+            magic != SCORING_TABLES_MAGIC
+            or format_version != SCORING_TABLES_FORMAT_VERSION
+            or digest != SCORING_TABLES_DIGEST
+        ):
+            return None
+        scoring_tables = {}
+        for table_number in range(table_count):
+            name, offset, length = SCORING_TABLES_ENTRY.unpack_from(
+                mapping,
+                SCORING_TABLES_HEADER.size + table_number * SCORING_TABLES_ENTRY.size,
+            )
+            if offset + length > len(mapping):
+                return None
+            scoring_tables[name.rstrip(b"\0").decode("ascii")] = memoryview(mapping)[
+                offset : offset + length
+            ]
+        return scoring_tables
+    except (struct.error, UnicodeDecodeError):
+        return None
+
+
+def write_scoring_tables(path: str, scoring_tables: Dict[str, Sequence[int]]):
+    data_offset = (
+        SCORING_TABLES_HEADER.size + len(scoring_tables) * SCORING_TABLES_ENTRY.size
+    )
+    header = bytearray(
+        SCORING_TABLES_HEADER.pack(
+            SCORING_TABLES_MAGIC,
+            SCORING_TABLES_FORMAT_VERSION,
+            len(scoring_tables),
+            SCORING_TABLES_DIGEST,
+        )
+    )
+    data = bytearray()
+    for name, table in scoring_tables.items():
+        header += SCORING_TABLES_ENTRY.pack(
+            name.encode("ascii"), data_offset + len(data), len(table)
+        )
+        data += bytes(table)
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as scoring_tables_file:
+        scoring_tables_file.write(header + data)
+    os.replace(temporary_path, path)
+
+
+MAPPED_SCORING_TABLES: Dict[str, memoryview] = (
+    load_scoring_tables(
+        os.environ.get(
+            SCORING_TABLES_PATH_ENVIRONMENT_VARIABLE, DEFAULT_SCORING_TABLES_PATH
+        )
+    )
+    or {}
+)
+
+
+def mapped_or_built_scoring_table(
+    name: str, length: int, build_table: Callable[[], Sequence[int]]
+) -> Sequence[int]:
+    mapped_scoring_table = MAPPED_SCORING_TABLES.get(name)
+    if mapped_scoring_table is not None and len(mapped_scoring_table) == length:
+        return mapped_scoring_table
+    return build_table()
+
+
+HAND_PLUS_STARTER_FIFTEENS_POINTS = mapped_or_built_scoring_table(
+    "hand_plus_starter_fifteens_points",
+    index_multiset_count(HAND_PLUS_STARTER_LEN),
+    lambda: build_index_multiset_points_table(
+        HAND_PLUS_STARTER_LEN, index_counts_fifteens_points
+    ),
+)
+HAND_PLUS_STARTER_PAIRS_POINTS = mapped_or_built_scoring_table(
+    "hand_plus_starter_pairs_points",
+    index_multiset_count(HAND_PLUS_STARTER_LEN),
+    lambda: build_index_multiset_points_table(HAND_PLUS_STARTER_LEN, pairs_points),
+)
+HAND_PLUS_STARTER_RUNS_POINTS = mapped_or_built_scoring_table(
+    "hand_plus_starter_runs_points",
+    index_multiset_count(HAND_PLUS_STARTER_LEN),
+    lambda: build_index_multiset_points_table(HAND_PLUS_STARTER_LEN, runs_points),
+)
+HAND_PLUS_STARTER_PAIRS_RUNS_AND_FIFTEENS_POINTS = mapped_or_built_scoring_table(
+    "hand_plus_starter_pairs_runs_and_fifteens_points",
+    index_multiset_count(HAND_PLUS_STARTER_LEN),
+    build_hand_plus_starter_pairs_runs_and_fifteens_points_table,
+)
+
+
+# PLAY_RUN_INDEX_MULTISET_IS_RUN[run_length][index_multiset_rank(sorted_indices)]
+# is 1 if the run_length sorted play indices form a run, else 0.
+PLAY_RUN_INDEX_MULTISET_IS_RUN: Dict[int, Sequence[int]] = {
+    run_length: mapped_or_built_scoring_table(
+        f"play_run_index_multiset_is_run_{run_length}",
+        index_multiset_count(run_length),
+        lambda: build_index_multiset_points_table(run_length, index_multiset_is_run),
+    )
+    for run_length in range(MIN_PLAY_RUN_LENGTH, MAX_PLAY_RUN_LENGTH + 1)
+}
+
+
+# KEPT_INDICES_POINTS_BY_STARTER_INDEX[index_multiset_rank(sorted_kept_indices)]
+# holds the pairs, runs and fifteens points of each of the 1,820 kept index
+# multisets with each of the 13 starter indices.
+KEPT_INDICES_POINTS_BY_STARTER_INDEX: Sequence[Sequence[int]] = (
+    [
+        MAPPED_SCORING_TABLES["kept_indices_points_by_starter_index"][
+            kept_indices_rank
+            * DECK_INDEX_COUNT : (kept_indices_rank + 1)
+            * DECK_INDEX_COUNT
+        ]
+        for kept_indices_rank in range(index_multiset_count(KEPT_CARDS_LEN))
+    ]
+    if len(MAPPED_SCORING_TABLES.get("kept_indices_points_by_starter_index", b""))
+    == index_multiset_count(KEPT_CARDS_LEN) * DECK_INDEX_COUNT
+    else build_kept_indices_points_by_starter_index_table()
+)
+
+
+def prebuilt_scoring_tables() -> Dict[str, Sequence[int]]:
+    return {
+        "hand_plus_starter_fifteens_points": HAND_PLUS_STARTER_FIFTEENS_POINTS,
+        "hand_plus_starter_pairs_points": HAND_PLUS_STARTER_PAIRS_POINTS,
+        "hand_plus_starter_runs_points": HAND_PLUS_STARTER_RUNS_POINTS,
+        "hand_plus_starter_pairs_runs_and_fifteens_points": (
+            HAND_PLUS_STARTER_PAIRS_RUNS_AND_FIFTEENS_POINTS
+        ),
+        "kept_indices_points_by_starter_index": [
+            points
+            for points_by_starter_index in KEPT_INDICES_POINTS_BY_STARTER_INDEX
+            for points in points_by_starter_index
+        ],
+        **{
+            f"play_run_index_multiset_is_run_{run_length}": is_run_table
+            for run_length, is_run_table in PLAY_RUN_INDEX_MULTISET_IS_RUN.items()
+        },
+    }
+
+
+NO_FLUSH_SUIT = DECK_SUIT_COUNT
+
+# FLUSH_AND_NOBS_POINTS_BY_STARTER_SUIT[is_crib][flush_suit][jack_suits_mask] holds
+# the flush plus nobs points for each starter suit of a kept hand whose cards are
+# all of flush_suit (else NO_FLUSH_SUIT) and which holds jacks of the suits set
+# in jack_suits_mask.
+FLUSH_AND_NOBS_POINTS_BY_STARTER_SUIT = [
+    [
+        [
+            [
+                (
+                    0
+                    if flush_suit == NO_FLUSH_SUIT
+                    else 5 if starter_suit == flush_suit else 0 if is_crib else 4
+                )
+                + (jack_suits_mask >> starter_suit & 1)
+                for starter_suit in range(DECK_SUIT_COUNT)
+            ]
+            for jack_suits_mask in range(1 << DECK_SUIT_COUNT)
+        ]
+        for flush_suit in range(DECK_SUIT_COUNT + 1)
+    ]
+    for is_crib in (False, True)
+]
+
+
+def kept_indices_total_points_over_starter_indices(
+    sorted_kept_indices, starter_index_counts
+):
+    return sum(
+        map(
+            operator.mul,
+            KEPT_INDICES_POINTS_BY_STARTER_INDEX[
+                index_multiset_rank(sorted_kept_indices)
+            ],
+            starter_index_counts,
         )
     )
 
 
+def cached_pairs_runs_and_fifteens_points(sorted_kept_indices):
+    if len(sorted_kept_indices) == HAND_PLUS_STARTER_LEN:
+        return HAND_PLUS_STARTER_PAIRS_RUNS_AND_FIFTEENS_POINTS[
+            hand_plus_starter_index_multiset_rank(sorted_kept_indices)
+        ]
+
+    return cached_other_length_pairs_runs_and_fifteens_points(sorted_kept_indices)
+
+
+@registered_cache
+def cached_other_length_pairs_runs_and_fifteens_points(sorted_kept_indices):
+    return uncached_pairs_runs_and_fifteens_points(sorted_kept_indices)
+
+
 def pairs_runs_and_fifteens_points(kept_hand):
     return cached_pairs_runs_and_fifteens_points(
         tuple(sorted([card.index for card in kept_hand]))
@@ -292,9 +889,12 @@ def pairs_runs_and_fifteens_points(kept_hand):
 
 
 def score_hand_and_starter(kept_hand, starter, is_crib=False):
-    hand_plus_starter_cards = [*kept_hand, starter]
     return (
-        pairs_runs_and_fifteens_points(hand_plus_starter_cards)
+        HAND_PLUS_STARTER_PAIRS_RUNS_AND_FIFTEENS_POINTS[
+            hand_plus_starter_index_multiset_rank(
+                sorted([card.index for card in kept_hand] + [starter.index])
+            )
+        ]
         + flush_points(kept_hand, starter, is_crib=is_crib)
         + nobs_points(kept_hand, starter)
     )
@@ -336,16 +936,6 @@ GamePoints = NewType("GamePoints", int)
 NextAction = Tuple[Tuple[Card, ...], Optional[Card]]
 
 
-def statistics_push(
-    statistics_by_next_action: Dict[NextAction, Statistics],
-    key: NextAction,
-    value: Union[Points, Wins, GamePoints, ExpectedWins, ExpectedGamePoints, bool],
-):
-    if key not in statistics_by_next_action:
-        statistics_by_next_action[key] = Statistics()
-    statistics_by_next_action[key].push(value)
-
-
 # TODO: replace repeated constant strings with constants or Enum
 PlayersStatistic = Literal[
     "first_pone_play",
@@ -368,39 +958,168 @@ PlayersStatistic = Literal[
 ]
 
 
-def statistics_dict_add(
-    sum_stats_by_next_action_by_type: DictProxy[
-        NextAction, Dict[PlayersStatistic, Statistics]
-    ],
-    player_statistic_type: PlayersStatistic,
-    addend_stats_by_next_action: Dict[NextAction, Statistics],
-):
-    for next_action, addend_stats in addend_stats_by_next_action.items():
-        if next_action in sum_stats_by_next_action_by_type:
-            new_sum_stats_for_keep = sum_stats_by_next_action_by_type[next_action]
-        else:
-            new_sum_stats_for_keep = {
-                "first_pone_play": Statistics(),
-                "first_pone_hand": Statistics(),
-                "first_pone_crib": Statistics(),
-                "first_pone_total_points": Statistics(),
-                "first_pone_game_points": Statistics(),
-                "first_pone_wins": Statistics(),
-                "first_dealer_play": Statistics(),
-                "first_dealer_hand": Statistics(),
-                "first_dealer_crib": Statistics(),
-                "first_dealer_total_points": Statistics(),
-                "first_dealer_game_points": Statistics(),
-                "first_dealer_wins": Statistics(),
-                "first_pone_minus_first_dealer_play": Statistics(),
-                "first_pone_minus_first_dealer_hand": Statistics(),
-                "first_pone_minus_first_dealer_crib": Statistics(),
-                "first_pone_minus_first_dealer_total_points": Statistics(),
-                "first_pone_minus_first_dealer_game_points": Statistics(),
-            }
+PLAYERS_STATISTICS: Tuple[PlayersStatistic, ...] = get_args(PlayersStatistic)
+PLAYERS_STATISTIC_COUNT = len(PLAYERS_STATISTICS)
+PLAYERS_STATISTIC_INDICES: Dict[PlayersStatistic, int] = {
+    players_statistic: index
+    for index, players_statistic in enumerate(PLAYERS_STATISTICS)
+}
+NO_STATISTIC_VALUES = array("d", [0.0] * PLAYERS_STATISTIC_COUNT)
+NO_STATISTIC_EXTREMES = array("d", [math.nan] * PLAYERS_STATISTIC_COUNT)
+
+
+# One players statistic of one next action in a PlayersStatisticsStore, read
+# through the same methods as a runstats Statistics.
+class NextActionStatistic:
+    __slots__ = ("store", "next_action_id", "index")
+
+    def __init__(self, store: PlayersStatisticsStore, next_action_id: int, index: int):
+        self.store = store
+        self.next_action_id = next_action_id
+        self.index = index
+
+    def __len__(self) -> int:
+        return int(self.store.counts[self.next_action_id])
+
+    def mean(self) -> float:
+        return self.store.means[self.index]
+
+    def variance(self, ddof=1.0) -> float:
+        return self.store.m2s[self.index] / (
+            self.store.counts[self.next_action_id] - ddof
+        )
+
+    def stddev(self, ddof=1.0) -> float:
+        return self.variance(ddof) ** 0.5
+
+    def minimum(self) -> float:
+        return self.store.minimums[self.index]
+
+    def maximum(self) -> float:
+        return self.store.maximums[self.index]
+
+
+# Running count, mean, sum of squared deviations (M2), minimum and maximum of
+# every players statistic of every next action, stored struct-of-arrays style:
+# each next action is interned to a small integer id, whose game count is
+# counts[id] and whose statistics occupy positions id * PLAYERS_STATISTIC_COUNT
+# onward of the flat means, m2s, minimums and maximums arrays. A game is pushed
+# as one row of values, stores are merged with Chan et al.'s parallel update and
+# a store pickles as a handful of flat buffers. Pushes and merges follow the
+# runstats Statistics arithmetic exactly, so statistics are unchanged from it.
+class PlayersStatisticsStore(Mapping):
+    __slots__ = (
+        "next_actions",
+        "next_action_ids",
+        "counts",
+        "means",
+        "m2s",
+        "minimums",
+        "maximums",
+    )
+
+    next_actions: List[NextAction]
+    next_action_ids: Dict[NextAction, int]
+
+    def __init__(self):
+        self.next_actions = []
+        self.next_action_ids = {}
+        self.counts = array("d")
+        self.means = array("d")
+        self.m2s = array("d")
+        self.minimums = array("d")
+        self.maximums = array("d")
+
+    def next_action_id(self, next_action: NextAction) -> int:
+        next_action_id = self.next_action_ids.get(next_action)
+        if next_action_id is None:
+            next_action_id = self.next_action_ids[next_action] = len(self.next_actions)
+            self.next_actions.append(next_action)
+            self.counts.append(0.0)
+            self.means.extend(NO_STATISTIC_VALUES)
+            self.m2s.extend(NO_STATISTIC_VALUES)
+            self.minimums.extend(NO_STATISTIC_EXTREMES)
+            self.maximums.extend(NO_STATISTIC_EXTREMES)
+        return next_action_id
+
+    # Pushes one game's values, in PLAYERS_STATISTICS order, for next_action.
+    def push(self, next_action: NextAction, values: Sequence[float]):
+        next_action_id = self.next_action_id(next_action)
+        count = self.counts[next_action_id]
+        means = self.means
+        m2s = self.m2s
+        minimums = self.minimums
+        maximums = self.maximums
+        index = next_action_id * PLAYERS_STATISTIC_COUNT
+        for value in values:
+            if count:
+                minimums[index] = min(minimums[index], value)
+                maximums[index] = max(maximums[index], value)
+            else:
+                minimums[index] = maximums[index] = value
+            delta = value - means[index]
+            delta_n = delta / (count + 1)
+            means[index] += delta_n
+            m2s[index] += delta * delta_n * count
+            index += 1
+        self.counts[next_action_id] = count + 1
+
+    def merge(self, addend: PlayersStatisticsStore):
+        for addend_id, next_action in enumerate(addend.next_actions):
+            addend_count = addend.counts[addend_id]
+            next_action_id = self.next_action_id(next_action)
+            count = self.counts[next_action_id]
+            sum_count = count + addend_count
+            if not sum_count:
+                continue
+            index = next_action_id * PLAYERS_STATISTIC_COUNT
+            addend_index = addend_id * PLAYERS_STATISTIC_COUNT
+            for _ in range(PLAYERS_STATISTIC_COUNT):
+                mean = self.means[index]
+                addend_mean = addend.means[addend_index]
+                delta = addend_mean - mean
+                self.means[index] = (
+                    count * mean + addend_count * addend_mean
+                ) / sum_count
+                self.m2s[index] = (
+                    self.m2s[index]
+                    + addend.m2s[addend_index]
+                    + delta**2 * count * addend_count / sum_count
+                )
+                if not count:
+                    self.minimums[index] = addend.minimums[addend_index]
+                    self.maximums[index] = addend.maximums[addend_index]
+                elif addend_count:
+                    self.minimums[index] = min(
+                        self.minimums[index], addend.minimums[addend_index]
+                    )
+                    self.maximums[index] = max(
+                        self.maximums[index], addend.maximums[addend_index]
+                    )
+                index += 1
+                addend_index += 1
+            self.counts[next_action_id] = sum_count
+
+    def game_count(self) -> int:
+        return int(sum(self.counts))
+
+    def __getitem__(
+        self, next_action: NextAction
+    ) -> Dict[PlayersStatistic, NextActionStatistic]:
+        next_action_id = self.next_action_ids[next_action]
+        index = next_action_id * PLAYERS_STATISTIC_COUNT
+        return {
+            players_statistic: NextActionStatistic(
+                self, next_action_id, index + statistic_index
+            )
+            for statistic_index, players_statistic in enumerate(PLAYERS_STATISTICS)
+        }
+
+    def __iter__(self):
+        return iter(self.next_actions)
 
-        new_sum_stats_for_keep[player_statistic_type] += addend_stats
-        sum_stats_by_next_action_by_type[next_action] = new_sum_stats_for_keep
+    def __len__(self) -> int:
+        return len(self.next_actions)
 
 
 DECK_CARD_COUNT: int = DECK_INDEX_COUNT * DECK_SUIT_COUNT
@@ -411,21 +1130,17 @@ DECK_LIST = [
 DECK_SET = set(DECK_LIST)
 
 
-@cache
+@registered_cache
 def cached_get_current_play_run_length(current_play_play_indices_tuple):
-    for run_length in reversed(range(3, len(current_play_play_indices_tuple) + 1)):
-        sorted_recent_play_indices = sorted(
-            [index for index in current_play_play_indices_tuple[-run_length:]]
-        )
-        adjacent_index_count = 0
-        for play_index in range(run_length - 1):
-            diff_with_next = (
-                sorted_recent_play_indices[play_index + 1]
-                - sorted_recent_play_indices[play_index]
-            )
-            if diff_with_next == 1:
-                adjacent_index_count += 1
-        if adjacent_index_count == run_length - 1:
+    for run_length in reversed(
+        range(
+            MIN_PLAY_RUN_LENGTH,
+            min(len(current_play_play_indices_tuple), MAX_PLAY_RUN_LENGTH) + 1,
+        )
+    ):
+        if PLAY_RUN_INDEX_MULTISET_IS_RUN[run_length][
+            index_multiset_rank(sorted(current_play_play_indices_tuple[-run_length:]))
+        ]:
             return run_length
 
     return 0
@@ -440,74 +1155,485 @@ def get_current_play_run_length(current_play_to_31_cards: Sequence[Card]):
     )
 
 
-PlayableCardIndex = NewType("PlayableCardIndex", int)
-PlaySelector = Callable[[Sequence[Card], PlayCount, Sequence[Card]], PlayableCardIndex]
-START_OF_PLAY_COUNT: PlayCount = PlayCount(0)
+# Run length scored by playing played_card onto current_play_to_31_cards, found
+# by scanning back from the newest card: the last n cards form a run when their
+# n indices are distinct and span n consecutive values, and a repeated index
+# ends the scan since every longer tail then holds a pair.  Scanning stops after
+# MAX_PLAY_RUN_LENGTH cards, so each call is constant work however long the play.
+def get_play_run_length_with(
+    current_play_to_31_cards: Sequence[Card], played_card: Card
+) -> int:
+    lowest_index = highest_index = played_card.index
+    seen_indices_mask = 1 << lowest_index
+    run_length = 0
+    card_count = 1
+    position = len(current_play_to_31_cards)
+    while position and card_count < MAX_PLAY_RUN_LENGTH:
+        position -= 1
+        index = current_play_to_31_cards[position].index
+        index_bit = 1 << index
+        if seen_indices_mask & index_bit:
+            break
+        seen_indices_mask |= index_bit
+        card_count += 1
+        if index < lowest_index:
+            lowest_index = index
+        elif index > highest_index:
+            highest_index = index
+        if (
+            card_count >= MIN_PLAY_RUN_LENGTH
+            and highest_index - lowest_index + 1 == card_count
+        ):
+            run_length = card_count
+    return run_length
 
 
-Player = Literal[0, 1]
-MAX_SCORE: Points = Points(121)
+# Integer card IDs 0-51 are DECK_LIST positions, i.e. suit * 13 + index, so
+# scoring hot paths can work on plain ints without Card construction or hashing.
+CardId = NewType("CardId", int)
+CARD_ID_INDICES: List[int] = [card.index for card in DECK_LIST]
+CARD_ID_SUITS: List[int] = [card.suit for card in DECK_LIST]
+CARD_ID_COUNTS: List[int] = [card.count for card in DECK_LIST]
 
 
-class GameScore(NamedTuple):
-    first_pone_initial: Points
-    first_pone_play: Points
-    first_pone_hand: Points
-    first_pone_crib: Points
-    first_dealer_initial: Points
-    first_dealer_play: Points
-    first_dealer_hand: Points
-    first_dealer_crib: Points
+def index_and_suit_card_id(index: int, suit: int) -> CardId:
+    return CardId(suit * DECK_INDEX_COUNT + index)
 
-    @property
-    def pone_total(self) -> Points:
-        return Points(
-            self.first_pone_initial
-            + self.first_pone_play
-            + self.first_pone_hand
-            + self.first_pone_crib
-        )
 
-    @property
-    def dealer_total(self) -> Points:
-        return Points(
-            self.first_dealer_initial
-            + self.first_dealer_play
-            + self.first_dealer_hand
-            + self.first_dealer_crib
-        )
+def card_id(card: Card) -> CardId:
+    return index_and_suit_card_id(card.index, card.suit)
 
-    def __str__(self) -> str:
-        return f"{self.pone_total}-{self.dealer_total}"
 
-    def __repr__(self) -> str:
-        return (
-            f"GameScore({self.first_pone_initial}, {self.first_pone_play},"
-            f" {self.first_pone_hand}, {self.first_pone_crib},"
-            f" {self.first_dealer_initial}, {self.first_dealer_play},"
-            f" {self.first_dealer_hand}, {self.first_dealer_crib})"
-        )
+def card_from_id(from_card_id: CardId) -> Card:
+    return DECK_LIST[from_card_id]
 
 
-class GamePlayer(Enum):
-    FIRST_PONE = 0
-    FIRST_DEALER = 1
+# A deck or other card set as a 52-bit int whose bit n is set when the card with
+# CardId n is present, so dealing is a few int operations instead of set work.
+CardMask = NewType("CardMask", int)
+EMPTY_CARD_MASK = CardMask(0)
+FULL_DECK_CARD_MASK = CardMask((1 << DECK_CARD_COUNT) - 1)
+# Smallest bit count covering every CardId, for rejection sampling card IDs.
+CARD_ID_BIT_LENGTH: int = (DECK_CARD_COUNT - 1).bit_length()
 
 
-class PointsType(Enum):
-    PLAY = 0
-    HAND = 1
-    CRIB = 2
+def card_ids_mask(card_ids: Iterable[CardId]) -> CardMask:
+    mask = 0
+    for mask_card_id in card_ids:
+        mask |= 1 << mask_card_id
+    return CardMask(mask)
 
 
-def add_to_game_score(
-    game_score: GameScore,
-    game_player: GamePlayer,
-    points_type: PointsType,
-    points: Points,
-) -> GameScore:
-    # TODO: shorten up this code - very likely unnecessarily verbose
-    current_game_player_score = (
+def cards_mask(cards: Iterable[Card]) -> CardMask:
+    return card_ids_mask(card_id(card) for card in cards)
+
+
+def card_mask_contains(mask: CardMask, contained_card_id: CardId) -> bool:
+    return bool(mask >> contained_card_id & 1)
+
+
+def card_mask_remove(mask: CardMask, removed_card_id: CardId) -> CardMask:
+    return CardMask(mask & ~(1 << removed_card_id))
+
+
+def card_mask_difference(mask: CardMask, removed_mask: CardMask) -> CardMask:
+    return CardMask(mask & ~removed_mask)
+
+
+def card_mask_count(mask: CardMask) -> int:
+    return mask.bit_count()
+
+
+def card_mask_card_ids(mask: CardMask) -> List[CardId]:
+    card_ids: List[CardId] = []
+    while mask:
+        lowest_bit = mask & -mask
+        card_ids.append(CardId(lowest_bit.bit_length() - 1))
+        mask = CardMask(mask ^ lowest_bit)
+    return card_ids
+
+
+def sample_card_mask_card_ids(mask: CardMask, k: int, rng=random) -> List[CardId]:
+    # Uniform sample without replacement, in selection order like random.sample:
+    # draw CARD_ID_BIT_LENGTH random bits and keep the draw only if that card is
+    # still in the mask.  Decks being dealt from are at least half full so this
+    # averages under three draws per card.
+    if not 0 <= k <= card_mask_count(mask):
+        raise ValueError("Sample larger than population or is negative")
+    getrandbits = rng.getrandbits
+    sampled_card_ids: List[CardId] = []
+    while len(sampled_card_ids) < k:
+        drawn_card_id = getrandbits(CARD_ID_BIT_LENGTH)
+        if mask >> drawn_card_id & 1:
+            mask = CardMask(mask ^ (1 << drawn_card_id))
+            sampled_card_ids.append(CardId(drawn_card_id))
+    return sampled_card_ids
+
+
+# Suit isomorphism: hands that differ only by a global renaming of suits score
+# identically, so suit-aware tables can key on one canonical hand per class.
+# Each suit gets a bitmask of its indices with the lowest index in the highest
+# bit; sorting suits by descending mask and relabelling them 0-3 in that order
+# yields the lexicographically smallest (index, suit) tuple over all 24 suit
+# permutations, in one sort rather than 24.
+SuitPermutation = NewType("SuitPermutation", Tuple[int, ...])
+
+
+def suit_canonical_index_suit_pairs(
+    index_suit_pairs: Iterable[Tuple[int, int]],
+) -> Tuple[Tuple[Tuple[int, int], ...], SuitPermutation]:
+    # Returns the canonical sorted (index, suit) pairs and the inverse
+    # permutation: original suit by canonical suit.
+    index_suit_pairs = tuple(index_suit_pairs)
+    suit_index_masks = [0] * DECK_SUIT_COUNT
+    for index, suit in index_suit_pairs:
+        suit_index_masks[suit] |= 1 << (DECK_INDEX_COUNT - 1 - index)
+    suit_by_canonical_suit = SuitPermutation(
+        tuple(
+            sorted(
+                range(DECK_SUIT_COUNT), key=suit_index_masks.__getitem__, reverse=True
+            )
+        )
+    )
+    canonical_suit_by_suit = [0] * DECK_SUIT_COUNT
+    for canonical_suit, suit in enumerate(suit_by_canonical_suit):
+        canonical_suit_by_suit[suit] = canonical_suit
+    return (
+        tuple(
+            sorted(
+                (index, canonical_suit_by_suit[suit])
+                for index, suit in index_suit_pairs
+            )
+        ),
+        suit_by_canonical_suit,
+    )
+
+
+def suit_canonical_card_ids(
+    card_ids: Iterable[CardId],
+) -> Tuple[Tuple[CardId, ...], SuitPermutation]:
+    canonical_index_suit_pairs, suit_by_canonical_suit = (
+        suit_canonical_index_suit_pairs(
+            (CARD_ID_INDICES[pair_card_id], CARD_ID_SUITS[pair_card_id])
+            for pair_card_id in card_ids
+        )
+    )
+    return (
+        tuple(
+            index_and_suit_card_id(index, suit)
+            for index, suit in canonical_index_suit_pairs
+        ),
+        suit_by_canonical_suit,
+    )
+
+
+def suit_permuted_card_ids(
+    card_ids: Iterable[CardId], suit_by_suit: SuitPermutation
+) -> Tuple[CardId, ...]:
+    # Maps canonical card IDs back to the original hand given the permutation
+    # returned with them, or applies any other suit relabelling.
+    return tuple(
+        index_and_suit_card_id(
+            CARD_ID_INDICES[permuted_card_id],
+            suit_by_suit[CARD_ID_SUITS[permuted_card_id]],
+        )
+        for permuted_card_id in card_ids
+    )
+
+
+def card_ids_flush_points(
+    kept_hand_card_ids: Sequence[CardId], starter_card_id: CardId, is_crib=False
+) -> Points:
+    kept_hand_suit = CARD_ID_SUITS[kept_hand_card_ids[0]]
+    for kept_card_id in kept_hand_card_ids:
+        if CARD_ID_SUITS[kept_card_id] != kept_hand_suit:
+            return Points(0)
+
+    if CARD_ID_SUITS[starter_card_id] == kept_hand_suit:
+        return Points(5)
+
+    return Points(4 if not is_crib else 0)
+
+
+def card_ids_nobs_points(
+    kept_hand_card_ids: Sequence[CardId], starter_card_id: CardId
+) -> Points:
+    return Points(
+        int(
+            index_and_suit_card_id(JACK_INDEX, CARD_ID_SUITS[starter_card_id])
+            in kept_hand_card_ids
+        )
+    )
+
+
+def score_card_ids_hand_and_starter(
+    kept_hand_card_ids: Sequence[CardId], starter_card_id: CardId, is_crib=False
+) -> Points:
+    return Points(
+        HAND_PLUS_STARTER_PAIRS_RUNS_AND_FIFTEENS_POINTS[
+            hand_plus_starter_index_multiset_rank(
+                sorted(
+                    [
+                        CARD_ID_INDICES[kept_card_id]
+                        for kept_card_id in kept_hand_card_ids
+                    ]
+                    + [CARD_ID_INDICES[starter_card_id]]
+                )
+            )
+        ]
+        + card_ids_flush_points(kept_hand_card_ids, starter_card_id, is_crib=is_crib)
+        + card_ids_nobs_points(kept_hand_card_ids, starter_card_id)
+    )
+
+
+class HandPointsBreakdown(NamedTuple):
+    fifteens: Points
+    pairs: Points
+    runs: Points
+    flushes: Points
+    nobs: Points
+
+    @property
+    def total(self) -> Points:
+        return Points(sum(self))
+
+
+def score_card_ids_hand_and_starter_breakdown(
+    kept_hand_card_ids: Sequence[CardId], starter_card_id: CardId, is_crib=False
+) -> HandPointsBreakdown:
+    starter_suit = CARD_ID_SUITS[starter_card_id]
+    hand_plus_starter_indices = [CARD_ID_INDICES[starter_card_id]]
+    flush_suit: Optional[int] = CARD_ID_SUITS[kept_hand_card_ids[0]]
+    nobs = 0
+    for kept_card_id in kept_hand_card_ids:
+        kept_card_suit = CARD_ID_SUITS[kept_card_id]
+        hand_plus_starter_indices.append(CARD_ID_INDICES[kept_card_id])
+        if kept_card_suit != flush_suit:
+            flush_suit = None
+        if (
+            CARD_ID_INDICES[kept_card_id] == JACK_INDEX
+            and kept_card_suit == starter_suit
+        ):
+            nobs = 1
+    hand_plus_starter_indices.sort()
+    hand_plus_starter_rank = hand_plus_starter_index_multiset_rank(
+        hand_plus_starter_indices
+    )
+    return HandPointsBreakdown(
+        HAND_PLUS_STARTER_FIFTEENS_POINTS[hand_plus_starter_rank],
+        HAND_PLUS_STARTER_PAIRS_POINTS[hand_plus_starter_rank],
+        HAND_PLUS_STARTER_RUNS_POINTS[hand_plus_starter_rank],
+        Points(
+            0
+            if flush_suit is None
+            else 5 if starter_suit == flush_suit else 4 if not is_crib else 0
+        ),
+        Points(nobs),
+    )
+
+
+def kept_card_ids_flush_and_nobs_points_by_starter_suit(
+    kept_hand_card_ids: Sequence[CardId], is_crib=False
+) -> List[int]:
+    kept_hand_suits = {
+        CARD_ID_SUITS[kept_card_id] for kept_card_id in kept_hand_card_ids
+    }
+    jack_suits_mask = 0
+    for kept_card_id in kept_hand_card_ids:
+        if CARD_ID_INDICES[kept_card_id] == JACK_INDEX:
+            jack_suits_mask |= 1 << CARD_ID_SUITS[kept_card_id]
+    return FLUSH_AND_NOBS_POINTS_BY_STARTER_SUIT[is_crib][
+        kept_hand_suits.pop() if len(kept_hand_suits) == 1 else NO_FLUSH_SUIT
+    ][jack_suits_mask]
+
+
+def kept_card_ids_points_by_starter_index(
+    kept_hand_card_ids: Sequence[CardId],
+) -> Sequence[int]:
+    return KEPT_INDICES_POINTS_BY_STARTER_INDEX[
+        index_multiset_rank(
+            sorted(
+                [CARD_ID_INDICES[kept_card_id] for kept_card_id in kept_hand_card_ids]
+            )
+        )
+    ]
+
+
+def kept_card_ids_total_points_over_starters(
+    kept_hand_card_ids: Sequence[CardId],
+    starter_index_counts: Sequence[int],
+    starter_suit_counts: Sequence[int],
+    is_crib=False,
+) -> int:
+    return sum(
+        map(
+            operator.mul,
+            kept_card_ids_points_by_starter_index(kept_hand_card_ids),
+            starter_index_counts,
+        )
+    ) + sum(
+        map(
+            operator.mul,
+            kept_card_ids_flush_and_nobs_points_by_starter_suit(
+                kept_hand_card_ids, is_crib=is_crib
+            ),
+            starter_suit_counts,
+        )
+    )
+
+
+def score_card_ids_hand_over_starters(
+    kept_hand_card_ids: Sequence[CardId],
+    starter_card_ids: Sequence[CardId],
+    is_crib=False,
+    by_category=False,
+) -> Union[List[Points], List[HandPointsBreakdown]]:
+    if by_category:
+        return [
+            score_card_ids_hand_and_starter_breakdown(
+                kept_hand_card_ids, starter_card_id, is_crib=is_crib
+            )
+            for starter_card_id in starter_card_ids
+        ]
+
+    points_by_starter_index = kept_card_ids_points_by_starter_index(kept_hand_card_ids)
+    flush_and_nobs_points_by_starter_suit = (
+        kept_card_ids_flush_and_nobs_points_by_starter_suit(
+            kept_hand_card_ids, is_crib=is_crib
+        )
+    )
+    return [
+        Points(
+            points_by_starter_index[CARD_ID_INDICES[starter_card_id]]
+            + flush_and_nobs_points_by_starter_suit[CARD_ID_SUITS[starter_card_id]]
+        )
+        for starter_card_id in starter_card_ids
+    ]
+
+
+def score_card_ids_hands_and_starters(
+    kept_hands_card_ids: Sequence[Sequence[CardId]],
+    starters_card_ids: Sequence[Union[CardId, Sequence[CardId]]],
+    is_crib=False,
+    by_category=False,
+) -> list:
+    """Score N kept hands against either one starter each or K starters each
+
+    Starters given as N card IDs give N scores; starters given as N sequences of
+    K card IDs give N lists of K scores. With by_category each score is a
+    HandPointsBreakdown instead of a total.
+    """
+
+    scores: list = []
+    for kept_hand_card_ids, hand_starters_card_ids in zip(
+        kept_hands_card_ids, starters_card_ids, strict=True
+    ):
+        if isinstance(hand_starters_card_ids, int):
+            scores.append(
+                score_card_ids_hand_over_starters(
+                    kept_hand_card_ids,
+                    [CardId(hand_starters_card_ids)],
+                    is_crib=is_crib,
+                    by_category=by_category,
+                )[0]
+            )
+        else:
+            scores.append(
+                score_card_ids_hand_over_starters(
+                    kept_hand_card_ids,
+                    hand_starters_card_ids,
+                    is_crib=is_crib,
+                    by_category=by_category,
+                )
+            )
+    return scores
+
+
+def card_ids_play_count(played_card_ids: Sequence[CardId]) -> int:
+    return sum(CARD_ID_COUNTS[played_card_id] for played_card_id in played_card_ids)
+
+
+def get_card_ids_current_play_run_length(
+    current_play_to_31_card_ids: Sequence[CardId],
+):
+    return cached_get_current_play_run_length(
+        tuple(
+            [
+                CARD_ID_INDICES[played_card_id]
+                for played_card_id in current_play_to_31_card_ids
+            ]
+        )
+    )
+
+
+PlayableCardIndex = NewType("PlayableCardIndex", int)
+PlaySelector = Callable[[Sequence[Card], PlayCount, Sequence[Card]], PlayableCardIndex]
+START_OF_PLAY_COUNT: PlayCount = PlayCount(0)
+
+
+Player = Literal[0, 1]
+MAX_SCORE: Points = Points(121)
+
+
+class GameScore(NamedTuple):
+    first_pone_initial: Points
+    first_pone_play: Points
+    first_pone_hand: Points
+    first_pone_crib: Points
+    first_dealer_initial: Points
+    first_dealer_play: Points
+    first_dealer_hand: Points
+    first_dealer_crib: Points
+
+    @property
+    def pone_total(self) -> Points:
+        return Points(
+            self.first_pone_initial
+            + self.first_pone_play
+            + self.first_pone_hand
+            + self.first_pone_crib
+        )
+
+    @property
+    def dealer_total(self) -> Points:
+        return Points(
+            self.first_dealer_initial
+            + self.first_dealer_play
+            + self.first_dealer_hand
+            + self.first_dealer_crib
+        )
+
+    def __str__(self) -> str:
+        return f"{self.pone_total}-{self.dealer_total}"
+
+    def __repr__(self) -> str:
+        return (
+            f"GameScore({self.first_pone_initial}, {self.first_pone_play},"
+            f" {self.first_pone_hand}, {self.first_pone_crib},"
+            f" {self.first_dealer_initial}, {self.first_dealer_play},"
+            f" {self.first_dealer_hand}, {self.first_dealer_crib})"
+        )
+
+
+class GamePlayer(Enum):
+    FIRST_PONE = 0
+    FIRST_DEALER = 1
+
+
+class PointsType(Enum):
+    PLAY = 0
+    HAND = 1
+    CRIB = 2
+
+
+def add_to_game_score(
+    game_score: GameScore,
+    game_player: GamePlayer,
+    points_type: PointsType,
+    points: Points,
+) -> GameScore:
+    # TODO: shorten up this code - very likely unnecessarily verbose
+    current_game_player_score = (
         (
             game_score.first_pone_initial
             + game_score.first_pone_play
@@ -599,6 +1725,64 @@ def game_over(game_score: GameScore) -> bool:
     )
 
 
+# Mutable game score for the engines' scoring loops: each scoring event updates
+# one per-player, per-PointsType counter and that player's running total in
+# place and checks only that total against MAX_SCORE, rather than rebuilding
+# and re-summing a GameScore.  to_game_score() materializes a GameScore for
+# results and nested simulations; str() matches GameScore's for display.
+class GameScoreAccumulator:
+    __slots__ = ("initial_points", "points_by_type", "totals", "is_over")
+
+    initial_points: Tuple[Points, Points]
+    points_by_type: List[List[Points]]
+    totals: List[Points]
+    is_over: bool
+
+    def __init__(
+        self, initial_first_pone_score: Points, initial_first_dealer_score: Points
+    ):
+        self.initial_points = (initial_first_pone_score, initial_first_dealer_score)
+        self.points_by_type = [[Points(0)] * len(PointsType) for _ in GamePlayer]
+        self.totals = [initial_first_pone_score, initial_first_dealer_score]
+        self.is_over = max(self.totals) >= MAX_SCORE
+
+    def add(
+        self, game_player: GamePlayer, points_type: PointsType, points: Points
+    ) -> bool:
+        player = game_player.value
+        player_total = self.totals[player]
+        scorable_points = min(points, MAX_SCORE - player_total)
+        player_points_by_type = self.points_by_type[player]
+        player_points_by_type[points_type.value] = Points(
+            player_points_by_type[points_type.value] + scorable_points
+        )
+        self.totals[player] = Points(player_total + scorable_points)
+        if player_total + scorable_points >= MAX_SCORE:
+            self.is_over = True
+        return self.is_over
+
+    def to_game_score(self) -> GameScore:
+        first_pone_play, first_pone_hand, first_pone_crib = self.points_by_type[
+            GamePlayer.FIRST_PONE.value
+        ]
+        first_dealer_play, first_dealer_hand, first_dealer_crib = self.points_by_type[
+            GamePlayer.FIRST_DEALER.value
+        ]
+        return GameScore(
+            self.initial_points[0],
+            first_pone_play,
+            first_pone_hand,
+            first_pone_crib,
+            self.initial_points[1],
+            first_dealer_play,
+            first_dealer_hand,
+            first_dealer_crib,
+        )
+
+    def __str__(self) -> str:
+        return f"{self.totals[0]}-{self.totals[1]}"
+
+
 NIBS_SCORE_POINTS: Points = Points(2)
 DOUBLE_PAIRS_ROYALE_POINTS: Points = Points(12)
 PAIRS_ROYALE_POINTS: Points = Points(6)
@@ -633,6 +1817,82 @@ def get_play_to_31_cards(play_to_31: PlayTo31) -> Sequence[Card]:
     return [card for card in play_to_31 if isinstance(card, Card)]
 
 
+# Pairs points by the number of same-index cards most recently played in a row.
+PAIRED_CARD_COUNT_POINTS: Tuple[Points, ...] = (
+    Points(0),
+    Points(0),
+    PAIR_POINTS,
+    PAIRS_ROYALE_POINTS,
+    DOUBLE_PAIRS_ROYALE_POINTS,
+)
+
+
+# Pegging state of one hand, updated in constant time per play action rather
+# than rebuilt from the play history: the play count, the cards of the current
+# play to 31 (which play selectors read directly), the length of the trailing
+# pair streak and the number of consecutive Go's.
+class PeggingState:
+    __slots__ = (
+        "play_count",
+        "play_to_31_cards",
+        "paired_card_count",
+        "consecutive_go_count",
+    )
+
+    play_count: PlayCount
+    play_to_31_cards: List[Card]
+    paired_card_count: int
+    consecutive_go_count: int
+
+    def __init__(self):
+        self.consecutive_go_count = 0
+        self.start_play_to_31()
+
+    def start_play_to_31(self) -> None:
+        self.play_count = START_OF_PLAY_COUNT
+        self.play_to_31_cards = []
+        self.paired_card_count = 0
+
+    def is_playable(self, card: Card) -> bool:
+        return self.play_count + card.count <= THIRTY_ONE_COUNT
+
+    # Plays card, returning its pairs points, its 15 or 31 count points and its
+    # run points, i.e. the length of the run it completes.
+    def play_card(self, card: Card) -> Tuple[Points, Points, Points]:
+        play_to_31_cards = self.play_to_31_cards
+        if play_to_31_cards and play_to_31_cards[-1].index == card.index:
+            self.paired_card_count += 1
+        else:
+            self.paired_card_count = 1
+        run_length = get_play_run_length_with(play_to_31_cards, card)
+        play_to_31_cards.append(card)
+        self.play_count = play_count = PlayCount(self.play_count + card.count)
+        self.consecutive_go_count = 0
+        return (
+            PAIRED_CARD_COUNT_POINTS[self.paired_card_count],
+            (
+                FIFTEENS_POINTS
+                if play_count == FIFTEEN_COUNT
+                else (
+                    THIRTY_ONE_COUNT_POINTS
+                    if play_count == THIRTY_ONE_COUNT
+                    else Points(0)
+                )
+            ),
+            Points(run_length),
+        )
+
+    # Says Go, returning whether it is the second in a row, which scores the Go
+    # point and starts a new play to 31.
+    def say_go(self) -> bool:
+        self.consecutive_go_count += 1
+        if self.consecutive_go_count < 2:
+            return False
+        self.consecutive_go_count = 0
+        self.start_play_to_31()
+        return True
+
+
 class StartOfHandScore(NamedTuple):
     first_pone_points: Points
     first_dealer_points: Points
@@ -651,161 +1911,508 @@ class StartOfHandScore(NamedTuple):
         )
 
 
-def simulate_game(
-    first_pone_dealt_cards: List[Card],
-    first_dealer_dealt_cards: List[Card],
-    deck_less_fixed_cards: Sequence[Card],
-    first_pone_kept_cards: List[Card],
-    first_dealer_kept_cards: List[Card],
-    initial_starter: Optional[Card],
-    maximum_hands_per_game: int,
-    first_pone_select_kept_cards,
-    first_pone_discard_based_on_simulations: Optional[int],
-    first_pone_select_each_possible_kept_hand: bool,
-    first_dealer_select_kept_cards,
-    first_dealer_discard_based_on_simulations: Optional[int],
-    first_dealer_select_each_possible_kept_hand: bool,
-    first_pone_select_play,
-    first_pone_play_based_on_simulations: Optional[int],
-    first_dealer_select_play,
-    first_dealer_play_based_on_simulations: Optional[int],
+# A simulated player's discard and play strategy, as used by the game engines
+# for whichever of pone or dealer that player is in a given hand.
+class PlayerStrategy(NamedTuple):
+    select_kept_cards: Callable
+    discard_based_on_simulations: Optional[int]
+    select_play: Callable
+    play_based_on_simulations: Optional[int]
+    estimate_incomplete_game_wins_and_game_points: bool
+    hide_hands: bool
+
+
+# Deals a hand's pone and dealer cards from the deck less fixed cards, starting
+# each with its fixed dealt or kept cards, and returns the dealt hands and the
+# mask of the cards left to cut the starter from.
+def deal_hands(
+    deck_less_fixed_cards_mask: CardMask,
+    fixed_cards: Tuple[Set[Card], Set[Card]],
+) -> Tuple[List[List[Card]], CardMask]:
+    pone_fixed_cards, dealer_fixed_cards = fixed_cards
+    random_hand_card_ids = sample_card_mask_card_ids(
+        deck_less_fixed_cards_mask,
+        2 * DEALT_CARDS_LEN - len(pone_fixed_cards | dealer_fixed_cards),
+    )
+    random_hand_cards = [
+        card_from_id(random_hand_card_id)
+        for random_hand_card_id in random_hand_card_ids
+    ]
+    pone_random_card_count = DEALT_CARDS_LEN - len(pone_fixed_cards)
+    return (
+        [
+            [*pone_fixed_cards, *random_hand_cards[0:pone_random_card_count]],
+            [*dealer_fixed_cards, *random_hand_cards[pone_random_card_count:]],
+        ],
+        card_mask_difference(
+            deck_less_fixed_cards_mask, card_ids_mask(random_hand_card_ids)
+        ),
+    )
+
+
+# Selects the cards kept by a hand's pone or dealer: on the first hand the fixed
+# kept cards or the next possible kept hand under evaluation, else the player's
+# discard simulations or strategy, coaching a user-selected keep.  Returns None
+# when a strategy-completed first hand keep leaves out any fixed kept card.
+def select_kept_hand(
+    hand_player: Player,
+    dealt_cards: List[Card],
+    is_first_simulation_hand: bool,
+    first_hand_dealt_cards: List[Card],
+    first_hand_kept_cards: List[Card],
+    first_hand_select_each_possible_kept_hand: bool,
+    first_hand_dealt_cards_possible_keeps_cycle: Iterator[Tuple[Card, ...]],
+    dropped_keeps,
+    player_strategy: PlayerStrategy,
+    opponent_strategy: PlayerStrategy,
     coach_discard_simulated_hand_count: Optional[int],
-    coach_play_simulated_hand_count: Optional[int],
+    game_score: GameScoreAccumulator,
     tally_start_of_hand_position_results: bool,
-    estimate_first_pone_incomplete_game_wins_and_game_points: bool,
-    estimate_first_dealer_incomplete_game_wins_and_game_points: bool,
     start_of_hand_position_results_tallies: shelve.Shelf,
-    hide_first_pone_hands: bool,
-    hide_first_dealer_hands: bool,
-    first_pone_dealt_cards_possible_keeps_cycle: itertools.cycle[Tuple[Card, ...]],
-    first_dealer_dealt_cards_possible_keeps_cycle: itertools.cycle[Tuple[Card, ...]],
-    dropped_keeps,
-    initial_first_pone_score: Points,
-    initial_first_dealer_score: Points,
-    post_initial_play: Optional[Card],
-    initial_play_actions: List[PlayAction],
-    hide_play_actions: bool,
-) -> GameSimulationResult:
-    assert (
-        len(set(first_pone_dealt_cards + first_pone_kept_cards)) <= DEALT_CARDS_LEN
-    ), (
-        f"No more than {DEALT_CARDS_LEN} specified first pone dealt or kept cards"
-        f" expected but {len(set(first_pone_dealt_cards + first_pone_kept_cards))}"
-        f" ({Hand(set(first_pone_dealt_cards + first_pone_kept_cards))}) specified"
-    )
-    assert (
-        len(set(first_dealer_dealt_cards + first_dealer_kept_cards)) <= DEALT_CARDS_LEN
-    ), (
-        f"No more than {DEALT_CARDS_LEN} specified first dealer dealt or kept cards"
-        f" expected but {len(set(first_dealer_dealt_cards + first_dealer_kept_cards))}"
-        f" ({Hand(set(first_dealer_dealt_cards + first_dealer_kept_cards))}) specified"
-    )
+) -> Optional[List[Card]]:
+    if is_first_simulation_hand and first_hand_kept_cards:
+        if len(first_hand_kept_cards) == KEPT_CARDS_LEN:
+            return [card for card in dealt_cards if card in first_hand_kept_cards]
+        kept_hand = player_strategy.select_kept_cards(dealt_cards)
+        if not player_strategy.hide_hands:
+            print(
+                f"{get_player_name(hand_player):6}"
+                f" {'keeps' if hand_player == PONE else 'would keep'} {Hand(kept_hand)}"
+                f" (sorted: {Hand(sorted(kept_hand, reverse=True))})"
+            )
+        if not all(
+            first_hand_kept_card in kept_hand
+            for first_hand_kept_card in first_hand_kept_cards
+        ):
+            if not player_strategy.hide_hands:
+                print(
+                    "...but then"
+                    f" {Hand(set(first_hand_kept_cards).difference(kept_hand))}"
+                    f" would not be kept by {get_player_name(hand_player).lower()}"
+                )
+            return None
+        return kept_hand
 
-    first_kept_pone_hand: List[Card] = []
-    first_kept_dealer_hand: List[Card] = []
-    game_score: GameScore = GameScore(
-        initial_first_pone_score,
-        Points(0),
-        Points(0),
-        Points(0),
-        initial_first_dealer_score,
-        Points(0),
-        Points(0),
-        Points(0),
-    )
-    non_kept_initial_played_card_played: bool = False
-    not_all_kept_cards_in_kept_hand: bool = False
-    post_initial_play_is_illegal: bool = False
-    start_of_hand_scores: List[StartOfHandScore] = []
-    for hand in range(maximum_hands_per_game):
-        hand_pone_is_this_simulation_first_pone: bool = hand % 2 == 0
-        hand_pone_is_this_simulation_first_dealer: bool = (
-            not hand_pone_is_this_simulation_first_pone
-        )
-        hand_dealer_is_this_simulation_first_dealer: bool = (
-            hand_pone_is_this_simulation_first_pone
+    if is_first_simulation_hand and first_hand_select_each_possible_kept_hand:
+        if not first_hand_dealt_cards:
+            raise ValueError(
+                "Iterating through all possible kept hands not supported with"
+                " non-fixed deals."
+            )
+        optional_kept_hand = None
+        while not optional_kept_hand or tuple(optional_kept_hand) in dropped_keeps:
+            optional_kept_hand = list(next(first_hand_dealt_cards_possible_keeps_cycle))
+        return optional_kept_hand
+
+    if player_strategy.discard_based_on_simulations:
+        return player_select_kept_cards_based_on_simulation(
+            player_strategy.discard_based_on_simulations,
+            player_strategy.hide_hands,
+            game_score.to_game_score(),
+            dealt_cards,
+            hand_player,
+            tally_start_of_hand_position_results,
+            player_strategy.estimate_incomplete_game_wins_and_game_points,
+            opponent_strategy.estimate_incomplete_game_wins_and_game_points,
+            player_strategy.hide_hands,
+            start_of_hand_position_results_tallies,
         )
-        hand_dealer_is_this_simulation_first_pone: bool = (
-            not hand_dealer_is_this_simulation_first_dealer
+
+    kept_hand = player_strategy.select_kept_cards(dealt_cards)
+    if (
+        player_strategy.select_kept_cards  # pylint: disable=comparison-with-callable
+        != keep_user_selected
+    ):
+        return kept_hand
+
+    static_strategy_kept_cards = (
+        BEST_STATIC_SELECT_PONE_KEPT_CARDS
+        if hand_player == PONE
+        else BEST_STATIC_SELECT_DEALER_KEPT_CARDS
+    )(dealt_cards)
+    if set(kept_hand) != set(static_strategy_kept_cards):
+        print(
+            "(Static discard coach would have instead kept: "
+            f"{Hand(sorted(static_strategy_kept_cards, reverse=True))}.)"
         )
+    else:
+        print("(Static discard coach would have kept the same cards as user did.)")
 
-        start_of_hand_scores.append(
-            StartOfHandScore(
-                game_score.pone_total,
-                game_score.dealer_total,
-                hand_dealer_is_this_simulation_first_pone,
-            )
+    dynamic_strategy_kept_cards = player_select_kept_cards_based_on_simulation(
+        (
+            coach_discard_simulated_hand_count
+            if coach_discard_simulated_hand_count is not None
+            else 160
+        ),
+        player_strategy.hide_hands,
+        game_score.to_game_score(),
+        dealt_cards,
+        hand_player,
+        False,
+        player_strategy.estimate_incomplete_game_wins_and_game_points,
+        opponent_strategy.estimate_incomplete_game_wins_and_game_points,
+        player_strategy.hide_hands,
+        start_of_hand_position_results_tallies,
+    )
+
+    dynamic_and_static_discard_coaches_agree = set(static_strategy_kept_cards) == set(
+        dynamic_strategy_kept_cards
+    )
+    if set(kept_hand) != set(dynamic_strategy_kept_cards):
+        print(
+            "(Dynamic discard coach "
+            f"{'agrees' if dynamic_and_static_discard_coaches_agree else 'disagrees'}"
+            " with static discard coach and "
+            f"{'also ' if dynamic_and_static_discard_coaches_agree else ''}"
+            "would have instead kept: "
+            f"{Hand(sorted(dynamic_strategy_kept_cards, reverse=True))}.)"
         )
+    else:
+        print("(Dynamic discard coach would have kept the same cards as user did.)")
+    return kept_hand
 
-        is_first_simulation_hand: bool = not hand
-        if is_first_simulation_hand and (
-            first_pone_dealt_cards
-            or first_pone_kept_cards
-            or first_dealer_dealt_cards
-            or first_dealer_kept_cards
-        ):
-            pone_dealt_or_kept_cards = set(
-                (
-                    first_pone_dealt_cards
-                    if hand_pone_is_this_simulation_first_pone
-                    else first_dealer_dealt_cards
-                )
-                + (
-                    first_pone_kept_cards
-                    if hand_pone_is_this_simulation_first_pone
-                    else first_dealer_kept_cards
-                )
-            )
-            assert len(pone_dealt_or_kept_cards) <= DEALT_CARDS_LEN, (
-                f"No more than {DEALT_CARDS_LEN} specified dealt or kept pone cards"
-                f" expected but {len(pone_dealt_or_kept_cards)} specified"
-            )
 
-            dealer_dealt_or_kept_cards = set(
-                (
-                    first_dealer_dealt_cards
-                    if hand_dealer_is_this_simulation_first_dealer
-                    else first_pone_dealt_cards
-                )
-                + (
-                    first_dealer_kept_cards
-                    if hand_dealer_is_this_simulation_first_dealer
-                    else first_pone_kept_cards
-                )
-            )
-            assert len(dealer_dealt_or_kept_cards) <= DEALT_CARDS_LEN, (
-                f"No more than {DEALT_CARDS_LEN} specified dealt or kept dealer cards"
-                f" expected but {len(dealer_dealt_or_kept_cards)} specified"
-            )
+# Cuts a hand's starter, or takes the game's fixed starter, scoring His Heels
+# for the dealer when it is a jack.
+def cut_starter(
+    fixed_starter: Optional[Card],
+    deck_less_dealt_cards_mask: CardMask,
+    game_score: GameScoreAccumulator,
+    hand: int,
+    hide_play_actions: bool,
+) -> Card:
+    starter = fixed_starter or card_from_id(
+        sample_card_mask_card_ids(deck_less_dealt_cards_mask, 1)[0]
+    )
+    if not hide_play_actions:
+        print(f"Cut/starter card is: {starter}")
+    if starter.index == 10:
+        game_score.add(
+            get_game_player(DEALER, hand), PointsType.PLAY, NIBS_SCORE_POINTS
+        )
+        if not hide_play_actions:
+            print(f"His heels/nibs for 2 for {get_player_name(1)} [{game_score}]")
+    return starter
+
+
+# Selects a hand's next play action: a simulated play when the player plays by
+# simulations and has a choice, else on the first hand the next fixed initial
+# play, else the only legal action or the player's play strategy, coaching a
+# user-entered play.  Returns None when the post-initial play under evaluation
+# is not a legal play from the player's hand.
+def select_play_action(
+    legal_play_actions: List[PlayAction],
+    hand_cards: List[Card],
+    pegging_state: PeggingState,
+    remaining_fixed_play_actions: List[PlayAction],
+    post_initial_play: Optional[Card],
+    player_strategy: PlayerStrategy,
+    coach_play_simulated_hand_count: Optional[int],
+    game_score: GameScoreAccumulator,
+    first_pone_to_play: bool,
+    dealt_cards: List[Card],
+    kept_cards: Sequence[Card],
+    starter: Card,
+    play_actions: List[PlayAction],
+    player_to_play: Player,
+    hand_pone_is_this_simulation_first_pone: bool,
+    estimate_pone_incomplete_game_wins_and_game_points: bool,
+    estimate_dealer_incomplete_game_wins_and_game_points: bool,
+    start_of_hand_position_results_tallies: shelve.Shelf,
+) -> Optional[PlayAction]:
+    if len(legal_play_actions) > 1 and player_strategy.play_based_on_simulations:
+        return play_based_on_simulation(
+            player_strategy.play_based_on_simulations,
+            player_strategy.hide_hands,
+            game_score.to_game_score(),
+            first_pone_to_play,
+            dealt_cards,
+            kept_cards,
+            starter,
+            list(play_actions),
+            player_to_play,
+            hand_pone_is_this_simulation_first_pone,
+            False,
+            estimate_pone_incomplete_game_wins_and_game_points,
+            estimate_dealer_incomplete_game_wins_and_game_points,
+            player_strategy.hide_hands,
+            start_of_hand_position_results_tallies,
+        )
 
-            random_hand_cards = random.sample(
-                deck_less_fixed_cards,
-                2 * DEALT_CARDS_LEN
-                - len(pone_dealt_or_kept_cards | dealer_dealt_or_kept_cards),
+    if remaining_fixed_play_actions:
+        fixed_play_action = remaining_fixed_play_actions.pop(0)
+        if (
+            post_initial_play
+            and not remaining_fixed_play_actions
+            and (
+                post_initial_play not in hand_cards
+                or not pegging_state.is_playable(post_initial_play)
             )
-            dealt_hands = [
-                [
-                    *pone_dealt_or_kept_cards,
-                    *random_hand_cards[
-                        0 : (DEALT_CARDS_LEN - len(pone_dealt_or_kept_cards))
-                    ],
-                ],
-                [
-                    *dealer_dealt_or_kept_cards,
-                    *random_hand_cards[
-                        (DEALT_CARDS_LEN - len(pone_dealt_or_kept_cards)) :
-                    ],
-                ],
-            ]
-        else:
-            random_hand_cards = random.sample(
-                deck_less_fixed_cards, DEALT_CARDS_LEN * 2
+        ):
+            return None
+        return fixed_play_action
+
+    select_play = player_strategy.select_play
+    play_is_user_selected: bool = (
+        select_play == play_user_selected  # pylint: disable=comparison-with-callable
+    )
+    if len(legal_play_actions) == 1 and not play_is_user_selected:
+        return legal_play_actions[0]
+    if len(legal_play_actions) == 1 and str(legal_play_actions[0]) == Go.STR:
+        input("Press enter to say Go: ")
+        return legal_play_actions[0]
+
+    play_action = legal_play_actions[
+        select_play(
+            legal_play_actions,
+            pegging_state.play_count,
+            pegging_state.play_to_31_cards,
+        )
+    ]
+    if not play_is_user_selected or len(legal_play_actions) == 1:
+        return play_action
+
+    static_strategy_play_action = legal_play_actions[
+        DEFAULT_SELECT_PLAY(
+            [
+                playable_card
+                for playable_card in legal_play_actions
+                if isinstance(playable_card, Card)
+            ],
+            pegging_state.play_count,
+            pegging_state.play_to_31_cards,
+        )
+    ]
+    if play_action != static_strategy_play_action:
+        print(
+            "(Static play coach would have instead played:"
+            f" {static_strategy_play_action}.)"
+        )
+    else:
+        print("(Static play coach would have played the same card as user did.)")
+
+    dynamic_strategy_play_action = play_based_on_simulation(
+        (
+            coach_play_simulated_hand_count
+            if coach_play_simulated_hand_count is not None
+            else 900
+        ),
+        player_strategy.hide_hands,
+        game_score.to_game_score(),
+        first_pone_to_play,
+        dealt_cards,
+        kept_cards,
+        starter,
+        list(play_actions),
+        player_to_play,
+        hand_pone_is_this_simulation_first_pone,
+        False,
+        estimate_pone_incomplete_game_wins_and_game_points,
+        estimate_dealer_incomplete_game_wins_and_game_points,
+        player_strategy.hide_hands,
+        start_of_hand_position_results_tallies,
+    )
+
+    dynamic_and_static_play_coaches_agree = (
+        static_strategy_play_action == dynamic_strategy_play_action
+    )
+    if play_action != dynamic_strategy_play_action:
+        print(
+            "(Dynamic play coach"
+            f" {'agrees' if dynamic_and_static_play_coaches_agree else 'disagrees'}"
+            " with static play coach and"
+            f" {'also ' if dynamic_and_static_play_coaches_agree else ''}"
+            "would have instead played:"
+            f" {dynamic_strategy_play_action}.)"
+        )
+    else:
+        print("(Dynamic play coach would have played the same card as user did.)")
+    return play_action
+
+
+# Scores a hand's last card, then the pone's hand, the dealer's hand and the
+# crib, stopping as soon as the game is over.
+def count_hands_and_crib(
+    game_score: GameScoreAccumulator,
+    hand: int,
+    last_player_to_play: Player,
+    kept_hands: List[Sequence[Card]],
+    crib_cards: List[Card],
+    starter: Card,
+    hide_play_actions: bool,
+) -> None:
+    game_score.add(
+        get_game_player(last_player_to_play, hand),
+        PointsType.PLAY,
+        LAST_CARD_POINTS,
+    )
+    if not hide_play_actions:
+        print(
+            f"!Last card for {LAST_CARD_POINTS} point for"
+            f" {get_player_name(last_player_to_play)} [{game_score}]."
+        )
+    if game_score.is_over:
+        return
+
+    pone_hand_points = score_hand_and_starter(kept_hands[0], starter)
+    game_score.add(get_game_player(PONE, hand), PointsType.HAND, pone_hand_points)
+    if not hide_play_actions:
+        print(
+            f"!{Hand(reversed(sorted(kept_hands[0])))} hand + starter {starter}"
+            f" scores {pone_hand_points:2} points for Pone.   [{game_score}]"
+        )
+    if game_score.is_over:
+        return
+
+    dealer_hand_points = score_hand_and_starter(kept_hands[1], starter)
+    game_score.add(get_game_player(DEALER, hand), PointsType.HAND, dealer_hand_points)
+    if not hide_play_actions:
+        print(
+            f"!{Hand(reversed(sorted(kept_hands[1])))} hand + starter {starter}"
+            f" scores {dealer_hand_points:2} points for Dealer. [{game_score}]"
+        )
+    if game_score.is_over:
+        return
+
+    crib_points = score_hand_and_starter(crib_cards, starter, is_crib=True)
+    game_score.add(get_game_player(DEALER, hand), PointsType.CRIB, crib_points)
+    if not hide_play_actions:
+        print(
+            f"!{Hand(reversed(sorted(crib_cards)))} crib + starter {starter} scores"
+            f" {crib_points:2} points for Dealer. [{game_score}]"
+        )
+        print(
+            f"+++ Game score is [{game_score}] for first pone and first dealer"
+            f" after {hand+1} hands played."
+        )
+        print()
+
+
+# The first hand kept cards under evaluation when iterating through each
+# possible keep of a fixed deal, else no kept cards.
+def get_evaluated_kept_cards(
+    first_pone_dealt_cards: List[Card],
+    first_dealer_dealt_cards: List[Card],
+    first_pone_kept_cards: List[Card],
+    first_dealer_kept_cards: List[Card],
+    first_kept_pone_hand: List[Card],
+    first_kept_dealer_hand: List[Card],
+) -> Tuple[Card, ...]:
+    if (
+        first_pone_dealt_cards
+        and len(first_pone_dealt_cards) > 1
+        and not first_pone_kept_cards
+    ):
+        return tuple(first_kept_pone_hand)
+    if (
+        first_dealer_dealt_cards
+        and len(first_dealer_dealt_cards) > 1
+        and not first_dealer_kept_cards
+    ):
+        return tuple(first_kept_dealer_hand)
+    return tuple()
+
+
+def simulate_game(
+    first_pone_dealt_cards: List[Card],
+    first_dealer_dealt_cards: List[Card],
+    deck_less_fixed_cards: Sequence[Card],
+    first_pone_kept_cards: List[Card],
+    first_dealer_kept_cards: List[Card],
+    initial_starter: Optional[Card],
+    maximum_hands_per_game: int,
+    first_pone_select_kept_cards,
+    first_pone_discard_based_on_simulations: Optional[int],
+    first_pone_select_each_possible_kept_hand: bool,
+    first_dealer_select_kept_cards,
+    first_dealer_discard_based_on_simulations: Optional[int],
+    first_dealer_select_each_possible_kept_hand: bool,
+    first_pone_select_play,
+    first_pone_play_based_on_simulations: Optional[int],
+    first_dealer_select_play,
+    first_dealer_play_based_on_simulations: Optional[int],
+    coach_discard_simulated_hand_count: Optional[int],
+    coach_play_simulated_hand_count: Optional[int],
+    tally_start_of_hand_position_results: bool,
+    estimate_first_pone_incomplete_game_wins_and_game_points: bool,
+    estimate_first_dealer_incomplete_game_wins_and_game_points: bool,
+    start_of_hand_position_results_tallies: shelve.Shelf,
+    hide_first_pone_hands: bool,
+    hide_first_dealer_hands: bool,
+    first_pone_dealt_cards_possible_keeps_cycle: Iterator[Tuple[Card, ...]],
+    first_dealer_dealt_cards_possible_keeps_cycle: Iterator[Tuple[Card, ...]],
+    dropped_keeps,
+    initial_first_pone_score: Points,
+    initial_first_dealer_score: Points,
+    post_initial_play: Optional[Card],
+    initial_play_actions: List[PlayAction],
+    hide_play_actions: bool,
+) -> GameSimulationResult:
+    first_hand_fixed_cards = (
+        set(first_pone_dealt_cards + first_pone_kept_cards),
+        set(first_dealer_dealt_cards + first_dealer_kept_cards),
+    )
+    assert len(first_hand_fixed_cards[0]) <= DEALT_CARDS_LEN, (
+        f"No more than {DEALT_CARDS_LEN} specified first pone dealt or kept cards"
+        f" expected but {len(first_hand_fixed_cards[0])}"
+        f" ({Hand(first_hand_fixed_cards[0])}) specified"
+    )
+    assert len(first_hand_fixed_cards[1]) <= DEALT_CARDS_LEN, (
+        f"No more than {DEALT_CARDS_LEN} specified first dealer dealt or kept cards"
+        f" expected but {len(first_hand_fixed_cards[1])}"
+        f" ({Hand(first_hand_fixed_cards[1])}) specified"
+    )
+
+    first_pone_strategy = PlayerStrategy(
+        first_pone_select_kept_cards,
+        first_pone_discard_based_on_simulations,
+        first_pone_select_play,
+        first_pone_play_based_on_simulations,
+        estimate_first_pone_incomplete_game_wins_and_game_points,
+        hide_first_pone_hands,
+    )
+    first_dealer_strategy = PlayerStrategy(
+        first_dealer_select_kept_cards,
+        first_dealer_discard_based_on_simulations,
+        first_dealer_select_play,
+        first_dealer_play_based_on_simulations,
+        estimate_first_dealer_incomplete_game_wins_and_game_points,
+        hide_first_dealer_hands,
+    )
+    first_hand_fixed_play_actions: List[PlayAction] = (
+        [*initial_play_actions, post_initial_play]
+        if post_initial_play
+        else initial_play_actions
+    )
+    first_kept_pone_hand: List[Card] = []
+    first_kept_dealer_hand: List[Card] = []
+    game_score = GameScoreAccumulator(
+        initial_first_pone_score, initial_first_dealer_score
+    )
+    not_all_kept_cards_in_kept_hand: bool = False
+    post_initial_play_is_illegal: bool = False
+    start_of_hand_scores: List[StartOfHandScore] = []
+    deck_less_fixed_cards_mask = cards_mask(deck_less_fixed_cards)
+    for hand in range(maximum_hands_per_game):
+        hand_pone_is_this_simulation_first_pone: bool = hand % 2 == 0
+        pone_strategy, dealer_strategy = (
+            (first_pone_strategy, first_dealer_strategy)
+            if hand_pone_is_this_simulation_first_pone
+            else (first_dealer_strategy, first_pone_strategy)
+        )
+        start_of_hand_scores.append(
+            StartOfHandScore(
+                game_score.totals[0],
+                game_score.totals[1],
+                not hand_pone_is_this_simulation_first_pone,
             )
-            dealt_hands = [
-                random_hand_cards[0:DEALT_CARDS_LEN],
-                random_hand_cards[DEALT_CARDS_LEN:],
-            ]
+        )
 
+        is_first_simulation_hand: bool = not hand
+        dealt_hands, deck_less_dealt_cards_mask = deal_hands(
+            deck_less_fixed_cards_mask,
+            first_hand_fixed_cards if is_first_simulation_hand else (set(), set()),
+        )
         assert (
             len(dealt_hands[0]) == DEALT_CARDS_LEN
             and len(dealt_hands[1]) == DEALT_CARDS_LEN
@@ -814,392 +2421,62 @@ def simulate_game(
             f" {len(dealt_hands[0])} and {len(dealt_hands[1])} actually dealt"
         )
 
-        show_pone_hand: bool = (
-            hand_pone_is_this_simulation_first_pone and not hide_first_pone_hands
-        ) or (hand_pone_is_this_simulation_first_dealer and not hide_first_dealer_hands)
+        show_pone_hand: bool = not pone_strategy.hide_hands
         if show_pone_hand:
             print(
                 f"{get_player_name(0):6} dealt     {Hand(dealt_hands[0])}"
                 f" (sorted: {Hand(sorted(dealt_hands[0], reverse=True))})"
             )
-        show_dealer_hand: bool = (
-            hand_dealer_is_this_simulation_first_dealer and not hide_first_dealer_hands
-        ) or (hand_dealer_is_this_simulation_first_pone and not hide_first_pone_hands)
+        show_dealer_hand: bool = not dealer_strategy.hide_hands
         if show_dealer_hand:
             print(
                 f"{get_player_name(1):6} dealt     {Hand(dealt_hands[1])}"
                 f" (sorted: {Hand(sorted(dealt_hands[1], reverse=True))})"
             )
-        deck_less_dealt_cards = list(
-            set(deck_less_fixed_cards).difference(set(random_hand_cards))
-        )
 
-        estimate_any_player_incomplete_game_wins_and_game_points: bool = (
-            estimate_first_pone_incomplete_game_wins_and_game_points
-            or estimate_first_dealer_incomplete_game_wins_and_game_points
-        )
-        pone_kept_cards: List[Card] = (
-            first_pone_kept_cards
-            if hand_pone_is_this_simulation_first_pone
-            else first_dealer_kept_cards
+        kept_pone_hand = select_kept_hand(
+            PONE,
+            dealt_hands[0],
+            is_first_simulation_hand,
+            first_pone_dealt_cards,
+            first_pone_kept_cards,
+            first_pone_select_each_possible_kept_hand,
+            first_pone_dealt_cards_possible_keeps_cycle,
+            dropped_keeps,
+            pone_strategy,
+            dealer_strategy,
+            coach_discard_simulated_hand_count,
+            game_score,
+            False,
+            start_of_hand_position_results_tallies,
         )
-        if is_first_simulation_hand and pone_kept_cards:
-            if len(pone_kept_cards) == KEPT_CARDS_LEN:
-                kept_pone_hand = [
-                    card for card in dealt_hands[0] if card in pone_kept_cards
-                ]
-            else:
-                kept_pone_hand = first_pone_select_kept_cards(dealt_hands[0])
-                if not hide_first_pone_hands:
-                    print(
-                        f"{get_player_name(0):6} keeps {Hand(kept_pone_hand)}"
-                        f" (sorted: {Hand(sorted(kept_pone_hand, reverse=True))})"
-                    )
-                if not all(
-                    pone_kept_card in kept_pone_hand
-                    for pone_kept_card in pone_kept_cards
-                ):
-                    if not hide_first_pone_hands:
-                        print(
-                            "...but then"
-                            f" {Hand(set(pone_kept_cards).difference(kept_pone_hand))}"
-                            " would not be kept by pone"
-                        )
-                    not_all_kept_cards_in_kept_hand = True
-                    break
-        elif not (
-            is_first_simulation_hand and first_pone_select_each_possible_kept_hand
-        ):
-            if (
-                first_pone_discard_based_on_simulations
-                and hand_pone_is_this_simulation_first_pone
-                or first_dealer_discard_based_on_simulations
-                and hand_pone_is_this_simulation_first_dealer
-            ):
-                if (
-                    first_pone_discard_based_on_simulations
-                    and hand_pone_is_this_simulation_first_pone
-                ):
-                    simulated_hand_count = first_pone_discard_based_on_simulations
-                elif (
-                    first_dealer_discard_based_on_simulations
-                    and hand_pone_is_this_simulation_first_dealer
-                ):
-                    simulated_hand_count = first_dealer_discard_based_on_simulations
-                else:
-                    raise AssertionError()
-
-                kept_pone_hand = player_select_kept_cards_based_on_simulation(
-                    simulated_hand_count,
-                    (
-                        hide_first_pone_hands
-                        if hand_pone_is_this_simulation_first_pone
-                        else hide_first_dealer_hands
-                    ),
-                    game_score,
-                    dealt_hands[0],
-                    PONE,
-                    False,
-                    (
-                        estimate_first_pone_incomplete_game_wins_and_game_points
-                        if hand_pone_is_this_simulation_first_pone
-                        else estimate_first_dealer_incomplete_game_wins_and_game_points
-                    ),
-                    (
-                        estimate_first_dealer_incomplete_game_wins_and_game_points
-                        if hand_pone_is_this_simulation_first_pone
-                        else estimate_first_pone_incomplete_game_wins_and_game_points
-                    ),
-                    (
-                        hide_first_pone_hands
-                        if hand_pone_is_this_simulation_first_pone
-                        else hide_first_dealer_hands
-                    ),
-                    start_of_hand_position_results_tallies,
-                )
-            else:
-                kept_pone_hand = (
-                    first_pone_select_kept_cards(dealt_hands[0])
-                    if hand_pone_is_this_simulation_first_pone
-                    else first_dealer_select_kept_cards(dealt_hands[0])
-                )
-                if (
-                    first_pone_select_kept_cards  # pylint: disable=comparison-with-callable
-                    == keep_user_selected
-                    and hand_pone_is_this_simulation_first_pone
-                    or first_dealer_select_kept_cards  # pylint: disable=comparison-with-callable
-                    == keep_user_selected
-                    and hand_pone_is_this_simulation_first_dealer
-                ):
-                    static_strategy_pone_kept_cards = (
-                        BEST_STATIC_SELECT_PONE_KEPT_CARDS(dealt_hands[0])
-                    )
-                    if set(kept_pone_hand) != set(static_strategy_pone_kept_cards):
-                        print(
-                            f"(Static discard coach would have kept:"
-                            f" {Hand(sorted(static_strategy_pone_kept_cards, reverse=True))})"
-                        )
-                    else:
-                        print(
-                            "(Static coach would have kept the same cards as user did.)"
-                        )
-
-                    dynamic_strategy_pone_kept_cards = player_select_kept_cards_based_on_simulation(
-                        (
-                            coach_discard_simulated_hand_count
-                            if coach_discard_simulated_hand_count is not None
-                            else 160
-                        ),
-                        (
-                            hide_first_pone_hands
-                            if hand_pone_is_this_simulation_first_pone
-                            else hide_first_dealer_hands
-                        ),
-                        game_score,
-                        dealt_hands[0],
-                        PONE,
-                        False,
-                        (
-                            (
-                                estimate_first_pone_incomplete_game_wins_and_game_points
-                                if hand_pone_is_this_simulation_first_pone
-                                else estimate_first_dealer_incomplete_game_wins_and_game_points
-                            )
-                            if estimate_any_player_incomplete_game_wins_and_game_points
-                            else False
-                        ),
-                        (
-                            (
-                                estimate_first_dealer_incomplete_game_wins_and_game_points
-                                if hand_pone_is_this_simulation_first_pone
-                                else estimate_first_pone_incomplete_game_wins_and_game_points
-                            )
-                            if estimate_any_player_incomplete_game_wins_and_game_points
-                            else False
-                        ),
-                        (
-                            hide_first_pone_hands
-                            if hand_pone_is_this_simulation_first_pone
-                            else hide_first_dealer_hands
-                        ),
-                        start_of_hand_position_results_tallies,
-                    )
-
-                    dynamic_and_static_pone_discard_coaches_agree = set(
-                        static_strategy_pone_kept_cards
-                    ) == set(dynamic_strategy_pone_kept_cards)
-                    if set(kept_pone_hand) != set(dynamic_strategy_pone_kept_cards):
-                        print(
-                            "(Dynamic discard coach "
-                            f"{'agrees' if dynamic_and_static_pone_discard_coaches_agree else 'disagrees'}"
-                            " with static discard coach and "
-                            f"{'also ' if dynamic_and_static_pone_discard_coaches_agree else ''}"
-                            "would have instead kept: "
-                            f"{Hand(sorted(dynamic_strategy_pone_kept_cards, reverse=True))})"
-                        )
-                    else:
-                        print(
-                            "(Dynamic discard coach would have kept the same cards as"
-                            " user did.)"
-                        )
-
-        elif is_first_simulation_hand and first_pone_dealt_cards:
-            optional_kept_pone_hand = None
-            while (
-                not optional_kept_pone_hand
-                or tuple(optional_kept_pone_hand) in dropped_keeps
-            ):
-                optional_kept_pone_hand = list(
-                    next(first_pone_dealt_cards_possible_keeps_cycle)
-                )
-            kept_pone_hand = first_kept_pone_hand = optional_kept_pone_hand
-        else:
-            raise ValueError(
-                "Iterating through all possible kept hands not supported with"
-                " non-fixed deals."
-            )
-
-        dealer_kept_cards: List[Card] = (
-            first_dealer_kept_cards
-            if hand_dealer_is_this_simulation_first_dealer
-            else first_pone_kept_cards
+        if kept_pone_hand is None:
+            not_all_kept_cards_in_kept_hand = True
+            break
+        if is_first_simulation_hand and first_pone_select_each_possible_kept_hand:
+            first_kept_pone_hand = kept_pone_hand
+
+        kept_dealer_hand = select_kept_hand(
+            DEALER,
+            dealt_hands[1],
+            is_first_simulation_hand,
+            first_dealer_dealt_cards,
+            first_dealer_kept_cards,
+            first_dealer_select_each_possible_kept_hand,
+            first_dealer_dealt_cards_possible_keeps_cycle,
+            dropped_keeps,
+            dealer_strategy,
+            pone_strategy,
+            coach_discard_simulated_hand_count,
+            game_score,
+            tally_start_of_hand_position_results,
+            start_of_hand_position_results_tallies,
         )
-        if is_first_simulation_hand and dealer_kept_cards:
-            if len(dealer_kept_cards) == KEPT_CARDS_LEN:
-                kept_dealer_hand = [
-                    card for card in dealt_hands[1] if card in dealer_kept_cards
-                ]
-            else:
-                kept_dealer_hand = first_dealer_select_kept_cards(dealt_hands[1])
-                if not hide_first_dealer_hands:
-                    print(
-                        f"{get_player_name(1):6} would keep {Hand(kept_dealer_hand)}"
-                        f" (sorted: {Hand(sorted(kept_dealer_hand, reverse=True))})"
-                    )
-                if not all(
-                    dealer_kept_card in kept_dealer_hand
-                    for dealer_kept_card in dealer_kept_cards
-                ):
-                    if not hide_first_dealer_hands:
-                        print(
-                            "...but then"
-                            f" {Hand(set(dealer_kept_cards).difference(kept_dealer_hand))} "
-                            "would not be kept by dealer"
-                        )
-                    not_all_kept_cards_in_kept_hand = True
-                    break
-        elif not (
-            is_first_simulation_hand and first_dealer_select_each_possible_kept_hand
-        ):
-            if (
-                first_dealer_discard_based_on_simulations
-                and hand_dealer_is_this_simulation_first_dealer
-                or first_pone_discard_based_on_simulations
-                and hand_dealer_is_this_simulation_first_pone
-            ):
-                if (
-                    first_dealer_discard_based_on_simulations
-                    and hand_dealer_is_this_simulation_first_dealer
-                ):
-                    simulated_hand_count = first_dealer_discard_based_on_simulations
-                elif (
-                    first_pone_discard_based_on_simulations
-                    and hand_dealer_is_this_simulation_first_pone
-                ):
-                    simulated_hand_count = first_pone_discard_based_on_simulations
-                else:
-                    raise AssertionError()
-
-                kept_dealer_hand = player_select_kept_cards_based_on_simulation(
-                    simulated_hand_count,
-                    (
-                        hide_first_dealer_hands
-                        if hand_dealer_is_this_simulation_first_dealer
-                        else hide_first_pone_hands
-                    ),
-                    game_score,
-                    dealt_hands[1],
-                    DEALER,
-                    tally_start_of_hand_position_results,
-                    (
-                        estimate_first_pone_incomplete_game_wins_and_game_points
-                        if hand_dealer_is_this_simulation_first_pone
-                        else estimate_first_dealer_incomplete_game_wins_and_game_points
-                    ),
-                    (
-                        estimate_first_dealer_incomplete_game_wins_and_game_points
-                        if hand_dealer_is_this_simulation_first_pone
-                        else estimate_first_pone_incomplete_game_wins_and_game_points
-                    ),
-                    (
-                        hide_first_dealer_hands
-                        if hand_dealer_is_this_simulation_first_dealer
-                        else hide_first_pone_hands
-                    ),
-                    start_of_hand_position_results_tallies,
-                )
-            else:
-                kept_dealer_hand = (
-                    first_dealer_select_kept_cards(dealt_hands[1])
-                    if hand_dealer_is_this_simulation_first_dealer
-                    else first_pone_select_kept_cards(dealt_hands[1])
-                )
-                if (
-                    first_dealer_select_kept_cards  # pylint: disable=comparison-with-callable
-                    == keep_user_selected
-                    and hand_dealer_is_this_simulation_first_dealer
-                    or first_pone_select_kept_cards  # pylint: disable=comparison-with-callable
-                    == keep_user_selected
-                    and hand_dealer_is_this_simulation_first_pone
-                ):
-                    static_strategy_dealer_kept_cards = (
-                        BEST_STATIC_SELECT_DEALER_KEPT_CARDS(dealt_hands[1])
-                    )
-                    if set(kept_dealer_hand) != set(static_strategy_dealer_kept_cards):
-                        print(
-                            "(Static discard coach would have instead kept: "
-                            f"{Hand(sorted(static_strategy_dealer_kept_cards, reverse=True))}.)"
-                        )
-                    else:
-                        print(
-                            "(Static discard coach would have kept the same cards as"
-                            " user did.)"
-                        )
-
-                    dynamic_strategy_dealer_kept_cards = player_select_kept_cards_based_on_simulation(
-                        (
-                            coach_discard_simulated_hand_count
-                            if coach_discard_simulated_hand_count is not None
-                            else 160
-                        ),
-                        (
-                            hide_first_dealer_hands
-                            if hand_dealer_is_this_simulation_first_dealer
-                            else hide_first_pone_hands
-                        ),
-                        game_score,
-                        dealt_hands[1],
-                        DEALER,
-                        False,
-                        (
-                            (
-                                estimate_first_pone_incomplete_game_wins_and_game_points
-                                if hand_dealer_is_this_simulation_first_pone
-                                else estimate_first_dealer_incomplete_game_wins_and_game_points
-                            )
-                            if estimate_any_player_incomplete_game_wins_and_game_points
-                            else False
-                        ),
-                        (
-                            (
-                                estimate_first_dealer_incomplete_game_wins_and_game_points
-                                if hand_dealer_is_this_simulation_first_pone
-                                else estimate_first_pone_incomplete_game_wins_and_game_points
-                            )
-                            if estimate_any_player_incomplete_game_wins_and_game_points
-                            else False
-                        ),
-                        (
-                            hide_first_dealer_hands
-                            if hand_dealer_is_this_simulation_first_dealer
-                            else hide_first_pone_hands
-                        ),
-                        start_of_hand_position_results_tallies,
-                    )
-
-                    dynamic_and_static_discard_coaches_agree = set(
-                        static_strategy_dealer_kept_cards
-                    ) == set(dynamic_strategy_dealer_kept_cards)
-                    if set(kept_dealer_hand) != set(dynamic_strategy_dealer_kept_cards):
-                        print(
-                            "(Dynamic discard coach "
-                            f"{'agrees' if dynamic_and_static_discard_coaches_agree else 'disagrees'}"
-                            " with static discard coach and "
-                            f"{'also ' if dynamic_and_static_discard_coaches_agree else ''}"
-                            "would have instead kept: "
-                            f"{Hand(sorted(dynamic_strategy_dealer_kept_cards, reverse=True))}.)"
-                        )
-                    else:
-                        print(
-                            "(Dynamic discard coach would have kept the same cards as"
-                            " user did.)"
-                        )
-
-        elif is_first_simulation_hand and first_dealer_dealt_cards:
-            optional_kept_dealer_hand = None
-            while (
-                not optional_kept_dealer_hand
-                or tuple(optional_kept_dealer_hand) in dropped_keeps
-            ):
-                optional_kept_dealer_hand = list(
-                    next(first_dealer_dealt_cards_possible_keeps_cycle)
-                )
-            kept_dealer_hand = first_kept_dealer_hand = optional_kept_dealer_hand
-        else:
-            raise ValueError(
-                "Iterating through all possible kept hands not supported with"
-                " non-fixed deals."
-            )
+        if kept_dealer_hand is None:
+            not_all_kept_cards_in_kept_hand = True
+            break
+        if is_first_simulation_hand and first_dealer_select_each_possible_kept_hand:
+            first_kept_dealer_hand = kept_dealer_hand
 
         kept_hands: List[Sequence[Card]] = [kept_pone_hand, kept_dealer_hand]
         hands = [list(kept_hand) for kept_hand in kept_hands]
@@ -1238,338 +2515,126 @@ def simulate_game(
                 f" (sorted: {Hand(sorted(hands[1], reverse=True))})"
             )
 
-        starter = (
-            initial_starter
-            if is_first_simulation_hand and initial_starter
-            else random.sample(deck_less_dealt_cards, 1)[0]
+        starter = cut_starter(
+            initial_starter if is_first_simulation_hand else None,
+            deck_less_dealt_cards_mask,
+            game_score,
+            hand,
+            hide_play_actions,
         )
-        if not hide_play_actions:
-            print(f"Cut/starter card is: {starter}")
-        if starter.index == 10:
-            dealer_game_player = GamePlayer((hand + 1) % 2)
-            game_score = add_to_game_score(
-                game_score, dealer_game_player, PointsType.PLAY, NIBS_SCORE_POINTS
-            )
-            if not hide_play_actions:
-                print(f"His heels/nibs for 2 for {get_player_name(1)} [{game_score}]")
-            if game_over(game_score):
-                break
+        if game_score.is_over:
+            break
 
         player_to_play: Player = 0
-        play_count: PlayCount = START_OF_PLAY_COUNT
-        consecutive_go_count = 0
-        most_recently_played_index = None
-        most_recently_played_index_count = 0
+        pegging_state = PeggingState()
         plays_to_31: List[PlayTo31] = [create_play_to_31()]
-        remaining_initial_play_actions: List[PlayAction] = list(initial_play_actions)
-        remaining_post_initial_play = post_initial_play
+        # Every play action of the hand, for play simulations.
+        play_actions: List[PlayAction] = []
+        remaining_fixed_play_actions: List[PlayAction] = (
+            list(first_hand_fixed_play_actions) if is_first_simulation_hand else []
+        )
         while hands[0] or hands[1]:
             legal_play_actions: List[PlayAction] = [
                 card
                 for card in hands[player_to_play]
-                if play_count + card.count <= THIRTY_ONE_COUNT
+                if pegging_state.is_playable(card)
             ]
             if not legal_play_actions:
                 legal_play_actions = [Go()]
 
-            player_to_play_play: PlayAction
-
-            first_pone_to_play = (
-                player_to_play == 0
-                and hand_pone_is_this_simulation_first_pone
-                or player_to_play == 1
-                and hand_dealer_is_this_simulation_first_pone
+            first_pone_to_play = (player_to_play == 0) == (
+                hand_pone_is_this_simulation_first_pone
             )
-            if len(legal_play_actions) > 1 and (
-                first_pone_to_play
-                and first_pone_play_based_on_simulations
-                or not first_pone_to_play
-                and first_dealer_play_based_on_simulations
-            ):
-                if first_pone_to_play and first_pone_play_based_on_simulations:
-                    simulated_play_count = first_pone_play_based_on_simulations
-                elif not first_pone_to_play and first_dealer_play_based_on_simulations:
-                    simulated_play_count = first_dealer_play_based_on_simulations
-                else:
-                    raise AssertionError()
-
-                player_to_play_play = play_based_on_simulation(
-                    simulated_play_count,
-                    (
-                        hide_first_pone_hands
-                        if first_pone_to_play
-                        else hide_first_dealer_hands
-                    ),
-                    game_score,
-                    first_pone_to_play,
-                    dealt_hands[player_to_play],
-                    kept_hands[player_to_play],
-                    starter,
-                    [
-                        play_action
-                        for play_to_31 in plays_to_31
-                        for play_action in play_to_31  # pylint: disable=not-an-iterable
-                    ],
-                    player_to_play,
-                    hand_pone_is_this_simulation_first_pone,
-                    False,
-                    (
-                        estimate_first_pone_incomplete_game_wins_and_game_points
-                        if hand_pone_is_this_simulation_first_pone
-                        else estimate_first_dealer_incomplete_game_wins_and_game_points
-                    ),
-                    (
-                        estimate_first_dealer_incomplete_game_wins_and_game_points
-                        if hand_dealer_is_this_simulation_first_dealer
-                        else estimate_first_pone_incomplete_game_wins_and_game_points
-                    ),
-                    (
-                        hide_first_pone_hands
-                        if first_pone_to_play
-                        else hide_first_dealer_hands
-                    ),
-                    start_of_hand_position_results_tallies,
-                )
-            else:
-                select_play = (
-                    first_pone_select_play
-                    if first_pone_to_play
-                    else first_dealer_select_play
-                )
-                if (
-                    is_first_simulation_hand
-                    and (not remaining_initial_play_actions)
-                    and remaining_post_initial_play
-                ):
-                    if remaining_post_initial_play not in hands[player_to_play]:
-                        non_kept_initial_played_card_played = True
-                        break
-                    if (
-                        play_count + remaining_post_initial_play.count
-                        > THIRTY_ONE_COUNT
-                    ):
-                        post_initial_play_is_illegal = True
-                        break
-                    player_to_play_play = remaining_post_initial_play
-                    remaining_post_initial_play = None
-                elif is_first_simulation_hand and remaining_initial_play_actions:
-                    player_to_play_play = remaining_initial_play_actions.pop(0)
-                elif (
-                    len(legal_play_actions) == 1
-                    and select_play  # pylint: disable=comparison-with-callable
-                    != play_user_selected
-                ):
-                    player_to_play_play = legal_play_actions[0]
-                elif (
-                    len(legal_play_actions) == 1
-                    and select_play  # pylint: disable=comparison-with-callable
-                    == play_user_selected
-                    and str(legal_play_actions[0]) == Go.STR
-                ):
-                    input("Press enter to say Go: ")
-                    player_to_play_play = legal_play_actions[0]
-                else:
-                    player_to_play_play = legal_play_actions[
-                        select_play(
-                            legal_play_actions,
-                            play_count,
-                            get_play_to_31_cards(plays_to_31[-1]),
-                        )
-                    ]
-                    if (
-                        select_play  # pylint: disable=comparison-with-callable
-                        == play_user_selected
-                        and len(legal_play_actions) > 1
-                    ):
-                        static_strategy_player_to_play_play = legal_play_actions[
-                            DEFAULT_SELECT_PLAY(
-                                [
-                                    playable_card
-                                    for playable_card in legal_play_actions
-                                    if isinstance(playable_card, Card)
-                                ],
-                                play_count,
-                                get_play_to_31_cards(plays_to_31[-1]),
-                            )
-                        ]
-                        if player_to_play_play != static_strategy_player_to_play_play:
-                            print(
-                                "(Static play coach would have instead played:"
-                                f" {static_strategy_player_to_play_play}.)"
-                            )
-                        else:
-                            print(
-                                "(Static play coach would have played the same card"
-                                " as user did.)"
-                            )
-
-                        dynamic_strategy_player_to_play_play = play_based_on_simulation(
-                            (
-                                coach_play_simulated_hand_count
-                                if coach_play_simulated_hand_count is not None
-                                else 900
-                            ),
-                            (
-                                hide_first_pone_hands
-                                if first_pone_to_play
-                                else hide_first_dealer_hands
-                            ),
-                            game_score,
-                            first_pone_to_play,
-                            dealt_hands[player_to_play],
-                            kept_hands[player_to_play],
-                            starter,
-                            [
-                                play_action
-                                for play_to_31 in plays_to_31
-                                for play_action in play_to_31  # pylint: disable=not-an-iterable
-                            ],
-                            player_to_play,
-                            hand_pone_is_this_simulation_first_pone,
-                            False,
-                            (
-                                (
-                                    estimate_first_pone_incomplete_game_wins_and_game_points
-                                    if hand_pone_is_this_simulation_first_pone
-                                    else estimate_first_dealer_incomplete_game_wins_and_game_points
-                                )
-                                if estimate_any_player_incomplete_game_wins_and_game_points
-                                else False
-                            ),
-                            (
-                                (
-                                    estimate_first_dealer_incomplete_game_wins_and_game_points
-                                    if hand_dealer_is_this_simulation_first_dealer
-                                    else estimate_first_pone_incomplete_game_wins_and_game_points
-                                )
-                                if estimate_any_player_incomplete_game_wins_and_game_points
-                                else False
-                            ),
-                            (
-                                hide_first_pone_hands
-                                if first_pone_to_play
-                                else hide_first_dealer_hands
-                            ),
-                            start_of_hand_position_results_tallies,
-                        )
-
-                        dynamic_and_static_play_coaches_agree = (
-                            static_strategy_player_to_play_play
-                            == dynamic_strategy_player_to_play_play
-                        )
-                        if player_to_play_play != dynamic_strategy_player_to_play_play:
-                            print(
-                                "(Dynamic play coach"
-                                f" {'agrees' if dynamic_and_static_play_coaches_agree else 'disagrees'}"
-                                " with static play coach and"
-                                f" {'also ' if dynamic_and_static_play_coaches_agree else ''}"
-                                "would have instead played:"
-                                f" {dynamic_strategy_player_to_play_play}.)"
-                            )
-                        else:
-                            print(
-                                "(Dynamic play coach would have played the same card"
-                                " as user did.)"
-                            )
-
+            optional_player_to_play_play = select_play_action(
+                legal_play_actions,
+                hands[player_to_play],
+                pegging_state,
+                remaining_fixed_play_actions,
+                post_initial_play,
+                first_pone_strategy if first_pone_to_play else first_dealer_strategy,
+                coach_play_simulated_hand_count,
+                game_score,
+                first_pone_to_play,
+                dealt_hands[player_to_play],
+                kept_hands[player_to_play],
+                starter,
+                play_actions,
+                player_to_play,
+                hand_pone_is_this_simulation_first_pone,
+                pone_strategy.estimate_incomplete_game_wins_and_game_points,
+                dealer_strategy.estimate_incomplete_game_wins_and_game_points,
+                start_of_hand_position_results_tallies,
+            )
+            if optional_player_to_play_play is None:
+                post_initial_play_is_illegal = True
+                break
+            player_to_play_play: PlayAction = optional_player_to_play_play
+            play_actions.append(player_to_play_play)
             plays_to_31[-1].append(player_to_play_play)  # pylint: disable=no-member
 
             if isinstance(player_to_play_play, Card):
-                play_count += player_to_play_play.count
+                pairs_points, count_points, current_play_run_length = (
+                    pegging_state.play_card(player_to_play_play)
+                )
                 if not hide_play_actions:
                     print(
                         f"{get_player_name(player_to_play):6} plays"
-                        f" {player_to_play_play} for {play_count}"
+                        f" {player_to_play_play} for {pegging_state.play_count}"
                         f" ({';'.join([str(Hand(p)) for p in plays_to_31])})"
                     )
                 hands[player_to_play].remove(player_to_play_play)
 
                 # Pairs points
-                if player_to_play_play.index == most_recently_played_index:
-                    most_recently_played_index_count += 1
-                    if most_recently_played_index_count == 4:
-                        game_score = add_to_game_score(
-                            game_score,
-                            get_game_player(player_to_play, hand),
-                            PointsType.PLAY,
-                            DOUBLE_PAIRS_ROYALE_POINTS,
-                        )
-                        if not hide_play_actions:
+                if pairs_points:
+                    game_score.add(
+                        get_game_player(player_to_play, hand),
+                        PointsType.PLAY,
+                        pairs_points,
+                    )
+                    if not hide_play_actions:
+                        if pairs_points == DOUBLE_PAIRS_ROYALE_POINTS:
                             print(
                                 f"!Double pairs royale for"
                                 f" {DOUBLE_PAIRS_ROYALE_POINTS} points for"
                                 f" {get_player_name(player_to_play)}. [{game_score}]"
                             )
-                        if game_over(game_score):
-                            break
-                    elif most_recently_played_index_count == 3:
-                        game_score = add_to_game_score(
-                            game_score,
-                            get_game_player(player_to_play, hand),
-                            PointsType.PLAY,
-                            PAIRS_ROYALE_POINTS,
-                        )
-                        if not hide_play_actions:
+                        elif pairs_points == PAIRS_ROYALE_POINTS:
                             print(
                                 f"!Pairs royale for {PAIRS_ROYALE_POINTS} points for"
                                 f" {get_player_name(player_to_play)}. [{game_score}]"
                             )
-                        if game_over(game_score):
-                            break
-                    elif most_recently_played_index_count == 2:
-                        game_score = add_to_game_score(
-                            game_score,
-                            get_game_player(player_to_play, hand),
-                            PointsType.PLAY,
-                            PAIR_POINTS,
-                        )
-                        if not hide_play_actions:
+                        else:
                             print(
                                 f"!Pair for {PAIR_POINTS} points for"
                                 f" {get_player_name(player_to_play)}. [{game_score}]"
                             )
-                        if game_over(game_score):
-                            break
-                else:
-                    most_recently_played_index = player_to_play_play.index
-                    most_recently_played_index_count = 1
+                    if game_score.is_over:
+                        break
 
                 # 15 and 31 count points
-                if play_count == FIFTEEN_COUNT:
-                    game_score = add_to_game_score(
-                        game_score,
+                if count_points:
+                    game_score.add(
                         get_game_player(player_to_play, hand),
                         PointsType.PLAY,
-                        FIFTEENS_POINTS,
+                        count_points,
                     )
                     if not hide_play_actions:
-                        print(
-                            f"!{FIFTEEN_COUNT} for {FIFTEENS_POINTS} points for"
-                            f" {get_player_name(player_to_play)}. [{game_score}]"
-                        )
-                    if game_over(game_score):
-                        break
-                elif play_count == THIRTY_ONE_COUNT:
-                    game_score = add_to_game_score(
-                        game_score,
-                        get_game_player(player_to_play, hand),
-                        PointsType.PLAY,
-                        THIRTY_ONE_COUNT_POINTS,
-                    )
-                    if not hide_play_actions:
-                        print(
-                            f"!{THIRTY_ONE_COUNT} for {THIRTY_ONE_COUNT_POINTS} point"
-                            f" for {get_player_name(player_to_play)}. [{game_score}]"
-                        )
-                    if game_over(game_score):
+                        if pegging_state.play_count == FIFTEEN_COUNT:
+                            print(
+                                f"!{FIFTEEN_COUNT} for {FIFTEENS_POINTS} points for"
+                                f" {get_player_name(player_to_play)}. [{game_score}]"
+                            )
+                        else:
+                            print(
+                                f"!{THIRTY_ONE_COUNT} for {THIRTY_ONE_COUNT_POINTS}"
+                                f" point for {get_player_name(player_to_play)}."
+                                f" [{game_score}]"
+                            )
+                    if game_score.is_over:
                         break
 
-                current_play_run_length = get_current_play_run_length(
-                    get_play_to_31_cards(plays_to_31[-1])
-                )
                 if current_play_run_length:
-                    game_score = add_to_game_score(
-                        game_score,
+                    game_score.add(
                         get_game_player(player_to_play, hand),
                         PointsType.PLAY,
                         current_play_run_length,
@@ -1579,18 +2644,14 @@ def simulate_game(
                             f"!Run for {current_play_run_length} points for"
                             f" {get_player_name(player_to_play)}. [{game_score}]"
                         )
-                    if game_over(game_score):
+                    if game_score.is_over:
                         break
-
-                consecutive_go_count = 0
             else:
                 if not hide_play_actions:
                     print(f"{get_player_name(player_to_play):6} says 'Go'")
 
-                consecutive_go_count += 1
-                if consecutive_go_count == 2:
-                    game_score = add_to_game_score(
-                        game_score,
+                if pegging_state.say_go():
+                    game_score.add(
                         get_game_player(player_to_play, hand),
                         PointsType.PLAY,
                         GO_POINTS,
@@ -1600,110 +2661,298 @@ def simulate_game(
                             f"!Go for {GO_POINTS} point for"
                             f" {get_player_name(player_to_play)}. [{game_score}]"
                         )
-                    if game_over(game_score):
+                    if game_score.is_over:
                         break
 
                     if not hide_play_actions:
                         print(f"---resetting play count to {START_OF_PLAY_COUNT}---")
-                    consecutive_go_count = 0
-                    play_count = START_OF_PLAY_COUNT
                     plays_to_31.append(create_play_to_31())
-                    most_recently_played_index = None
-                    most_recently_played_index_count = 0
 
-            player_to_play = 1 if player_to_play == 0 else 0
+            player_to_play = 1 if player_to_play == 0 else 0
+
+        if post_initial_play_is_illegal or game_score.is_over:
+            break
+
+        count_hands_and_crib(
+            game_score,
+            hand,
+            1 if player_to_play == 0 else 0,
+            kept_hands,
+            pone_discarded_cards + dealer_discarded_cards,
+            starter,
+            hide_play_actions,
+        )
+        if game_score.is_over:
+            break
+
+    return GameSimulationResult(
+        get_evaluated_kept_cards(
+            first_pone_dealt_cards,
+            first_dealer_dealt_cards,
+            first_pone_kept_cards,
+            first_dealer_kept_cards,
+            first_kept_pone_hand,
+            first_kept_dealer_hand,
+        ),
+        game_score.to_game_score(),
+        start_of_hand_scores,
+        not_all_kept_cards_in_kept_hand or post_initial_play_is_illegal,
+    )
+
+
+# Bulk simulation engine with the same deal, keep, play and counting steps as
+# simulate_game but no output, coaching, user-selected strategies or repeated
+# argument validation, and with each play's points scored in one update.
+# simulate_games switches to it when every hide flag is set, which covers almost
+# all --game-count runs and every nested discard or play simulation.  Random
+# draws happen in the same order as in simulate_game, so seeded runs give
+# identical results through either engine.
+def simulate_headless_game(
+    first_pone_dealt_cards: List[Card],
+    first_dealer_dealt_cards: List[Card],
+    deck_less_fixed_cards: Sequence[Card],
+    first_pone_kept_cards: List[Card],
+    first_dealer_kept_cards: List[Card],
+    initial_starter: Optional[Card],
+    maximum_hands_per_game: int,
+    first_pone_select_kept_cards,
+    first_pone_discard_based_on_simulations: Optional[int],
+    first_pone_select_each_possible_kept_hand: bool,
+    first_dealer_select_kept_cards,
+    first_dealer_discard_based_on_simulations: Optional[int],
+    first_dealer_select_each_possible_kept_hand: bool,
+    first_pone_select_play,
+    first_pone_play_based_on_simulations: Optional[int],
+    first_dealer_select_play,
+    first_dealer_play_based_on_simulations: Optional[int],
+    tally_start_of_hand_position_results: bool,
+    estimate_first_pone_incomplete_game_wins_and_game_points: bool,
+    estimate_first_dealer_incomplete_game_wins_and_game_points: bool,
+    start_of_hand_position_results_tallies: shelve.Shelf,
+    first_pone_dealt_cards_possible_keeps_cycle: Iterator[Tuple[Card, ...]],
+    first_dealer_dealt_cards_possible_keeps_cycle: Iterator[Tuple[Card, ...]],
+    dropped_keeps,
+    initial_first_pone_score: Points,
+    initial_first_dealer_score: Points,
+    post_initial_play: Optional[Card],
+    initial_play_actions: List[PlayAction],
+) -> GameSimulationResult:
+    first_hand_fixed_cards = (
+        set(first_pone_dealt_cards + first_pone_kept_cards),
+        set(first_dealer_dealt_cards + first_dealer_kept_cards),
+    )
+    first_pone_strategy = PlayerStrategy(
+        first_pone_select_kept_cards,
+        first_pone_discard_based_on_simulations,
+        first_pone_select_play,
+        first_pone_play_based_on_simulations,
+        estimate_first_pone_incomplete_game_wins_and_game_points,
+        True,
+    )
+    first_dealer_strategy = PlayerStrategy(
+        first_dealer_select_kept_cards,
+        first_dealer_discard_based_on_simulations,
+        first_dealer_select_play,
+        first_dealer_play_based_on_simulations,
+        estimate_first_dealer_incomplete_game_wins_and_game_points,
+        True,
+    )
+    first_hand_fixed_play_actions: List[PlayAction] = (
+        [*initial_play_actions, post_initial_play]
+        if post_initial_play
+        else initial_play_actions
+    )
+    first_kept_pone_hand: List[Card] = []
+    first_kept_dealer_hand: List[Card] = []
+    game_score = GameScoreAccumulator(
+        initial_first_pone_score, initial_first_dealer_score
+    )
+    not_all_kept_cards_in_kept_hand: bool = False
+    post_initial_play_is_illegal: bool = False
+    start_of_hand_scores: List[StartOfHandScore] = []
+    deck_less_fixed_cards_mask = cards_mask(deck_less_fixed_cards)
+    for hand in range(maximum_hands_per_game):
+        hand_pone_is_this_simulation_first_pone: bool = hand % 2 == 0
+        pone_strategy, dealer_strategy = (
+            (first_pone_strategy, first_dealer_strategy)
+            if hand_pone_is_this_simulation_first_pone
+            else (first_dealer_strategy, first_pone_strategy)
+        )
+        start_of_hand_scores.append(
+            StartOfHandScore(
+                game_score.totals[0],
+                game_score.totals[1],
+                not hand_pone_is_this_simulation_first_pone,
+            )
+        )
+
+        is_first_simulation_hand: bool = not hand
+        dealt_hands, deck_less_dealt_cards_mask = deal_hands(
+            deck_less_fixed_cards_mask,
+            first_hand_fixed_cards if is_first_simulation_hand else (set(), set()),
+        )
 
-        if (
-            not_all_kept_cards_in_kept_hand
-            or non_kept_initial_played_card_played
-            or post_initial_play_is_illegal
-            or game_over(game_score)
-        ):
+        kept_pone_hand = select_kept_hand(
+            PONE,
+            dealt_hands[0],
+            is_first_simulation_hand,
+            first_pone_dealt_cards,
+            first_pone_kept_cards,
+            first_pone_select_each_possible_kept_hand,
+            first_pone_dealt_cards_possible_keeps_cycle,
+            dropped_keeps,
+            pone_strategy,
+            dealer_strategy,
+            None,
+            game_score,
+            False,
+            start_of_hand_position_results_tallies,
+        )
+        if kept_pone_hand is None:
+            not_all_kept_cards_in_kept_hand = True
             break
-
-        # Last Card points
-        last_player_to_play: Player = 1 if player_to_play == 0 else 0
-        game_score = add_to_game_score(
+        if is_first_simulation_hand and first_pone_select_each_possible_kept_hand:
+            first_kept_pone_hand = kept_pone_hand
+
+        kept_dealer_hand = select_kept_hand(
+            DEALER,
+            dealt_hands[1],
+            is_first_simulation_hand,
+            first_dealer_dealt_cards,
+            first_dealer_kept_cards,
+            first_dealer_select_each_possible_kept_hand,
+            first_dealer_dealt_cards_possible_keeps_cycle,
+            dropped_keeps,
+            dealer_strategy,
+            pone_strategy,
+            None,
             game_score,
-            get_game_player(last_player_to_play, hand),
-            PointsType.PLAY,
-            LAST_CARD_POINTS,
+            tally_start_of_hand_position_results,
+            start_of_hand_position_results_tallies,
         )
-        if not hide_play_actions:
-            print(
-                f"!Last card for {LAST_CARD_POINTS} point for"
-                f" {get_player_name(last_player_to_play)} [{game_score}]."
-            )
-        if game_over(game_score):
+        if kept_dealer_hand is None:
+            not_all_kept_cards_in_kept_hand = True
             break
+        if is_first_simulation_hand and first_dealer_select_each_possible_kept_hand:
+            first_kept_dealer_hand = kept_dealer_hand
 
-        pone_hand_points = score_hand_and_starter(kept_hands[0], starter)
-        game_score = add_to_game_score(
-            game_score, get_game_player(PONE, hand), PointsType.HAND, pone_hand_points
-        )
-        if not hide_play_actions:
-            print(
-                f"!{Hand(reversed(sorted(kept_hands[0])))} hand + starter {starter}"
-                f" scores {pone_hand_points:2} points for Pone.   [{game_score}]"
+        kept_hands: List[Sequence[Card]] = [kept_pone_hand, kept_dealer_hand]
+        hands = [list(kept_hand) for kept_hand in kept_hands]
+        if len(hands[0]) > KEPT_CARDS_LEN or len(hands[1]) > KEPT_CARDS_LEN:
+            raise ValueError(
+                f"Kept too many cards in one of {Hand(hands[0])} or {Hand(hands[1])}"
             )
-        if game_over(game_score):
-            break
+        crib_cards = [card for card in dealt_hands[0] if card not in kept_pone_hand] + [
+            card for card in dealt_hands[1] if card not in kept_dealer_hand
+        ]
 
-        dealer_hand_points = score_hand_and_starter(kept_hands[1], starter)
-        game_score = add_to_game_score(
+        starter = cut_starter(
+            initial_starter if is_first_simulation_hand else None,
+            deck_less_dealt_cards_mask,
             game_score,
-            get_game_player(DEALER, hand),
-            PointsType.HAND,
-            dealer_hand_points,
+            hand,
+            True,
         )
-        if not hide_play_actions:
-            print(
-                f"!{Hand(reversed(sorted(kept_hands[1])))} hand + starter {starter}"
-                f" scores {dealer_hand_points:2} points for Dealer. [{game_score}]"
-            )
-        if game_over(game_score):
+        if game_score.is_over:
             break
 
-        crib_cards = pone_discarded_cards + dealer_discarded_cards
-        crib_points = score_hand_and_starter(crib_cards, starter, is_crib=True)
-        game_score = add_to_game_score(
-            game_score, get_game_player(DEALER, hand), PointsType.CRIB, crib_points
+        player_to_play: Player = 0
+        pegging_state = PeggingState()
+        # Every play action of the hand, for play simulations.
+        play_actions: List[PlayAction] = []
+        remaining_fixed_play_actions: List[PlayAction] = (
+            list(first_hand_fixed_play_actions) if is_first_simulation_hand else []
         )
-        if not hide_play_actions:
-            print(
-                f"!{Hand(reversed(sorted(crib_cards)))} crib + starter {starter} scores"
-                f" {crib_points:2} points for Dealer. [{game_score}]"
-            )
-            print(
-                f"+++ Game score is [{game_score}] for first pone and first dealer"
-                f" after {hand+1} hands played."
-            )
-            print()
-        if game_over(game_score):
+        while hands[0] or hands[1]:
+            legal_play_actions: List[PlayAction] = [
+                card
+                for card in hands[player_to_play]
+                if pegging_state.is_playable(card)
+            ]
+            if not legal_play_actions:
+                legal_play_actions = [Go()]
+
+            # A lone legal action needs no selection when no fixed initial plays
+            # remain, as headless players never enter their plays.
+            player_to_play_play: Optional[PlayAction]
+            if len(legal_play_actions) == 1 and not remaining_fixed_play_actions:
+                player_to_play_play = legal_play_actions[0]
+            else:
+                first_pone_to_play = (player_to_play == 0) == (
+                    hand_pone_is_this_simulation_first_pone
+                )
+                player_to_play_play = select_play_action(
+                    legal_play_actions,
+                    hands[player_to_play],
+                    pegging_state,
+                    remaining_fixed_play_actions,
+                    post_initial_play,
+                    (
+                        first_pone_strategy
+                        if first_pone_to_play
+                        else first_dealer_strategy
+                    ),
+                    None,
+                    game_score,
+                    first_pone_to_play,
+                    dealt_hands[player_to_play],
+                    kept_hands[player_to_play],
+                    starter,
+                    play_actions,
+                    player_to_play,
+                    hand_pone_is_this_simulation_first_pone,
+                    pone_strategy.estimate_incomplete_game_wins_and_game_points,
+                    dealer_strategy.estimate_incomplete_game_wins_and_game_points,
+                    start_of_hand_position_results_tallies,
+                )
+            if player_to_play_play is None:
+                post_initial_play_is_illegal = True
+                break
+
+            play_actions.append(player_to_play_play)
+            game_player = get_game_player(player_to_play, hand)
+            if isinstance(player_to_play_play, Card):
+                hands[player_to_play].remove(player_to_play_play)
+                # Pairs, 15 or 31 count and run points all go to the same player,
+                # so a single capped add scores them as simulate_game does.
+                play_points = sum(pegging_state.play_card(player_to_play_play))
+                if play_points and game_score.add(
+                    game_player, PointsType.PLAY, Points(play_points)
+                ):
+                    break
+            elif pegging_state.say_go():
+                if game_score.add(game_player, PointsType.PLAY, GO_POINTS):
+                    break
+
+            player_to_play = 1 if player_to_play == 0 else 0
+
+        if post_initial_play_is_illegal or game_score.is_over:
             break
 
-    if (
-        first_pone_dealt_cards
-        and len(first_pone_dealt_cards) > 1
-        and not first_pone_kept_cards
-    ):
-        kept_cards = tuple(first_kept_pone_hand)
-    elif (
-        first_dealer_dealt_cards
-        and len(first_dealer_dealt_cards) > 1
-        and not first_dealer_kept_cards
-    ):
-        kept_cards = tuple(first_kept_dealer_hand)
-    else:
-        kept_cards = tuple()
+        count_hands_and_crib(
+            game_score,
+            hand,
+            1 if player_to_play == 0 else 0,
+            kept_hands,
+            crib_cards,
+            starter,
+            True,
+        )
+        if game_score.is_over:
+            break
 
     return GameSimulationResult(
-        kept_cards,
-        game_score,
+        get_evaluated_kept_cards(
+            first_pone_dealt_cards,
+            first_dealer_dealt_cards,
+            first_pone_kept_cards,
+            first_dealer_kept_cards,
+            first_kept_pone_hand,
+            first_kept_dealer_hand,
+        ),
+        game_score.to_game_score(),
         start_of_hand_scores,
-        not_all_kept_cards_in_kept_hand
-        or non_kept_initial_played_card_played
-        or post_initial_play_is_illegal,
+        not_all_kept_cards_in_kept_hand or post_initial_play_is_illegal,
     )
 
 
@@ -1798,11 +3047,780 @@ class GameScoreResultsTallies(NamedTuple):
             f" {self.first_pone_game_points}-{self.first_dealer_game_points}"
             " game points"
         )
-
-
-Wins = NewType("Wins", int)
-ExpectedWins = NewType("ExpectedWins", float)
-ExpectedGamePoints = NewType("ExpectedGamePoints", float)
+
+
+Wins = NewType("Wins", int)
+ExpectedWins = NewType("ExpectedWins", float)
+ExpectedGamePoints = NewType("ExpectedGamePoints", float)
+
+
+# Seed of one worker's independent random stream, spawned from a run's --seed by
+# hashing it with the worker number: each worker process seeds its own random
+# module with it, so a run repeats exactly for a given seed and worker count
+# while no two workers replay the same games.
+def get_worker_seed(seed: int, worker_number: int) -> int:
+    payload = f"{seed}|worker|{worker_number}".encode("ascii")
+    return int.from_bytes(hashlib.sha256(payload).digest()[:16], "big")
+
+
+def get_kept_including_played_cards(
+    kept_cards: Sequence[Card], player_initial_play_actions: Sequence[PlayAction]
+) -> List[Card]:
+    return list(
+        set(
+            list(kept_cards)
+            + [
+                initial_play_action
+                for initial_play_action in player_initial_play_actions
+                if isinstance(initial_play_action, Card)
+            ]
+        )
+    )
+
+
+# Cycles through possible next actions like itertools.cycle, but exposes its
+# position so that a resumed simulation continues where its checkpoint left off.
+class ResumableCycle:
+    __slots__ = ("actions", "position")
+
+    actions: List[Any]
+    position: int
+
+    def __init__(self, actions: Iterable[Any]):
+        self.actions = list(actions)
+        self.position = 0
+
+    def __iter__(self) -> ResumableCycle:
+        return self
+
+    def __next__(self) -> Any:
+        if not self.actions:
+            raise StopIteration
+        action = self.actions[self.position % len(self.actions)]
+        self.position += 1
+        return action
+
+
+# A worker's simulation state as of its latest statistics update, written
+# atomically so that an interrupted run can resume without losing or double
+# counting games.
+class SimulationCheckpoint(NamedTuple):
+    configuration: Dict[str, Any]
+    worker_number: int
+    worker_count: int
+    game_count: int
+    players_statistics: PlayersStatisticsStore
+    dropped_keeps: Set[Tuple[Card, ...]]
+    dropped_initial_plays: Set[Card]
+    random_state: Tuple[Any, ...]
+    possible_actions_cycle_positions: Tuple[int, ...]
+    game_results_offset: Optional[int]
+
+
+# Exit status of an interrupted simulation, as shells report for Ctrl+C (128 plus
+# SIGINT), so that scripts can tell it apart from a completed run.
+INTERRUPTED_EXIT_STATUS = 130
+
+
+def get_checkpoint_path(directory: str, worker_number: int) -> str:
+    return os.path.join(directory, f"checkpoint.{worker_number}.pickle")
+
+
+def write_simulation_checkpoint(path: str, checkpoint: SimulationCheckpoint):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as checkpoint_file:
+        pickle.dump(checkpoint, checkpoint_file, protocol=pickle.HIGHEST_PROTOCOL)
+        checkpoint_file.flush()
+        os.fsync(checkpoint_file.fileno())
+    os.replace(temporary_path, path)
+
+
+def read_simulation_checkpoint(path: str) -> SimulationCheckpoint:
+    with open(path, "rb") as checkpoint_file:
+        checkpoint = pickle.load(checkpoint_file)
+    if not isinstance(checkpoint, SimulationCheckpoint):
+        raise ValueError(f"{path} is not a simulation checkpoint")
+    return checkpoint
+
+
+# Reads every worker's checkpoint from directory, refusing to resume unless they
+# are exactly the checkpoints of a run with worker_count workers, so that no
+# worker's games are silently dropped.
+def read_resume_checkpoints(
+    directory: str, worker_count: int
+) -> List[SimulationCheckpoint]:
+    checkpoint_file_count = len(
+        glob.glob(os.path.join(glob.escape(directory), "checkpoint.*.pickle"))
+    )
+    if checkpoint_file_count != worker_count:
+        raise ValueError(
+            f"{directory} holds {checkpoint_file_count} worker checkpoints but the"
+            f" process count is {worker_count}"
+        )
+    checkpoints = []
+    for worker_number in range(worker_count):
+        path = get_checkpoint_path(directory, worker_number)
+        checkpoint = read_simulation_checkpoint(path)
+        if (checkpoint.worker_number, checkpoint.worker_count) != (
+            worker_number,
+            worker_count,
+        ):
+            raise ValueError(
+                f"{path} is worker {checkpoint.worker_number} of"
+                f" {checkpoint.worker_count} rather than {worker_number} of"
+                f" {worker_count}"
+            )
+        checkpoints.append(checkpoint)
+    return checkpoints
+
+
+# Prints (if show_statistics_updates) the running players statistics and adds
+# each next action whose statistics are now clearly worse than the best to
+# dropped_keeps or dropped_initial_plays, returning the number of games covered.
+# The games/s rate excludes the restored_game_count games restored from
+# checkpoints rather than simulated since start_time_ns.
+def report_players_statistics(
+    players_statistics: PlayersStatisticsStore,
+    overall_game_count,
+    first_pone_dealt_cards: List[Card],
+    first_dealer_dealt_cards: List[Card],
+    first_pone_kept_including_played_cards: List[Card],
+    first_dealer_kept_including_played_cards: List[Card],
+    dropped_keeps: Set[Tuple[Card, ...]],
+    dropped_initial_plays: Set[Card],
+    show_statistics_updates: bool,
+    confidence_level,
+    start_time_ns,
+    restored_game_count: int = 0,
+) -> int:
+    players_statistics_length = get_length_across_all_keys(players_statistics)
+    if show_statistics_updates:
+        if players_statistics_length > 1:
+            print(
+                f"Mean play statistics {confidence_level}% confidence"
+                " intervals ("
+                f"{formatted_game_count(players_statistics_length, overall_game_count)}"
+                "):"
+            )
+        else:
+            print("Mean play statistics:")
+
+    sorted_players_statistics = sorted(
+        players_statistics.items(),
+        key=lambda item: (
+            item[1]["first_pone_minus_first_dealer_game_points"].mean(),
+            item[1]["first_pone_minus_first_dealer_total_points"].mean(),
+        ),
+        reverse=bool(
+            (len(first_pone_dealt_cards) < len(first_dealer_dealt_cards))
+            or (
+                len(first_pone_kept_including_played_cards)
+                < len(first_dealer_kept_including_played_cards)
+            )
+        ),
+    )
+    for (
+        keep,
+        post_initial,
+    ), keep_stats in sorted_players_statistics:
+        if show_statistics_updates:
+            keep_stats_len = len(keep_stats["first_pone_total_points"])
+            if keep:
+                print(
+                    f"{Hand(keep)} -"
+                    f" {Hand(set(first_pone_dealt_cards or first_dealer_dealt_cards) - set(keep))}"
+                    f" (n={keep_stats_len})",
+                    end="",
+                )
+            if post_initial:
+                print(
+                    f"post-initial play {post_initial}" f" (n={keep_stats_len})",
+                    end="",
+                )
+            if keep or post_initial:
+                print(
+                    f": {get_confidence_interval(keep_stats['first_pone_minus_first_dealer_game_points'], confidence_level)}"
+                    " game points; "
+                    f"{keep_stats['first_pone_minus_first_dealer_play'].mean():+9.5f}"
+                    " Δ-peg + "
+                    f"{keep_stats['first_pone_minus_first_dealer_hand'].mean():+9.5f}"
+                    " Δ-hand + "
+                    f"{keep_stats['first_pone_minus_first_dealer_crib'].mean():+9.5f}"
+                    " crib = "
+                    f"{get_confidence_interval(keep_stats['first_pone_minus_first_dealer_total_points'], confidence_level)}"
+                    " overall"
+                )
+
+        if len(keep_stats["first_pone_minus_first_dealer_game_points"]) > 1:
+            mean_game_points_differential_in_stddevs = get_mean_difference_in_stddevs(
+                keep_stats["first_pone_minus_first_dealer_game_points"],
+                sorted_players_statistics[-1][1][
+                    "first_pone_minus_first_dealer_game_points"
+                ],
+            )
+            mean_total_points_differential_in_stddevs = get_mean_difference_in_stddevs(
+                keep_stats["first_pone_minus_first_dealer_total_points"],
+                sorted_players_statistics[-1][1][
+                    "first_pone_minus_first_dealer_total_points"
+                ],
+            )
+            drop_confidence_level = 2 * get_z_statistic(confidence_level)
+            if (
+                (mean_game_points_differential_in_stddevs > drop_confidence_level)
+                or mean_game_points_differential_in_stddevs == 0
+                and (mean_total_points_differential_in_stddevs > drop_confidence_level)
+            ):
+                if keep:
+                    dropped_keeps.add(tuple(keep))
+                if post_initial:
+                    dropped_initial_plays.add(post_initial)
+
+        if keep not in dropped_keeps and post_initial not in dropped_initial_plays:
+            if show_statistics_updates:
+                print(
+                    "First Pone                    Play  points: "
+                    f"{get_confidence_interval(keep_stats['first_pone_play'], confidence_level)}"
+                )
+                print(
+                    "First Pone                    Hand  points: "
+                    f"{get_confidence_interval(keep_stats['first_pone_hand'], confidence_level)}"
+                )
+                print(
+                    "First Pone                    Crib  points: "
+                    f"{get_confidence_interval(keep_stats['first_pone_crib'], confidence_level)}"
+                )
+                print(
+                    "First Pone                    Total points: "
+                    f"{get_confidence_interval(keep_stats['first_pone_total_points'], confidence_level)}"
+                )
+                print(
+                    "First Pone                    Game  points: "
+                    f"{get_confidence_interval(keep_stats['first_pone_game_points'], confidence_level)}"
+                )
+                print(
+                    "First Pone                    Game  wins  : "
+                    f"{get_confidence_interval(keep_stats['first_pone_wins'], confidence_level)}"
+                )
+                print("-----------------------------------------------------")
+                print(
+                    "First Dealer                  Play  points: "
+                    f"{get_confidence_interval(keep_stats['first_dealer_play'], confidence_level)}"
+                )
+                print(
+                    "First Dealer                  Hand  points: "
+                    f"{get_confidence_interval(keep_stats['first_dealer_hand'], confidence_level)}"
+                )
+                print(
+                    "First Dealer                  Crib  points: "
+                    f"{get_confidence_interval(keep_stats['first_dealer_crib'], confidence_level)}"
+                )
+                print(
+                    "First Dealer                  Total points: "
+                    f"{get_confidence_interval(keep_stats['first_dealer_total_points'], confidence_level)}"
+                )
+                print(
+                    "First Dealer                  Game  points: "
+                    f"{get_confidence_interval(keep_stats['first_dealer_game_points'], confidence_level)}"
+                )
+                print(
+                    "First Dealer                  Game  wins  : "
+                    f"{get_confidence_interval(keep_stats['first_dealer_wins'], confidence_level)}"
+                )
+                print("-----------------------------------------------------")
+                print(
+                    "First Pone minus First Dealer Play  points: "
+                    f"{get_confidence_interval(keep_stats['first_pone_minus_first_dealer_play'], confidence_level)}"
+                )
+                print(
+                    "First Pone minus First Dealer Hand  points: "
+                    f"{get_confidence_interval(keep_stats['first_pone_minus_first_dealer_hand'], confidence_level)}"
+                )
+                print(
+                    "First Pone minus First Dealer Crib  points: "
+                    f"{get_confidence_interval(keep_stats['first_pone_minus_first_dealer_crib'], confidence_level)}"
+                )
+                print(
+                    "First Pone minus First Dealer Total points: "
+                    f"{get_confidence_interval(keep_stats['first_pone_minus_first_dealer_total_points'], confidence_level)}"
+                )
+                print(
+                    "First Pone minus First Dealer Game  points: "
+                    f"{get_confidence_interval(keep_stats['first_pone_minus_first_dealer_game_points'], confidence_level)}"
+                )
+
+    if show_statistics_updates and start_time_ns is not None:
+        print(
+            f"Simulated {players_statistics_length} games at "
+            f"{simulation_performance_statistics(start_time_ns, players_statistics_length - restored_game_count)}"
+        )
+
+    return players_statistics_length
+
+
+# Parent side of a multi-process run: workers accumulate their statistics
+# locally and queue only the delta since their previous update, which this
+# merges into players_statistics and reports until every worker has queued its
+# final None.  Next actions dropped based on the pooled statistics are queued
+# back to every worker on dropped_next_actions_queues, so that workers stop
+# simulating them, and stop altogether once one option remains, as soon as all
+# workers' samples together tell the options apart.
+def reduce_players_statistics_deltas(
+    players_statistics_queue: Queue,
+    worker_count: int,
+    players_statistics: PlayersStatisticsStore,
+    overall_game_count,
+    first_pone_dealt_cards: List[Card],
+    first_dealer_dealt_cards: List[Card],
+    first_pone_kept_including_played_cards: List[Card],
+    first_dealer_kept_including_played_cards: List[Card],
+    confidence_level,
+    start_time_ns,
+    restored_game_count: int = 0,
+    dropped_next_actions_queues: Sequence[Queue] = (),
+):
+    dropped_keeps: Set[Tuple[Card, ...]] = set()
+    dropped_initial_plays: Set[Card] = set()
+    dropped_next_action_count = 0
+    finished_worker_count = 0
+    while finished_worker_count < worker_count:
+        players_statistics_delta: Optional[PlayersStatisticsStore] = (
+            players_statistics_queue.get()
+        )
+        if players_statistics_delta is None:
+            finished_worker_count += 1
+            continue
+        players_statistics.merge(players_statistics_delta)
+        report_players_statistics(
+            players_statistics,
+            overall_game_count,
+            first_pone_dealt_cards,
+            first_dealer_dealt_cards,
+            first_pone_kept_including_played_cards,
+            first_dealer_kept_including_played_cards,
+            dropped_keeps,
+            dropped_initial_plays,
+            True,
+            confidence_level,
+            start_time_ns,
+            restored_game_count,
+        )
+        if len(dropped_keeps) + len(dropped_initial_plays) > dropped_next_action_count:
+            dropped_next_action_count = len(dropped_keeps) + len(dropped_initial_plays)
+            for dropped_next_actions_queue in dropped_next_actions_queues:
+                dropped_next_actions_queue.put(
+                    (set(dropped_keeps), set(dropped_initial_plays))
+                )
+
+
+# Worker side of a multi-process run: adds the next actions which the parent has
+# dropped since the worker's previous update to dropped_keeps and
+# dropped_initial_plays.
+def receive_dropped_next_actions(
+    dropped_next_actions_queue: Queue,
+    dropped_keeps: Set[Tuple[Card, ...]],
+    dropped_initial_plays: Set[Card],
+):
+    while True:
+        try:
+            parent_dropped_keeps, parent_dropped_initial_plays = (
+                dropped_next_actions_queue.get_nowait()
+            )
+        except Empty:
+            return
+        dropped_keeps.update(parent_dropped_keeps)
+        dropped_initial_plays.update(parent_dropped_initial_plays)
+
+
+# Per-game results are optionally logged by each worker to its own file so that
+# a bulk run can be reaggregated offline rather than rerun.  The file starts with
+# GAME_RESULTS_MAGIC, the format version and the byte length of a JSON header
+# describing the run (worker seed, strategies and columns), followed by batches
+# of a row count and then each GAME_RESULTS_COLUMNS column's little-endian values.
+GAME_RESULTS_MAGIC = b"CRIBGAME"
+GAME_RESULTS_FORMAT_VERSION = 1
+GAME_RESULTS_HEADER = struct.Struct("<8sII")
+GAME_RESULTS_BATCH_HEADER = struct.Struct("<I")
+NO_CARD_ID = -1
+GAME_RESULTS_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    *((f"kept_card_id_{number}", "b") for number in range(KEPT_CARDS_LEN)),
+    ("post_initial_play_card_id", "b"),
+    ("hand_count", "h"),
+    ("first_pone_play", "h"),
+    ("first_pone_hand", "h"),
+    ("first_pone_crib", "h"),
+    ("first_pone_final_score", "h"),
+    ("first_pone_game_points", "d"),
+    ("first_pone_wins", "d"),
+    ("first_dealer_play", "h"),
+    ("first_dealer_hand", "h"),
+    ("first_dealer_crib", "h"),
+    ("first_dealer_final_score", "h"),
+    ("first_dealer_game_points", "d"),
+    ("first_dealer_wins", "d"),
+)
+
+
+class GameResultsLog:
+    __slots__ = ("game_results_file", "columns")
+
+    columns: List[array[Any]]
+
+    def __init__(
+        self, path: str, header: Dict[str, Any], resume_offset: Optional[int] = None
+    ):
+        self.columns = [array(typecode) for _, typecode in GAME_RESULTS_COLUMNS]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # pylint: disable-next=consider-using-with
+        self.game_results_file = open(path, "w+b" if resume_offset is None else "r+b")
+        if resume_offset is not None:
+            # Drop any batches written after the checkpoint being resumed from.
+            self.game_results_file.truncate(resume_offset)
+            self.game_results_file.seek(resume_offset)
+            return
+        header_json = json.dumps(
+            {**header, "columns": [list(column) for column in GAME_RESULTS_COLUMNS]}
+        ).encode("utf-8")
+        self.game_results_file.write(
+            GAME_RESULTS_HEADER.pack(
+                GAME_RESULTS_MAGIC, GAME_RESULTS_FORMAT_VERSION, len(header_json)
+            )
+            + header_json
+        )
+
+    # Appends one game's values, in GAME_RESULTS_COLUMNS order after the next
+    # action, to the current batch.
+    def append(self, next_action: NextAction, values: Sequence[float]):
+        kept_cards, post_initial_play = next_action
+        kept_card_ids = [card_id(card) for card in kept_cards]
+        for column, value in zip(
+            self.columns,
+            itertools.chain(
+                kept_card_ids,
+                [NO_CARD_ID] * (KEPT_CARDS_LEN - len(kept_card_ids)),
+                [
+                    (
+                        card_id(post_initial_play)
+                        if post_initial_play is not None
+                        else NO_CARD_ID
+                    )
+                ],
+                values,
+            ),
+        ):
+            column.append(value)
+
+    def flush(self):
+        # An interrupted append leaves a partial row, which is not written.
+        row_count = min(len(column) for column in self.columns)
+        if not row_count:
+            return
+        self.game_results_file.write(GAME_RESULTS_BATCH_HEADER.pack(row_count))
+        for number, column in enumerate(self.columns):
+            del column[row_count:]
+            if sys.byteorder == "big":
+                column.byteswap()
+            self.game_results_file.write(column.tobytes())
+            self.columns[number] = array(column.typecode)
+        self.game_results_file.flush()
+
+    def tell(self) -> int:
+        return self.game_results_file.tell()
+
+    def close(self):
+        self.flush()
+        self.game_results_file.close()
+
+
+def read_game_results(path: str) -> Tuple[Dict[str, Any], Dict[str, array]]:
+    with open(path, "rb") as game_results_file:
+        data = game_results_file.read()
+    magic, format_version, header_length = GAME_RESULTS_HEADER.unpack_from(data)
+    if magic != GAME_RESULTS_MAGIC or format_version != GAME_RESULTS_FORMAT_VERSION:
+        raise ValueError(
+            f"{path} is not a version {GAME_RESULTS_FORMAT_VERSION}"
+            " game results file"
+        )
+    offset = GAME_RESULTS_HEADER.size + header_length
+    header = json.loads(data[GAME_RESULTS_HEADER.size : offset])
+    columns = {name: array(typecode) for name, typecode in header["columns"]}
+    while offset < len(data):
+        (row_count,) = GAME_RESULTS_BATCH_HEADER.unpack_from(data, offset)
+        offset += GAME_RESULTS_BATCH_HEADER.size
+        for column in columns.values():
+            length = row_count * column.itemsize
+            batch = array(column.typecode, data[offset : offset + length])
+            if sys.byteorder == "big":
+                batch.byteswap()
+            column.extend(batch)
+            offset += length
+    return header, columns
+
+
+# Rebuilds the players statistics of the games logged to paths, as simulate_games
+# would have accumulated them.
+def read_game_results_players_statistics(
+    paths: Iterable[str],
+) -> PlayersStatisticsStore:
+    players_statistics = PlayersStatisticsStore()
+    for path in paths:
+        _, columns = read_game_results(path)
+        for row in zip(*columns.values()):
+            kept_card_ids = row[:KEPT_CARDS_LEN]
+            (
+                post_initial_play_card_id,
+                _,
+                first_pone_play,
+                first_pone_hand,
+                first_pone_crib,
+                _,
+                first_pone_game_points,
+                first_pone_wins,
+                first_dealer_play,
+                first_dealer_hand,
+                first_dealer_crib,
+                _,
+                first_dealer_game_points,
+                first_dealer_wins,
+            ) = row[KEPT_CARDS_LEN:]
+            first_pone_total_points = (
+                first_pone_play + first_pone_hand + first_pone_crib
+            )
+            first_dealer_total_points = (
+                first_dealer_play + first_dealer_hand + first_dealer_crib
+            )
+            players_statistics.push(
+                (
+                    tuple(
+                        card_from_id(CardId(kept_card_id))
+                        for kept_card_id in kept_card_ids
+                        if kept_card_id != NO_CARD_ID
+                    ),
+                    (
+                        card_from_id(CardId(post_initial_play_card_id))
+                        if post_initial_play_card_id != NO_CARD_ID
+                        else None
+                    ),
+                ),
+                (
+                    first_pone_play,
+                    first_pone_hand,
+                    first_pone_crib,
+                    first_pone_total_points,
+                    first_pone_game_points,
+                    first_pone_wins,
+                    first_dealer_play,
+                    first_dealer_hand,
+                    first_dealer_crib,
+                    first_dealer_total_points,
+                    first_dealer_game_points,
+                    first_dealer_wins,
+                    first_pone_play - first_dealer_play,
+                    first_pone_hand - first_dealer_hand,
+                    first_pone_crib - first_dealer_crib,
+                    first_pone_total_points - first_dealer_total_points,
+                    first_pone_game_points - first_dealer_game_points,
+                ),
+            )
+    return players_statistics
+
+
+# Simulation options that determine what a run's statistics measure, as
+# recorded in game results logs, checkpoints and statistics snapshots.
+def get_simulation_configuration(
+    maximum_hands_per_game: int,
+    initial_first_pone_score: Points,
+    initial_first_dealer_score: Points,
+    first_pone_dealt_cards: List[Card],
+    first_dealer_dealt_cards: List[Card],
+    first_pone_kept_including_played_cards: List[Card],
+    first_dealer_kept_including_played_cards: List[Card],
+    initial_starter: Optional[Card],
+    initial_play_actions: List[PlayAction],
+    first_pone_select_kept_cards,
+    first_pone_discard_based_on_simulations: Optional[int],
+    first_pone_select_each_possible_kept_hand: bool,
+    first_dealer_select_kept_cards,
+    first_dealer_discard_based_on_simulations: Optional[int],
+    first_dealer_select_each_possible_kept_hand: bool,
+    first_pone_select_play: PlaySelector,
+    first_pone_play_based_on_simulations: Optional[int],
+    first_dealer_select_play: PlaySelector,
+    first_dealer_play_based_on_simulations: Optional[int],
+    estimate_first_pone_incomplete_game_wins_and_game_points: bool,
+    estimate_first_dealer_incomplete_game_wins_and_game_points: bool,
+    select_each_post_initial_play: bool,
+) -> Dict[str, Any]:
+    return {
+        "maximum_hands_per_game": maximum_hands_per_game,
+        "initial_first_pone_score": initial_first_pone_score,
+        "initial_first_dealer_score": initial_first_dealer_score,
+        "first_pone_dealt_cards": [str(card) for card in first_pone_dealt_cards],
+        "first_dealer_dealt_cards": [str(card) for card in first_dealer_dealt_cards],
+        "first_pone_kept_cards": [
+            str(card) for card in first_pone_kept_including_played_cards
+        ],
+        "first_dealer_kept_cards": [
+            str(card) for card in first_dealer_kept_including_played_cards
+        ],
+        "initial_starter": str(initial_starter) if initial_starter else None,
+        "initial_play_actions": [
+            str(initial_play_action) for initial_play_action in initial_play_actions
+        ],
+        "first_pone_select_kept_cards": first_pone_select_kept_cards.__name__,
+        "first_pone_discard_based_on_simulations": (
+            first_pone_discard_based_on_simulations
+        ),
+        "first_pone_select_each_possible_kept_hand": (
+            first_pone_select_each_possible_kept_hand
+        ),
+        "first_dealer_select_kept_cards": first_dealer_select_kept_cards.__name__,
+        "first_dealer_discard_based_on_simulations": (
+            first_dealer_discard_based_on_simulations
+        ),
+        "first_dealer_select_each_possible_kept_hand": (
+            first_dealer_select_each_possible_kept_hand
+        ),
+        "first_pone_select_play": first_pone_select_play.__name__,
+        "first_pone_play_based_on_simulations": first_pone_play_based_on_simulations,
+        "first_dealer_select_play": first_dealer_select_play.__name__,
+        "first_dealer_play_based_on_simulations": (
+            first_dealer_play_based_on_simulations
+        ),
+        "estimate_first_pone_incomplete_game_wins_and_game_points": (
+            estimate_first_pone_incomplete_game_wins_and_game_points
+        ),
+        "estimate_first_dealer_incomplete_game_wins_and_game_points": (
+            estimate_first_dealer_incomplete_game_wins_and_game_points
+        ),
+        "select_each_post_initial_play": select_each_post_initial_play,
+    }
+
+
+def get_configuration_fingerprint(configuration: Dict[str, Any]) -> str:
+    return hashlib.sha256(
+        json.dumps(configuration, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+# Statistics snapshots are self-describing JSON files holding a run's
+# configuration, its fingerprint and each next action's count, mean, sum of
+# squared deviations, minimum and maximum per players statistic, so that the
+# snapshots of independent runs of one configuration, on any host, can be merged
+# into exactly the statistics of a single run of all their games.
+STATISTICS_SNAPSHOT_FORMAT_VERSION = 1
+
+
+def write_statistics_snapshot(
+    path: str,
+    configuration: Dict[str, Any],
+    players_statistics: PlayersStatisticsStore,
+):
+    next_actions = []
+    for next_action_id, (kept_cards, post_initial_play) in enumerate(
+        players_statistics.next_actions
+    ):
+        index = next_action_id * PLAYERS_STATISTIC_COUNT
+        next_actions.append(
+            {
+                "kept_cards": [str(card) for card in kept_cards],
+                "post_initial_play": (
+                    str(post_initial_play) if post_initial_play is not None else None
+                ),
+                "count": players_statistics.counts[next_action_id],
+                "statistics": {
+                    players_statistic: {
+                        "mean": players_statistics.means[index + statistic_index],
+                        "m2": players_statistics.m2s[index + statistic_index],
+                        "minimum": players_statistics.minimums[index + statistic_index],
+                        "maximum": players_statistics.maximums[index + statistic_index],
+                    }
+                    for statistic_index, players_statistic in enumerate(
+                        PLAYERS_STATISTICS
+                    )
+                },
+            }
+        )
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as snapshot_file:
+        json.dump(
+            {
+                "format_version": STATISTICS_SNAPSHOT_FORMAT_VERSION,
+                "configuration": configuration,
+                "configuration_fingerprint": get_configuration_fingerprint(
+                    configuration
+                ),
+                "game_count": players_statistics.game_count(),
+                "next_actions": next_actions,
+            },
+            snapshot_file,
+            indent=2,
+        )
+    os.replace(temporary_path, path)
+
+
+def read_statistics_snapshot(
+    path: str,
+) -> Tuple[Dict[str, Any], PlayersStatisticsStore]:
+    with open(path, encoding="utf-8") as snapshot_file:
+        snapshot = json.load(snapshot_file)
+    if snapshot.get("format_version") != STATISTICS_SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(
+            f"{path} is not a version {STATISTICS_SNAPSHOT_FORMAT_VERSION}"
+            " statistics snapshot"
+        )
+    players_statistics = PlayersStatisticsStore()
+    for snapshot_next_action in snapshot["next_actions"]:
+        next_action_id = players_statistics.next_action_id(
+            (
+                tuple(
+                    Card.from_string(card)
+                    for card in snapshot_next_action["kept_cards"]
+                ),
+                (
+                    Card.from_string(snapshot_next_action["post_initial_play"])
+                    if snapshot_next_action["post_initial_play"] is not None
+                    else None
+                ),
+            )
+        )
+        players_statistics.counts[next_action_id] = snapshot_next_action["count"]
+        index = next_action_id * PLAYERS_STATISTIC_COUNT
+        for statistic_index, players_statistic in enumerate(PLAYERS_STATISTICS):
+            statistic = snapshot_next_action["statistics"][players_statistic]
+            players_statistics.means[index + statistic_index] = statistic["mean"]
+            players_statistics.m2s[index + statistic_index] = statistic["m2"]
+            players_statistics.minimums[index + statistic_index] = statistic["minimum"]
+            players_statistics.maximums[index + statistic_index] = statistic["maximum"]
+    return snapshot["configuration"], players_statistics
+
+
+# Merges the statistics snapshots at paths, which must all share one
+# configuration fingerprint, returning that configuration and the pooled
+# statistics.
+def merge_statistics_snapshots(
+    paths: Sequence[str],
+) -> Tuple[Dict[str, Any], PlayersStatisticsStore]:
+    merged_configuration: Optional[Dict[str, Any]] = None
+    merged_players_statistics = PlayersStatisticsStore()
+    for path in paths:
+        configuration, players_statistics = read_statistics_snapshot(path)
+        if merged_configuration is None:
+            merged_configuration = configuration
+        elif get_configuration_fingerprint(
+            configuration
+        ) != get_configuration_fingerprint(merged_configuration):
+            raise ValueError(
+                f"{path} was simulated with a different configuration than {paths[0]}"
+            )
+        merged_players_statistics.merge(players_statistics)
+    if merged_configuration is None:
+        raise ValueError("No statistics snapshots to merge")
+    return merged_configuration, merged_players_statistics
 
 
 def simulate_games(
@@ -1817,8 +3835,7 @@ def simulate_games(
     first_dealer_kept_cards: Sequence[Card],
     initial_starter: Optional[Card],
     initial_play_actions: List[PlayAction],
-    players_statistics: DictProxy[NextAction, Statistics],
-    players_statistics_lock,
+    players_statistics: PlayersStatisticsStore,
     first_pone_select_kept_cards,
     first_pone_discard_based_on_simulations: Optional[int],
     first_pone_select_each_possible_kept_hand: bool,
@@ -1845,7 +3862,20 @@ def simulate_games(
     confidence_level,
     start_time_ns,
     show_calc_cache_usage_stats: bool,
+    calc_cache_usage_stats_directory: Optional[str] = None,
+    worker_seed: Optional[int] = None,
+    players_statistics_queue: Optional[Queue] = None,
+    game_results_path: Optional[str] = None,
+    checkpoint_path: Optional[str] = None,
+    resume_checkpoint: Optional[SimulationCheckpoint] = None,
+    worker_number: int = 0,
+    worker_count: int = 1,
+    dropped_next_actions_queue: Optional[Queue] = None,
 ):
+    if worker_seed is not None:
+        random.seed(worker_seed)
+    game_results_log: Optional[GameResultsLog] = None
+
     assert (
         len(set(first_pone_dealt_cards + list(first_pone_kept_cards)))
         <= DEALT_CARDS_LEN
@@ -1865,18 +3895,13 @@ def simulate_games(
     )
 
     try:
-        if show_calc_cache_usage_stats:
-            expected_random_opponent_discard_crib_points_cache.stats()
-
-        first_pone_kept_including_played_cards = list(
-            set(
-                list(first_pone_kept_cards)
-                + [
-                    initial_play_action
-                    for initial_play_action in initial_play_actions[0::2]
-                    if isinstance(initial_play_action, Card)
-                ]
-            )
+        if expected_random_opponent_discard_crib_points_cache is not None and (
+            show_calc_cache_usage_stats or calc_cache_usage_stats_directory
+        ):
+            expected_random_opponent_discard_crib_points_cache.stats(enable=True)
+
+        first_pone_kept_including_played_cards = get_kept_including_played_cards(
+            first_pone_kept_cards, initial_play_actions[0::2]
         )
         assert len(first_pone_kept_including_played_cards) <= KEPT_CARDS_LEN, (
             f"No more than {KEPT_CARDS_LEN} directly or play specified first pone"
@@ -1884,15 +3909,8 @@ def simulate_games(
             f" ({Hand(first_pone_kept_including_played_cards)}) specified"
         )
 
-        first_dealer_kept_including_played_cards = list(
-            set(
-                list(first_dealer_kept_cards)
-                + [
-                    initial_play_action
-                    for initial_play_action in initial_play_actions[1::2]
-                    if isinstance(initial_play_action, Card)
-                ]
-            )
+        first_dealer_kept_including_played_cards = get_kept_including_played_cards(
+            first_dealer_kept_cards, initial_play_actions[1::2]
         )
         assert len(first_dealer_kept_including_played_cards) <= KEPT_CARDS_LEN, (
             f"No more than {KEPT_CARDS_LEN} directly or play specified first dealer"
@@ -1913,55 +3931,120 @@ def simulate_games(
             )
         ]
 
-        first_pone_play_statistics: Dict[NextAction, Statistics] = {}
-        first_pone_hand_statistics: Dict[NextAction, Statistics] = {}
-        first_pone_crib_statistics: Dict[NextAction, Statistics] = {}
-        overall_first_pone_points_statistics: Dict[NextAction, Statistics] = {}
-        first_pone_game_points_statistics: Dict[NextAction, Statistics] = {}
-        first_pone_wins_statistics: Dict[NextAction, Statistics] = {}
-        first_dealer_play_statistics: Dict[NextAction, Statistics] = {}
-        first_dealer_hand_statistics: Dict[NextAction, Statistics] = {}
-        first_dealer_crib_statistics: Dict[NextAction, Statistics] = {}
-        overall_first_dealer_points_statistics: Dict[NextAction, Statistics] = {}
-        first_dealer_game_points_statistics: Dict[NextAction, Statistics] = {}
-        first_dealer_wins_statistics: Dict[NextAction, Statistics] = {}
-        first_pone_minus_first_dealer_play_statistics: Dict[NextAction, Statistics] = {}
-        first_pone_minus_first_dealer_hand_statistics: Dict[NextAction, Statistics] = {}
-        first_pone_minus_first_dealer_crib_statistics: Dict[NextAction, Statistics] = {}
-        first_pone_minus_first_dealer_total_points_statistics: Dict[
-            NextAction, Statistics
-        ] = {}
-        first_pone_minus_first_dealer_game_points_statistics: Dict[
-            NextAction, Statistics
-        ] = {}
+        players_statistics_delta = PlayersStatisticsStore()
+        simulation_configuration: Dict[str, Any] = (
+            {
+                "worker_seed": worker_seed,
+                **get_simulation_configuration(
+                    maximum_hands_per_game,
+                    initial_first_pone_score,
+                    initial_first_dealer_score,
+                    first_pone_dealt_cards,
+                    first_dealer_dealt_cards,
+                    first_pone_kept_including_played_cards,
+                    first_dealer_kept_including_played_cards,
+                    initial_starter,
+                    initial_play_actions,
+                    first_pone_select_kept_cards,
+                    first_pone_discard_based_on_simulations,
+                    first_pone_select_each_possible_kept_hand,
+                    first_dealer_select_kept_cards,
+                    first_dealer_discard_based_on_simulations,
+                    first_dealer_select_each_possible_kept_hand,
+                    first_pone_select_play,
+                    first_pone_play_based_on_simulations,
+                    first_dealer_select_play,
+                    first_dealer_play_based_on_simulations,
+                    estimate_first_pone_incomplete_game_wins_and_game_points,
+                    estimate_first_dealer_incomplete_game_wins_and_game_points,
+                    select_each_post_initial_play,
+                ),
+            }
+            if game_results_path or checkpoint_path or resume_checkpoint
+            else {}
+        )
+        if (
+            resume_checkpoint is not None
+            and resume_checkpoint.configuration != simulation_configuration
+        ):
+            raise ValueError(
+                "Cannot resume from a checkpoint of a differently configured"
+                f" simulation: {resume_checkpoint.configuration}"
+            )
+        if resume_checkpoint is not None and (
+            resume_checkpoint.worker_number,
+            resume_checkpoint.worker_count,
+        ) != (worker_number, worker_count):
+            raise ValueError(
+                f"Cannot resume worker {worker_number} of {worker_count} from the"
+                f" checkpoint of worker {resume_checkpoint.worker_number} of"
+                f" {resume_checkpoint.worker_count}"
+            )
+        if game_results_path:
+            game_results_log = GameResultsLog(
+                game_results_path,
+                simulation_configuration,
+                resume_checkpoint.game_results_offset if resume_checkpoint else None,
+            )
 
         pone_dealt_cards_possible_keeps = list(
             itertools.combinations(first_pone_dealt_cards, KEPT_CARDS_LEN)
         )
-        pone_dealt_cards_possible_keeps_cycle = itertools.cycle(
+        pone_dealt_cards_possible_keeps_cycle = ResumableCycle(
             pone_dealt_cards_possible_keeps
         )
         dealer_dealt_cards_possible_keeps = list(
             itertools.combinations(first_dealer_dealt_cards, KEPT_CARDS_LEN)
         )
-        dealer_dealt_cards_possible_keeps_cycle = itertools.cycle(
+        dealer_dealt_cards_possible_keeps_cycle = ResumableCycle(
             dealer_dealt_cards_possible_keeps
         )
         dropped_keeps: Set[Tuple[Card, ...]] = set()
         pone_kept_cards_possible_plays_cycle = (
-            itertools.cycle(first_pone_kept_including_played_cards)
+            ResumableCycle(first_pone_kept_including_played_cards)
             if first_pone_kept_including_played_cards and select_each_post_initial_play
             else None
         )
         dealer_kept_cards_possible_plays_cycle = (
-            itertools.cycle(first_dealer_kept_including_played_cards)
+            ResumableCycle(first_dealer_kept_including_played_cards)
             if first_dealer_kept_including_played_cards
             and select_each_post_initial_play
             else None
         )
-        dropped_initial_plays = set()
+        dropped_initial_plays: Set[Card] = set()
+        possible_actions_cycles = (
+            pone_dealt_cards_possible_keeps_cycle,
+            dealer_dealt_cards_possible_keeps_cycle,
+            pone_kept_cards_possible_plays_cycle,
+            dealer_kept_cards_possible_plays_cycle,
+        )
+        first_game = 0
+        if resume_checkpoint is not None:
+            # A resumed worker continues from its own checkpointed statistics,
+            # random state and possible action cycles.
+            players_statistics = resume_checkpoint.players_statistics
+            dropped_keeps.update(resume_checkpoint.dropped_keeps)
+            dropped_initial_plays.update(resume_checkpoint.dropped_initial_plays)
+            random.setstate(resume_checkpoint.random_state)
+            for possible_actions_cycle, position in zip(
+                possible_actions_cycles,
+                resume_checkpoint.possible_actions_cycle_positions,
+            ):
+                if possible_actions_cycle is not None:
+                    possible_actions_cycle.position = position
+            first_game = resume_checkpoint.game_count
         post_initial_player = len(initial_play_actions) % 2
-        for game in range(process_game_count):
+        headless: bool = (
+            hide_first_pone_hands
+            and hide_first_dealer_hands
+            and hide_play_actions
+            and keep_user_selected
+            not in (first_pone_select_kept_cards, first_dealer_select_kept_cards)
+            and play_user_selected
+            not in (first_pone_select_play, first_dealer_select_play)
+        )
+        for game in range(first_game, process_game_count):
+            enforce_calc_cache_memory_ceiling()
             post_initial_play: Optional[Card] = None
             game_simulation_result: Optional[GameSimulationResult] = None
             while (
@@ -1987,41 +4070,73 @@ def simulate_games(
                     ):
                         post_initial_play = next(dealer_kept_cards_possible_plays_cycle)
 
-                game_simulation_result = simulate_game(
-                    first_pone_dealt_cards,
-                    first_dealer_dealt_cards,
-                    deck_less_fixed_cards,
-                    first_pone_kept_including_played_cards,
-                    first_dealer_kept_including_played_cards,
-                    initial_starter,
-                    maximum_hands_per_game,
-                    first_pone_select_kept_cards,
-                    first_pone_discard_based_on_simulations,
-                    first_pone_select_each_possible_kept_hand,
-                    first_dealer_select_kept_cards,
-                    first_dealer_discard_based_on_simulations,
-                    first_dealer_select_each_possible_kept_hand,
-                    first_pone_select_play,
-                    first_pone_play_based_on_simulations,
-                    first_dealer_select_play,
-                    first_dealer_play_based_on_simulations,
-                    coach_discard_simulated_hand_count,
-                    coach_play_simulated_hand_count,
-                    tally_start_of_hand_position_results,
-                    estimate_first_pone_incomplete_game_wins_and_game_points,
-                    estimate_first_dealer_incomplete_game_wins_and_game_points,
-                    start_of_hand_position_results_tallies,
-                    hide_first_pone_hands,
-                    hide_first_dealer_hands,
-                    pone_dealt_cards_possible_keeps_cycle,
-                    dealer_dealt_cards_possible_keeps_cycle,
-                    dropped_keeps,
-                    initial_first_pone_score,
-                    initial_first_dealer_score,
-                    post_initial_play,
-                    initial_play_actions,
-                    hide_play_actions,
-                )
+                if headless:
+                    game_simulation_result = simulate_headless_game(
+                        first_pone_dealt_cards,
+                        first_dealer_dealt_cards,
+                        deck_less_fixed_cards,
+                        first_pone_kept_including_played_cards,
+                        first_dealer_kept_including_played_cards,
+                        initial_starter,
+                        maximum_hands_per_game,
+                        first_pone_select_kept_cards,
+                        first_pone_discard_based_on_simulations,
+                        first_pone_select_each_possible_kept_hand,
+                        first_dealer_select_kept_cards,
+                        first_dealer_discard_based_on_simulations,
+                        first_dealer_select_each_possible_kept_hand,
+                        first_pone_select_play,
+                        first_pone_play_based_on_simulations,
+                        first_dealer_select_play,
+                        first_dealer_play_based_on_simulations,
+                        tally_start_of_hand_position_results,
+                        estimate_first_pone_incomplete_game_wins_and_game_points,
+                        estimate_first_dealer_incomplete_game_wins_and_game_points,
+                        start_of_hand_position_results_tallies,
+                        pone_dealt_cards_possible_keeps_cycle,
+                        dealer_dealt_cards_possible_keeps_cycle,
+                        dropped_keeps,
+                        initial_first_pone_score,
+                        initial_first_dealer_score,
+                        post_initial_play,
+                        initial_play_actions,
+                    )
+                else:
+                    game_simulation_result = simulate_game(
+                        first_pone_dealt_cards,
+                        first_dealer_dealt_cards,
+                        deck_less_fixed_cards,
+                        first_pone_kept_including_played_cards,
+                        first_dealer_kept_including_played_cards,
+                        initial_starter,
+                        maximum_hands_per_game,
+                        first_pone_select_kept_cards,
+                        first_pone_discard_based_on_simulations,
+                        first_pone_select_each_possible_kept_hand,
+                        first_dealer_select_kept_cards,
+                        first_dealer_discard_based_on_simulations,
+                        first_dealer_select_each_possible_kept_hand,
+                        first_pone_select_play,
+                        first_pone_play_based_on_simulations,
+                        first_dealer_select_play,
+                        first_dealer_play_based_on_simulations,
+                        coach_discard_simulated_hand_count,
+                        coach_play_simulated_hand_count,
+                        tally_start_of_hand_position_results,
+                        estimate_first_pone_incomplete_game_wins_and_game_points,
+                        estimate_first_dealer_incomplete_game_wins_and_game_points,
+                        start_of_hand_position_results_tallies,
+                        hide_first_pone_hands,
+                        hide_first_dealer_hands,
+                        pone_dealt_cards_possible_keeps_cycle,
+                        dealer_dealt_cards_possible_keeps_cycle,
+                        dropped_keeps,
+                        initial_first_pone_score,
+                        initial_first_dealer_score,
+                        post_initial_play,
+                        initial_play_actions,
+                        hide_play_actions,
+                    )
 
             first_pone_total_points = Points(
                 game_simulation_result.score.first_pone_play
@@ -2177,475 +4292,160 @@ def simulate_games(
             )
             possibly_estimated_first_dealer_game_points: Union[
                 GamePoints, ExpectedGamePoints
-            ] = (
-                first_dealer_expected_game_points
-                if first_dealer_expected_game_points is not None
-                else first_dealer_game_points
-            )
-            if not hide_play_actions:
-                print(
-                    "+++ Score at end of game simulation: ["
-                    f"{initial_first_pone_score + first_pone_total_points}"
-                    f"-{initial_first_dealer_score + first_dealer_total_points}]"
-                    " for first pone and first dealer."
-                )
-                print(
-                    "### Game points at end of game simulation: [["
-                    f"{possibly_estimated_first_pone_game_points:7.5f}"
-                    f"-{possibly_estimated_first_dealer_game_points:7.5f}]]"
-                    " for pone and dealer."
-                )
-                print()
-
-            # TODO: used namedtuple
-            statistics_push(
-                first_pone_play_statistics,
-                next_action,
-                game_simulation_result.score.first_pone_play,
-            )
-            statistics_push(
-                first_pone_hand_statistics,
-                next_action,
-                game_simulation_result.score.first_pone_hand,
-            )
-            statistics_push(
-                first_pone_crib_statistics,
-                next_action,
-                game_simulation_result.score.first_pone_crib,
-            )
-            statistics_push(
-                overall_first_pone_points_statistics,
-                next_action,
-                first_pone_total_points,
-            )
-            statistics_push(
-                first_pone_game_points_statistics,
-                next_action,
-                possibly_estimated_first_pone_game_points,
-            )
-            statistics_push(
-                first_pone_wins_statistics,
-                next_action,
-                (
-                    first_pone_expected_wins
-                    if first_pone_expected_wins is not None
-                    else first_pone_wins
-                ),
-            )
-
-            statistics_push(
-                first_dealer_play_statistics,
-                next_action,
-                game_simulation_result.score.first_dealer_play,
-            )
-            statistics_push(
-                first_dealer_hand_statistics,
-                next_action,
-                game_simulation_result.score.first_dealer_hand,
-            )
-            statistics_push(
-                first_dealer_crib_statistics,
-                next_action,
-                game_simulation_result.score.first_dealer_crib,
-            )
-            statistics_push(
-                overall_first_dealer_points_statistics,
-                next_action,
-                first_dealer_total_points,
-            )
-            statistics_push(
-                first_dealer_game_points_statistics,
-                next_action,
-                possibly_estimated_first_dealer_game_points,
-            )
-            statistics_push(
-                first_dealer_wins_statistics,
-                next_action,
-                (
-                    first_dealer_expected_wins
-                    if first_dealer_expected_wins is not None
-                    else first_dealer_wins
-                ),
-            )
-
-            statistics_push(
-                first_pone_minus_first_dealer_play_statistics,
-                next_action,
-                Points(
-                    game_simulation_result.score.first_pone_play
-                    - game_simulation_result.score.first_dealer_play
-                ),
-            )
-            statistics_push(
-                first_pone_minus_first_dealer_hand_statistics,
-                next_action,
-                Points(
-                    game_simulation_result.score.first_pone_hand
-                    - game_simulation_result.score.first_dealer_hand
-                ),
-            )
-            statistics_push(
-                first_pone_minus_first_dealer_crib_statistics,
-                next_action,
-                Points(
-                    game_simulation_result.score.first_pone_crib
-                    - game_simulation_result.score.first_dealer_crib
-                ),
-            )
-            statistics_push(
-                first_pone_minus_first_dealer_total_points_statistics,
-                next_action,
-                Points(first_pone_total_points - first_dealer_total_points),
-            )
-            statistics_push(
-                first_pone_minus_first_dealer_game_points_statistics,
-                next_action,
-                ExpectedGamePoints(
-                    possibly_estimated_first_pone_game_points
-                    - possibly_estimated_first_dealer_game_points
-                ),
-            )
-
-            if (
-                game % games_per_update == games_per_update - 1
-                or game == process_game_count - 1
-            ):
-                players_statistics_lock.acquire()
-
-                statistics_dict_add(
-                    players_statistics, "first_pone_play", first_pone_play_statistics
-                )
-                first_pone_play_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics, "first_pone_hand", first_pone_hand_statistics
-                )
-                first_pone_hand_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics, "first_pone_crib", first_pone_crib_statistics
-                )
-                first_pone_crib_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics,
-                    "first_pone_total_points",
-                    overall_first_pone_points_statistics,
-                )
-                overall_first_pone_points_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics,
-                    "first_pone_game_points",
-                    first_pone_game_points_statistics,
-                )
-                first_pone_game_points_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics,
-                    "first_pone_wins",
-                    first_pone_wins_statistics,
-                )
-                first_pone_wins_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics,
-                    "first_dealer_play",
-                    first_dealer_play_statistics,
-                )
-                first_dealer_play_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics,
-                    "first_dealer_hand",
-                    first_dealer_hand_statistics,
-                )
-                first_dealer_hand_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics,
-                    "first_dealer_crib",
-                    first_dealer_crib_statistics,
-                )
-                first_dealer_crib_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics,
-                    "first_dealer_total_points",
-                    overall_first_dealer_points_statistics,
-                )
-                overall_first_dealer_points_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics,
-                    "first_dealer_game_points",
-                    first_dealer_game_points_statistics,
-                )
-                first_dealer_game_points_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics,
-                    "first_dealer_wins",
-                    first_dealer_wins_statistics,
-                )
-                first_dealer_wins_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics,
-                    "first_pone_minus_first_dealer_play",
-                    first_pone_minus_first_dealer_play_statistics,
-                )
-                first_pone_minus_first_dealer_play_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics,
-                    "first_pone_minus_first_dealer_hand",
-                    first_pone_minus_first_dealer_hand_statistics,
-                )
-                first_pone_minus_first_dealer_hand_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics,
-                    "first_pone_minus_first_dealer_crib",
-                    first_pone_minus_first_dealer_crib_statistics,
-                )
-                first_pone_minus_first_dealer_crib_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics,
-                    "first_pone_minus_first_dealer_total_points",
-                    first_pone_minus_first_dealer_total_points_statistics,
-                )
-                first_pone_minus_first_dealer_total_points_statistics.clear()
-
-                statistics_dict_add(
-                    players_statistics,
-                    "first_pone_minus_first_dealer_game_points",
-                    first_pone_minus_first_dealer_game_points_statistics,
-                )
-                first_pone_minus_first_dealer_game_points_statistics.clear()
-
-                players_statistics_length = get_length_across_all_keys(
-                    players_statistics
-                )
-                if show_statistics_updates:
-                    if players_statistics_length > 1:
-                        print(
-                            f"Mean play statistics {confidence_level}% confidence"
-                            " intervals ("
-                            f"{formatted_game_count(players_statistics_length, overall_game_count)}"
-                            "):"
-                        )
-                    else:
-                        print("Mean play statistics:")
-
-                sorted_players_statistics = sorted(
-                    players_statistics.items(),
-                    key=lambda item: (
-                        item[1]["first_pone_minus_first_dealer_game_points"].mean(),
-                        item[1]["first_pone_minus_first_dealer_total_points"].mean(),
-                    ),
-                    reverse=bool(
-                        (len(first_pone_dealt_cards) < len(first_dealer_dealt_cards))
-                        or (
-                            len(first_pone_kept_including_played_cards)
-                            < len(first_dealer_kept_including_played_cards)
-                        )
-                    ),
-                )
-                for (
-                    keep,
-                    post_initial,
-                ), keep_stats in sorted_players_statistics:
-                    if show_statistics_updates:
-                        keep_stats_len = len(keep_stats["first_pone_total_points"])
-                        if keep:
-                            print(
-                                f"{Hand(keep)} -"
-                                f" {Hand(set(first_pone_dealt_cards or first_dealer_dealt_cards) - set(keep))}"
-                                f" (n={keep_stats_len})",
-                                end="",
-                            )
-                        if post_initial:
-                            print(
-                                f"post-initial play {post_initial}"
-                                f" (n={keep_stats_len})",
-                                end="",
-                            )
-                        if keep or post_initial:
-                            print(
-                                f": {get_confidence_interval(keep_stats['first_pone_minus_first_dealer_game_points'], confidence_level)}"
-                                " game points; "
-                                f"{keep_stats['first_pone_minus_first_dealer_play'].mean():+9.5f}"
-                                " Δ-peg + "
-                                f"{keep_stats['first_pone_minus_first_dealer_hand'].mean():+9.5f}"
-                                " Δ-hand + "
-                                f"{keep_stats['first_pone_minus_first_dealer_crib'].mean():+9.5f}"
-                                " crib = "
-                                f"{get_confidence_interval(keep_stats['first_pone_minus_first_dealer_total_points'], confidence_level)}"
-                                " overall"
-                            )
-
-                    if len(keep_stats["first_pone_minus_first_dealer_game_points"]) > 1:
-                        mean_game_points_differential_in_stddevs = (
-                            get_mean_difference_in_stddevs(
-                                keep_stats["first_pone_minus_first_dealer_game_points"],
-                                sorted_players_statistics[-1][1][
-                                    "first_pone_minus_first_dealer_game_points"
-                                ],
-                            )
-                        )
-                        mean_total_points_differential_in_stddevs = (
-                            get_mean_difference_in_stddevs(
-                                keep_stats[
-                                    "first_pone_minus_first_dealer_total_points"
-                                ],
-                                sorted_players_statistics[-1][1][
-                                    "first_pone_minus_first_dealer_total_points"
-                                ],
-                            )
-                        )
-                        drop_confidence_level = 2 * get_z_statistic(confidence_level)
-                        if (
-                            (
-                                mean_game_points_differential_in_stddevs
-                                > drop_confidence_level
-                            )
-                            or mean_game_points_differential_in_stddevs == 0
-                            and (
-                                mean_total_points_differential_in_stddevs
-                                > drop_confidence_level
-                            )
-                        ):
-                            if keep:
-                                dropped_keeps.add(tuple(keep))
-                            if post_initial:
-                                dropped_initial_plays.add(post_initial)
-
-                    if (
-                        keep not in dropped_keeps
-                        and post_initial not in dropped_initial_plays
-                    ):
-                        if show_statistics_updates:
-                            print(
-                                "First Pone                    Play  points: "
-                                f"{get_confidence_interval(keep_stats['first_pone_play'], confidence_level)}"
-                            )
-                            print(
-                                "First Pone                    Hand  points: "
-                                f"{get_confidence_interval(keep_stats['first_pone_hand'], confidence_level)}"
-                            )
-                            print(
-                                "First Pone                    Crib  points: "
-                                f"{get_confidence_interval(keep_stats['first_pone_crib'], confidence_level)}"
-                            )
-                            print(
-                                "First Pone                    Total points: "
-                                f"{get_confidence_interval(keep_stats['first_pone_total_points'], confidence_level)}"
-                            )
-                            print(
-                                "First Pone                    Game  points: "
-                                f"{get_confidence_interval(keep_stats['first_pone_game_points'], confidence_level)}"
-                            )
-                            print(
-                                "First Pone                    Game  wins  : "
-                                f"{get_confidence_interval(keep_stats['first_pone_wins'], confidence_level)}"
-                            )
-                            print(
-                                "-----------------------------------------------------"
-                            )
-                            print(
-                                "First Dealer                  Play  points: "
-                                f"{get_confidence_interval(keep_stats['first_dealer_play'], confidence_level)}"
-                            )
-                            print(
-                                "First Dealer                  Hand  points: "
-                                f"{get_confidence_interval(keep_stats['first_dealer_hand'], confidence_level)}"
-                            )
-                            print(
-                                "First Dealer                  Crib  points: "
-                                f"{get_confidence_interval(keep_stats['first_dealer_crib'], confidence_level)}"
-                            )
-                            print(
-                                "First Dealer                  Total points: "
-                                f"{get_confidence_interval(keep_stats['first_dealer_total_points'], confidence_level)}"
-                            )
-                            print(
-                                "First Dealer                  Game  points: "
-                                f"{get_confidence_interval(keep_stats['first_dealer_game_points'], confidence_level)}"
-                            )
-                            print(
-                                "First Dealer                  Game  wins  : "
-                                f"{get_confidence_interval(keep_stats['first_dealer_wins'], confidence_level)}"
-                            )
-                            print(
-                                "-----------------------------------------------------"
-                            )
-                            print(
-                                "First Pone minus First Dealer Play  points: "
-                                f"{get_confidence_interval(keep_stats['first_pone_minus_first_dealer_play'], confidence_level)}"
-                            )
-                            print(
-                                "First Pone minus First Dealer Hand  points: "
-                                f"{get_confidence_interval(keep_stats['first_pone_minus_first_dealer_hand'], confidence_level)}"
-                            )
-                            print(
-                                "First Pone minus First Dealer Crib  points: "
-                                f"{get_confidence_interval(keep_stats['first_pone_minus_first_dealer_crib'], confidence_level)}"
-                            )
-                            print(
-                                "First Pone minus First Dealer Total points: "
-                                f"{get_confidence_interval(keep_stats['first_pone_minus_first_dealer_total_points'], confidence_level)}"
-                            )
-                            print(
-                                "First Pone minus First Dealer Game  points: "
-                                f"{get_confidence_interval(keep_stats['first_pone_minus_first_dealer_game_points'], confidence_level)}"
-                            )
-
-                if show_statistics_updates:
-                    print(
-                        f"Simulated {players_statistics_length} games at "
-                        f"{simulation_performance_statistics(start_time_ns, players_statistics_length)}"
-                    )
+            ] = (
+                first_dealer_expected_game_points
+                if first_dealer_expected_game_points is not None
+                else first_dealer_game_points
+            )
+            if not hide_play_actions:
+                print(
+                    "+++ Score at end of game simulation: ["
+                    f"{initial_first_pone_score + first_pone_total_points}"
+                    f"-{initial_first_dealer_score + first_dealer_total_points}]"
+                    " for first pone and first dealer."
+                )
+                print(
+                    "### Game points at end of game simulation: [["
+                    f"{possibly_estimated_first_pone_game_points:7.5f}"
+                    f"-{possibly_estimated_first_dealer_game_points:7.5f}]]"
+                    " for pone and dealer."
+                )
+                print()
 
-                players_statistics_lock.release()
+            # Values in PLAYERS_STATISTICS order.
+            players_statistics_delta.push(
+                next_action,
+                (
+                    game_simulation_result.score.first_pone_play,
+                    game_simulation_result.score.first_pone_hand,
+                    game_simulation_result.score.first_pone_crib,
+                    first_pone_total_points,
+                    possibly_estimated_first_pone_game_points,
+                    (
+                        first_pone_expected_wins
+                        if first_pone_expected_wins is not None
+                        else first_pone_wins
+                    ),
+                    game_simulation_result.score.first_dealer_play,
+                    game_simulation_result.score.first_dealer_hand,
+                    game_simulation_result.score.first_dealer_crib,
+                    first_dealer_total_points,
+                    possibly_estimated_first_dealer_game_points,
+                    (
+                        first_dealer_expected_wins
+                        if first_dealer_expected_wins is not None
+                        else first_dealer_wins
+                    ),
+                    Points(
+                        game_simulation_result.score.first_pone_play
+                        - game_simulation_result.score.first_dealer_play
+                    ),
+                    Points(
+                        game_simulation_result.score.first_pone_hand
+                        - game_simulation_result.score.first_dealer_hand
+                    ),
+                    Points(
+                        game_simulation_result.score.first_pone_crib
+                        - game_simulation_result.score.first_dealer_crib
+                    ),
+                    Points(first_pone_total_points - first_dealer_total_points),
+                    ExpectedGamePoints(
+                        possibly_estimated_first_pone_game_points
+                        - possibly_estimated_first_dealer_game_points
+                    ),
+                ),
+            )
+            if game_results_log is not None:
+                game_results_log.append(
+                    next_action,
+                    (
+                        len(game_simulation_result.start_of_hand_scores),
+                        game_simulation_result.score.first_pone_play,
+                        game_simulation_result.score.first_pone_hand,
+                        game_simulation_result.score.first_pone_crib,
+                        final_first_pone_score,
+                        possibly_estimated_first_pone_game_points,
+                        (
+                            first_pone_expected_wins
+                            if first_pone_expected_wins is not None
+                            else first_pone_wins
+                        ),
+                        game_simulation_result.score.first_dealer_play,
+                        game_simulation_result.score.first_dealer_hand,
+                        game_simulation_result.score.first_dealer_crib,
+                        final_first_dealer_score,
+                        possibly_estimated_first_dealer_game_points,
+                        (
+                            first_dealer_expected_wins
+                            if first_dealer_expected_wins is not None
+                            else first_dealer_wins
+                        ),
+                    ),
+                )
 
-                if show_calc_cache_usage_stats:
-                    print("pairs_points:", pairs_points.cache_info())
-                    print("runs_points:", runs_points.cache_info())
-                    print("fifteens_points:", cached_fifteens_points.cache_info())
-                    print(
-                        "pairs, runs and fifteens points:",
-                        cached_pairs_runs_and_fifteens_points.cache_info(),
-                    )
-                    print(
-                        "max kept pre-cut points ignoring suit",
-                        cached_keep_max_pre_cut_hand_points_ignoring_suit.cache_info(),
-                    )
-                    print(
-                        "expected_random_opponent_discard_crib_points_ignoring_suit:",
-                        expected_random_opponent_discard_crib_points_ignoring_suit.cache_info(),
-                    )
-                    print(
-                        "max kept post-cut points ignoring suit",
-                        cached_keep_max_post_cut_hand_points_ignoring_suit.cache_info(),
-                    )
-                    print(
-                        "average_post_cut_hand_points_ignoring_suit_and_discarded:",
-                        average_post_cut_hand_points_ignoring_suit_and_discarded.cache_info(),
+            if (
+                game % games_per_update == games_per_update - 1
+                or game == process_game_count - 1
+            ):
+                if game_results_log is not None:
+                    game_results_log.flush()
+                players_statistics.merge(players_statistics_delta)
+                if players_statistics_queue is not None:
+                    players_statistics_queue.put(players_statistics_delta)
+                players_statistics_delta = PlayersStatisticsStore()
+                if dropped_next_actions_queue is not None:
+                    receive_dropped_next_actions(
+                        dropped_next_actions_queue, dropped_keeps, dropped_initial_plays
                     )
-                    print(
-                        "max kept post-cut hand ± crib points ignoring suit",
-                        cached_keep_max_post_cut_hand_plus_or_minus_crib_points_ignoring_suit.cache_info(),
+                else:
+                    report_players_statistics(
+                        players_statistics,
+                        overall_game_count,
+                        first_pone_dealt_cards,
+                        first_dealer_dealt_cards,
+                        first_pone_kept_including_played_cards,
+                        first_dealer_kept_including_played_cards,
+                        dropped_keeps,
+                        dropped_initial_plays,
+                        show_statistics_updates and players_statistics_queue is None,
+                        confidence_level,
+                        start_time_ns,
+                        resume_checkpoint.game_count if resume_checkpoint else 0,
                     )
-                    print(
-                        "expected_random_opponent_discard_crib_points_cache.stats(): "
-                        f"{expected_random_opponent_discard_crib_points_cache.stats()}"
+                if checkpoint_path:
+                    write_simulation_checkpoint(
+                        checkpoint_path,
+                        SimulationCheckpoint(
+                            simulation_configuration,
+                            worker_number,
+                            worker_count,
+                            game + 1,
+                            players_statistics,
+                            dropped_keeps,
+                            dropped_initial_plays,
+                            random.getstate(),
+                            tuple(
+                                (
+                                    possible_actions_cycle.position
+                                    if possible_actions_cycle is not None
+                                    else 0
+                                )
+                                for possible_actions_cycle in possible_actions_cycles
+                            ),
+                            (
+                                game_results_log.tell()
+                                if game_results_log is not None
+                                else None
+                            ),
+                        ),
                     )
+
+                if show_calc_cache_usage_stats:
                     print(
-                        "cached_get_current_play_run_length",
-                        cached_get_current_play_run_length.cache_info(),
+                        "pairs, runs and fifteens points table size:",
+                        len(HAND_PLUS_STARTER_PAIRS_RUNS_AND_FIFTEENS_POINTS),
                     )
+                    print_cache_usages()
                     print(
                         "start_of_hand_position_results_tallies unique position count",
                         len(start_of_hand_position_results_tallies),
@@ -2712,7 +4512,21 @@ def simulate_games(
                     break
 
     except KeyboardInterrupt:
-        sys.exit(0)
+        if checkpoint_path:
+            print(
+                f"Simulation interrupted: {checkpoint_path} holds its state as of the"
+                " last statistics update."
+            )
+        sys.exit(INTERRUPTED_EXIT_STATUS)
+    finally:
+        if game_results_log is not None:
+            game_results_log.close()
+        if players_statistics_queue is not None:
+            players_statistics_queue.put(None)
+        if show_calc_cache_usage_stats:
+            print_cache_usages()
+        if calc_cache_usage_stats_directory:
+            dump_cache_usages(calc_cache_usage_stats_directory)
 
 
 # TODO: change return type from Sequence[Card] to Tuple[Card, Card] for increased type
@@ -2747,7 +4561,7 @@ def keep_first_four(dealt_cards):
     return dealt_cards[0:KEPT_CARDS_LEN]
 
 
-@cache
+@registered_cache
 def cached_keep_max_pre_cut_hand_points_ignoring_suit(sorted_dealt_indices):
     max_score = None
     max_score_kept_hand = None
@@ -2792,7 +4606,7 @@ def keep_max_pre_cut_hand_points(dealt_cards):
     return max_score_kept_hand
 
 
-@cache
+@registered_cache
 def cached_keep_max_post_cut_hand_points_ignoring_suit(sorted_dealt_indices):
     max_all_starters_total_score = None
     max_all_starters_total_score_kept_hand = None
@@ -2857,7 +4671,7 @@ def keep_max_post_cut_hand_points(dealt_cards):
     return max_total_score_kept_hand
 
 
-@cache
+@registered_cache
 def expected_random_opponent_discard_crib_points_ignoring_suit(
     discard1: int, discard2: int
 ):
@@ -2911,7 +4725,7 @@ def expected_random_opponent_discard_crib_points_ignoring_suit(
 
 # TODO: factor out code in common with
 #       keep_max_post_cut_hand_plus_or_minus_crib_points()
-@cache
+@registered_cache
 def cached_keep_max_post_cut_hand_plus_or_minus_crib_points_ignoring_suit(
     sorted_dealt_indices: Sequence[int], plus_crib: bool
 ):
@@ -2920,24 +4734,21 @@ def cached_keep_max_post_cut_hand_plus_or_minus_crib_points_ignoring_suit(
     ), f"{DEALT_CARDS_LEN} indices expected but {len(sorted_dealt_indices)} handed in"
 
     sorted_dealt_indices_counter = Counter(sorted_dealt_indices)
+    available_starter_index_counts = [
+        DECK_SUIT_COUNT - sorted_dealt_indices.count(starter_index)
+        for starter_index in range(DECK_INDEX_COUNT)
+    ]
+    kept_hand_and_starter_count = sum(available_starter_index_counts)
     max_average_score = None
     max_average_score_kept_hand = None
     for sorted_kept_indices in itertools.combinations(
         sorted_dealt_indices, KEPT_CARDS_LEN
     ):
-        total_kept_hand_and_starters_hand_score = 0
-        kept_hand_and_starter_count = 0
-        for starter_index in range(DECK_INDEX_COUNT):
-            available_starter_index_count = (
-                DECK_SUIT_COUNT - sorted_dealt_indices.count(starter_index)
-            )
-            total_kept_hand_and_starters_hand_score += (
-                cached_pairs_runs_and_fifteens_points(
-                    tuple(sorted([*sorted_kept_indices, starter_index]))
-                )
-                * available_starter_index_count
+        total_kept_hand_and_starters_hand_score = (
+            kept_indices_total_points_over_starter_indices(
+                sorted_kept_indices, available_starter_index_counts
             )
-            kept_hand_and_starter_count += available_starter_index_count
+        )
 
         average_hand_score = (
             total_kept_hand_and_starters_hand_score / kept_hand_and_starter_count
@@ -3001,42 +4812,302 @@ DEFAULT_SELECT_PONE_KEPT_CARDS = keep_max_post_cut_hand_minus_crib_points_ignori
 DEFAULT_SELECT_DEALER_KEPT_CARDS = keep_max_post_cut_hand_plus_crib_points_ignoring_suit
 
 
-expected_random_opponent_discard_crib_points_cache = Cache(
-    "expected_random_opponent_discard_crib_points_cache", eviction_policy="none"
+# Sums crib points over every starter and unordered opponent discard pair drawn
+# from the 50 cards left after discarded_dealt_cards by grouping them instead:
+# pairs, runs and fifteens by opponent discard index pair weighted by its card
+# count and scored against each remaining starter index count, a flush by the
+# count of same suited opponent discard and starter combinations, and nobs by the
+# count of starters matching the suit of a discarded or opponent discarded jack.
+def exact_expected_random_opponent_discard_crib_points(
+    discarded_dealt_cards: Sequence[Card],
+) -> float:
+    available_index_counts = [
+        DECK_SUIT_COUNT
+        - [discarded_card.index for discarded_card in discarded_dealt_cards].count(
+            index
+        )
+        for index in range(DECK_INDEX_COUNT)
+    ]
+    available_suit_counts = [
+        DECK_INDEX_COUNT
+        - [discarded_card.suit for discarded_card in discarded_dealt_cards].count(suit)
+        for suit in range(DECK_SUIT_COUNT)
+    ]
+    available_card_count = sum(available_index_counts)
+    opponent_discard_count = math.comb(available_card_count - 1, 2)
+
+    total_crib_points = 0
+    for opponent_discard_indices in itertools.combinations_with_replacement(
+        range(DECK_INDEX_COUNT), 2
+    ):
+        first_index, second_index = opponent_discard_indices
+        opponent_discard_index_pair_count = (
+            math.comb(available_index_counts[first_index], 2)
+            if first_index == second_index
+            else available_index_counts[first_index]
+            * available_index_counts[second_index]
+        )
+        if not opponent_discard_index_pair_count:
+            continue
+        starter_index_counts = list(available_index_counts)
+        starter_index_counts[first_index] -= 1
+        starter_index_counts[second_index] -= 1
+        total_crib_points += (
+            opponent_discard_index_pair_count
+            * kept_indices_total_points_over_starter_indices(
+                sorted(
+                    [
+                        *(
+                            discarded_card.index
+                            for discarded_card in discarded_dealt_cards
+                        ),
+                        *opponent_discard_indices,
+                    ]
+                ),
+                starter_index_counts,
+            )
+        )
+
+    discarded_suits = {discarded_card.suit for discarded_card in discarded_dealt_cards}
+    if len(discarded_suits) == 1:
+        (flush_suit,) = discarded_suits
+        total_crib_points += (
+            5
+            * available_suit_counts[flush_suit]
+            * math.comb(available_suit_counts[flush_suit] - 1, 2)
+        )
+
+    for suit in range(DECK_SUIT_COUNT):
+        if Card(JACK_INDEX, suit) in discarded_dealt_cards:
+            total_crib_points += available_suit_counts[suit] * opponent_discard_count
+        else:
+            total_crib_points += (available_suit_counts[suit] - 1) * (
+                available_card_count - 2
+            )
+
+    return total_crib_points / (available_card_count * opponent_discard_count)
+
+
+# EXPECTED_RANDOM_OPPONENT_DISCARD_CRIB_POINTS[(high_index, low_index, is_suited)]
+# holds exact_expected_random_opponent_discard_crib_points() of each of the 169
+# canonical discard pairs.
+EXPECTED_RANDOM_OPPONENT_DISCARD_CRIB_POINTS: Dict[Tuple[int, int, bool], float] = {
+    (12, 12, False): 5.032244897959184,
+    (12, 11, True): 4.005969387755102,
+    (12, 11, False): 3.963877551020408,
+    (12, 10, True): 4.326377551020408,
+    (12, 10, False): 4.3034693877551025,
+    (12, 9, True): 3.44984693877551,
+    (12, 9, False): 3.407755102040816,
+    (12, 8, True): 3.5435204081632654,
+    (12, 8, False): 3.5014285714285713,
+    (12, 7, True): 3.595969387755102,
+    (12, 7, False): 3.5538775510204084,
+    (12, 6, True): 3.612091836734694,
+    (12, 6, False): 3.57,
+    (12, 5, True): 3.6653571428571428,
+    (12, 5, False): 3.623265306122449,
+    (12, 4, True): 6.851989795918367,
+    (12, 4, False): 6.809897959183673,
+    (12, 3, True): 3.96780612244898,
+    (12, 3, False): 3.9257142857142857,
+    (12, 2, True): 3.9712755102040815,
+    (12, 2, False): 3.929183673469388,
+    (12, 1, True): 3.895969387755102,
+    (12, 1, False): 3.853877551020408,
+    (12, 0, True): 3.783520408163265,
+    (12, 0, False): 3.7414285714285715,
+    (11, 11, False): 5.249387755102041,
+    (11, 10, True): 5.029030612244898,
+    (11, 10, False): 5.006122448979592,
+    (11, 9, True): 4.1525,
+    (11, 9, False): 4.110408163265306,
+    (11, 8, True): 3.5916836734693875,
+    (11, 8, False): 3.549591836734694,
+    (11, 7, True): 3.7045408163265305,
+    (11, 7, False): 3.662448979591837,
+    (11, 6, True): 3.7206632653061225,
+    (11, 6, False): 3.6785714285714284,
+    (11, 5, True): 3.7739285714285713,
+    (11, 5, False): 3.7318367346938777,
+    (11, 4, True): 6.960561224489796,
+    (11, 4, False): 6.918469387755102,
+    (11, 3, True): 4.076377551020408,
+    (11, 3, False): 4.034285714285715,
+    (11, 2, True): 4.0798469387755105,
+    (11, 2, False): 4.0377551020408164,
+    (11, 1, True): 4.00454081632653,
+    (11, 1, False): 3.9624489795918367,
+    (11, 0, True): 3.8920918367346937,
+    (11, 0, False): 3.85,
+    (10, 10, False): 5.928571428571429,
+    (10, 9, True): 5.066989795918367,
+    (10, 9, False): 5.044081632653061,
+    (10, 8, True): 4.506173469387755,
+    (10, 8, False): 4.483265306122449,
+    (10, 7, True): 3.9645408163265308,
+    (10, 7, False): 3.9416326530612245,
+    (10, 6, True): 4.041071428571429,
+    (10, 6, False): 4.018163265306122,
+    (10, 5, True): 4.0943367346938775,
+    (10, 5, False): 4.071428571428571,
+    (10, 4, True): 7.280969387755102,
+    (10, 4, False): 7.258061224489796,
+    (10, 3, True): 4.3967857142857145,
+    (10, 3, False): 4.373877551020408,
+    (10, 2, True): 4.400255102040816,
+    (10, 2, False): 4.37734693877551,
+    (10, 1, True): 4.324948979591837,
+    (10, 1, False): 4.302040816326531,
+    (10, 0, True): 4.2125,
+    (10, 0, False): 4.189591836734694,
+    (9, 9, False): 5.463265306122449,
+    (9, 8, True): 4.881887755102041,
+    (9, 8, False): 4.839795918367347,
+    (9, 7, True): 4.340255102040817,
+    (9, 7, False): 4.298163265306123,
+    (9, 6, True): 3.762295918367347,
+    (9, 6, False): 3.720204081632653,
+    (9, 5, True): 3.8759693877551022,
+    (9, 5, False): 3.833877551020408,
+    (9, 4, True): 7.062602040816326,
+    (9, 4, False): 7.020510204081632,
+    (9, 3, True): 4.178418367346938,
+    (9, 3, False): 4.136326530612245,
+    (9, 2, True): 4.181887755102041,
+    (9, 2, False): 4.139795918367347,
+    (9, 1, True): 4.106581632653061,
+    (9, 1, False): 4.064489795918368,
+    (9, 0, True): 3.9941326530612247,
+    (9, 0, False): 3.9520408163265306,
+    (8, 8, False): 5.529795918367347,
+    (8, 7, True): 4.967602040816327,
+    (8, 7, False): 4.9255102040816325,
+    (8, 6, True): 4.389642857142857,
+    (8, 6, False): 4.347551020408163,
+    (8, 5, True): 5.613724489795918,
+    (8, 5, False): 5.571632653061225,
+    (8, 4, True): 5.77219387755102,
+    (8, 4, False): 5.730102040816327,
+    (8, 3, True): 4.23984693877551,
+    (8, 3, False): 4.197755102040817,
+    (8, 2, True): 4.152193877551021,
+    (8, 2, False): 4.110102040816327,
+    (8, 1, True): 4.174132653061225,
+    (8, 1, False): 4.132040816326531,
+    (8, 0, True): 4.076173469387755,
+    (8, 0, False): 4.034081632653061,
+    (7, 7, False): 5.634693877551021,
+    (7, 6, True): 6.801071428571428,
+    (7, 6, False): 6.758979591836734,
+    (7, 5, True): 4.936581632653061,
+    (7, 5, False): 4.894489795918368,
+    (7, 4, True): 5.792397959183673,
+    (7, 4, False): 5.75030612244898,
+    (7, 3, True): 4.339642857142858,
+    (7, 3, False): 4.2975510204081635,
+    (7, 2, True): 4.326377551020408,
+    (7, 2, False): 4.284285714285715,
+    (7, 1, True): 4.270663265306123,
+    (7, 1, False): 4.228571428571429,
+    (7, 0, True): 4.160255102040816,
+    (7, 0, False): 4.118163265306123,
+    (6, 6, False): 6.108163265306122,
+    (6, 5, True): 5.574948979591837,
+    (6, 5, False): 5.532857142857143,
+    (6, 4, True): 6.449948979591837,
+    (6, 4, False): 6.407857142857143,
+    (6, 3, True): 4.215255102040817,
+    (6, 3, False): 4.173163265306123,
+    (6, 2, True): 4.391275510204082,
+    (6, 2, False): 4.349183673469388,
+    (6, 1, True): 4.318724489795918,
+    (6, 1, False): 4.276632653061225,
+    (6, 0, True): 4.116887755102041,
+    (6, 0, False): 4.074795918367347,
+    (5, 5, False): 6.290204081632653,
+    (5, 4, True): 7.1275,
+    (5, 4, False): 7.085408163265306,
+    (5, 3, True): 5.003520408163265,
+    (5, 3, False): 4.961428571428572,
+    (5, 2, True): 4.31015306122449,
+    (5, 2, False): 4.268061224489796,
+    (5, 1, True): 4.403724489795918,
+    (5, 1, False): 4.361632653061225,
+    (5, 0, True): 4.295051020408163,
+    (5, 0, False): 4.252959183673469,
+    (4, 4, False): 8.99265306122449,
+    (4, 3, True): 7.032602040816326,
+    (4, 3, False): 6.990510204081633,
+    (4, 2, True): 6.4634183673469385,
+    (4, 2, False): 6.4213265306122445,
+    (4, 1, True): 5.797908163265306,
+    (4, 1, False): 5.755816326530613,
+    (4, 0, True): 5.7685204081632655,
+    (4, 0, False): 5.726428571428571,
+    (3, 3, False): 6.1355102040816325,
+    (3, 2, True): 5.534132653061224,
+    (3, 2, False): 5.49204081632653,
+    (3, 1, True): 4.883112244897959,
+    (3, 1, False): 4.841020408163265,
+    (3, 0, True): 5.505765306122449,
+    (3, 0, False): 5.463673469387755,
+    (2, 2, False): 6.161224489795918,
+    (2, 1, True): 6.874744897959184,
+    (2, 1, False): 6.83265306122449,
+    (2, 0, True): 4.596989795918367,
+    (2, 0, False): 4.554897959183673,
+    (1, 1, False): 5.825306122448979,
+    (1, 0, True): 4.476989795918367,
+    (1, 0, False): 4.434897959183673,
+    (0, 0, False): 5.5318367346938775,
+}
+
+# Setting this environment variable to a directory opts in to a disk cache there
+# of crib points computed for any discard missing from the table above.
+EXPECTED_RANDOM_OPPONENT_DISCARD_CRIB_POINTS_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE = (
+    "EXPECTED_RANDOM_OPPONENT_DISCARD_CRIB_POINTS_CACHE_DIRECTORY"
 )
+expected_random_opponent_discard_crib_points_cache: Optional[Cache] = None
 
 
-@expected_random_opponent_discard_crib_points_cache.memoize()
-def cached_expected_random_opponent_discard_crib_points(
-    suit_normalized_sorted_discarded_dealt_cards: Tuple[Card, ...],
+def disk_cache_usage(disk_cache: Cache) -> CacheUsage:
+    hits, misses = disk_cache.stats()
+    return CacheUsage(hits, misses, len(disk_cache), disk_cache.volume())
+
+
+def open_expected_random_opponent_discard_crib_points_cache(directory: str) -> Cache:
+    global expected_random_opponent_discard_crib_points_cache
+
+    disk_cache = Cache(directory, eviction_policy="none")
+    expected_random_opponent_discard_crib_points_cache = disk_cache
+    register_cache_usage(
+        "expected_random_opponent_discard_crib_points_cache",
+        lambda: disk_cache_usage(disk_cache),
+    )
+    return disk_cache
+
+
+if os.environ.get(
+    EXPECTED_RANDOM_OPPONENT_DISCARD_CRIB_POINTS_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE
 ):
-    deck_less_dealt_cards = [
-        card
-        for card in DECK_SET
-        if card not in suit_normalized_sorted_discarded_dealt_cards
-    ]
-    total_kept_hand_possible_cribs_score = 0
-    kept_hand_starter_and_opponent_discard_count = 0
-    for starter in deck_less_dealt_cards:
-        deck_less_dealt_cards_and_starter = [
-            card for card in deck_less_dealt_cards if card != starter
+    open_expected_random_opponent_discard_crib_points_cache(
+        os.environ[
+            EXPECTED_RANDOM_OPPONENT_DISCARD_CRIB_POINTS_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE
         ]
-        for possible_opponent_discard in itertools.combinations(
-            deck_less_dealt_cards_and_starter, 2
-        ):
-            possible_crib = [
-                *suit_normalized_sorted_discarded_dealt_cards,
-                *possible_opponent_discard,
-            ]
-            kept_hand_possible_crib_score = score_hand_and_starter(
-                possible_crib, starter, is_crib=True
-            )
-            total_kept_hand_possible_cribs_score += kept_hand_possible_crib_score
-            kept_hand_starter_and_opponent_discard_count += 1
+    )
 
-    average_crib_score = (
-        total_kept_hand_possible_cribs_score
-        / kept_hand_starter_and_opponent_discard_count
+
+def disk_cached_expected_random_opponent_discard_crib_points(
+    disk_cache: Cache,
+    suit_normalized_sorted_discarded_dealt_cards: Tuple[Card, ...],
+) -> float:
+    average_crib_score = disk_cache.get(suit_normalized_sorted_discarded_dealt_cards)
+    if average_crib_score is not None:
+        return average_crib_score
+
+    average_crib_score = exact_expected_random_opponent_discard_crib_points(
+        suit_normalized_sorted_discarded_dealt_cards
     )
     print(
         "Adding to disk cache cached_expected_random_opponent_discard_crib_points("
@@ -3045,9 +5116,31 @@ def cached_expected_random_opponent_discard_crib_points(
         f"{'  ' if suit_normalized_sorted_discarded_dealt_cards[0].suit == suit_normalized_sorted_discarded_dealt_cards[1].suit else 'un'}"
         f"suited) = {average_crib_score}"
     )
+    disk_cache.set(suit_normalized_sorted_discarded_dealt_cards, average_crib_score)
     return average_crib_score
 
 
+def cached_expected_random_opponent_discard_crib_points(
+    suit_normalized_sorted_discarded_dealt_cards: Tuple[Card, ...],
+) -> float:
+    high_card, low_card = suit_normalized_sorted_discarded_dealt_cards
+    average_crib_score = EXPECTED_RANDOM_OPPONENT_DISCARD_CRIB_POINTS.get(
+        (high_card.index, low_card.index, high_card.suit == low_card.suit)
+    )
+    if average_crib_score is not None:
+        return average_crib_score
+
+    if expected_random_opponent_discard_crib_points_cache is not None:
+        return disk_cached_expected_random_opponent_discard_crib_points(
+            expected_random_opponent_discard_crib_points_cache,
+            suit_normalized_sorted_discarded_dealt_cards,
+        )
+
+    return exact_expected_random_opponent_discard_crib_points(
+        suit_normalized_sorted_discarded_dealt_cards
+    )
+
+
 def expected_random_opponent_discard_crib_points(discarded_dealt_cards: List[Card]):
     is_suited_discard: bool = (
         discarded_dealt_cards[0].suit == discarded_dealt_cards[1].suit
@@ -3064,23 +5157,15 @@ def expected_random_opponent_discard_crib_points(discarded_dealt_cards: List[Car
     )
 
 
-@cache
+@registered_cache
 def average_post_cut_hand_points_ignoring_suit_and_discarded(sorted_kept_indices):
-    total_kept_hand_and_starters_hand_score = 0
-    kept_hand_and_starter_count = 0
-    for starter_index in range(DECK_INDEX_COUNT):
-        available_starter_index_count = DECK_SUIT_COUNT - sorted_kept_indices.count(
-            starter_index
-        )
-        total_kept_hand_and_starters_hand_score += (
-            cached_pairs_runs_and_fifteens_points(
-                tuple(sorted([*sorted_kept_indices, starter_index]))
-            )
-            * available_starter_index_count
-        )
-        kept_hand_and_starter_count += available_starter_index_count
-
-    return total_kept_hand_and_starters_hand_score / kept_hand_and_starter_count
+    available_starter_index_counts = [
+        DECK_SUIT_COUNT - sorted_kept_indices.count(starter_index)
+        for starter_index in range(DECK_INDEX_COUNT)
+    ]
+    return kept_indices_total_points_over_starter_indices(
+        sorted_kept_indices, available_starter_index_counts
+    ) / sum(available_starter_index_counts)
 
 
 # TODO: factor out code in common with keep_max_post_cut_hand_points()
@@ -3088,9 +5173,18 @@ def average_post_cut_hand_points_ignoring_suit_and_discarded(sorted_kept_indices
 #       cached_keep_max_post_cut_hand_plus_or_minus_crib_points_ignoring_suit()
 def keep_max_post_cut_hand_plus_or_minus_crib_points(dealt_cards, plus_crib):
     neither_flush_nor_nobs_is_possible = neither_flush_nor_nobs_possible(dealt_cards)
+    kept_hands = list(itertools.combinations(dealt_cards, KEPT_CARDS_LEN))
+    if not neither_flush_nor_nobs_is_possible:
+        starter_card_ids = [
+            card_id(card) for card in DECK_SET if card not in dealt_cards
+        ]
+        kept_hands_starter_scores = score_card_ids_hands_and_starters(
+            [[card_id(card) for card in kept_hand] for kept_hand in kept_hands],
+            [starter_card_ids] * len(kept_hands),
+        )
     max_average_score = None
     max_average_score_kept_hand = None
-    for kept_hand in itertools.combinations(dealt_cards, KEPT_CARDS_LEN):
+    for kept_hand_number, kept_hand in enumerate(kept_hands):
         if neither_flush_nor_nobs_is_possible:
             average_hand_score = (
                 average_post_cut_hand_points_ignoring_suit_and_discarded(
@@ -3098,15 +5192,8 @@ def keep_max_post_cut_hand_plus_or_minus_crib_points(dealt_cards, plus_crib):
                 )
             )
         else:
-            total_kept_hand_and_starters_hand_score = 0
-            kept_hand_and_starter_count = 0
-            for starter in [card for card in DECK_SET if card not in dealt_cards]:
-                total_kept_hand_and_starters_hand_score += score_hand_and_starter(
-                    kept_hand, starter
-                )
-                kept_hand_and_starter_count += 1
-            average_hand_score = (
-                total_kept_hand_and_starters_hand_score / kept_hand_and_starter_count
+            average_hand_score = sum(kept_hands_starter_scores[kept_hand_number]) / len(
+                starter_card_ids
             )
 
         discarded_dealt_cards = [card for card in dealt_cards if card not in kept_hand]
@@ -3259,14 +5346,12 @@ def play_run(
     playable_cards: Sequence[Card], current_play_to_31_cards: Sequence[Card]
 ) -> Optional[PlayableCardIndex]:
     best_play_index: Optional[PlayableCardIndex] = None
-    best_play_run_length: Optional[int] = None
+    best_play_run_length = 0
     for index, playable_card in enumerate(playable_cards):
-        play_run_length = get_current_play_run_length(
-            [*current_play_to_31_cards, playable_card]
+        play_run_length = get_play_run_length_with(
+            current_play_to_31_cards, playable_card
         )
-        if play_run_length and (
-            best_play_index is None or play_run_length > best_play_run_length
-        ):
+        if play_run_length > best_play_run_length:
             best_play_index = PlayableCardIndex(index)
             best_play_run_length = play_run_length
     return best_play_index
@@ -3410,6 +5495,117 @@ def play_low_lead_else_pairs_royale_else_run_else_15_else_pair_else_31_else_16_t
 DEFAULT_SELECT_PLAY = play_low_lead_else_pairs_royale_else_run_else_15_else_pair_else_31_else_16_to_20_count_else_highest_count
 
 
+# Each simulation-based discard or play decision can spread its nested
+# simulations across a persistent pool of this many worker processes, created in
+# the deciding process on first use; 1 keeps them in the deciding process.
+NESTED_SIMULATION_PROCESS_COUNT_ENVIRONMENT_VARIABLE = "NESTED_SIMULATION_PROCESS_COUNT"
+START_OF_HAND_POSITION_RESULTS_TALLIES_SHELF_FILENAME = (
+    "start_of_hand_position_results_tallies_shelf"
+)
+nested_simulation_process_count: int = int(
+    os.environ.get(NESTED_SIMULATION_PROCESS_COUNT_ENVIRONMENT_VARIABLE, "1")
+)
+nested_simulations_pool: Optional[ProcessPool] = None
+nested_simulations_pool_pid: Optional[int] = None
+nested_simulations_start_of_hand_position_results_tallies: Optional[shelve.Shelf] = None
+
+
+def open_nested_simulations_worker(start_of_hand_position_results_tallies_filename):
+    global nested_simulations_start_of_hand_position_results_tallies
+
+    nested_simulations_start_of_hand_position_results_tallies = shelve.open(
+        start_of_hand_position_results_tallies_filename, flag="r"
+    )
+
+
+def get_nested_simulations_pool() -> ProcessPool:
+    global nested_simulations_pool, nested_simulations_pool_pid
+
+    # A pool belongs to the process that created it, so a forked main worker
+    # creates its own rather than using one inherited from its parent.
+    if nested_simulations_pool is None or nested_simulations_pool_pid != os.getpid():
+        nested_simulations_pool = Pool(
+            nested_simulation_process_count,
+            open_nested_simulations_worker,
+            (START_OF_HAND_POSITION_RESULTS_TALLIES_SHELF_FILENAME,),
+        )
+        nested_simulations_pool_pid = os.getpid()
+    return nested_simulations_pool
+
+
+def simulate_nested_games_share(
+    process_game_count: int,
+    overall_game_count: int,
+    worker_seed: int,
+    simulate_games_arguments: Dict[str, Any],
+) -> PlayersStatisticsStore:
+    assert nested_simulations_start_of_hand_position_results_tallies is not None
+    players_statistics = PlayersStatisticsStore()
+    simulate_games(
+        process_game_count,
+        overall_game_count,
+        players_statistics=players_statistics,
+        start_of_hand_position_results_tallies=(
+            nested_simulations_start_of_hand_position_results_tallies
+        ),
+        worker_seed=worker_seed,
+        **simulate_games_arguments,
+    )
+    return players_statistics
+
+
+# Simulates simulated_hand_count games for each of simulated_action_count next
+# actions, returning their statistics. With a nested simulation pool the hands
+# are split into per-worker shares that each still cycle through every action,
+# each share seeded from this process's random stream so that a seeded run stays
+# reproducible, and the shares' statistics are merged. Simulations that tally
+# start of hand position results write to the shelf and so stay in process.
+def simulate_nested_games(
+    simulated_action_count: int,
+    simulated_hand_count: int,
+    tally_start_of_hand_position_results: bool,
+    start_of_hand_position_results_tallies: shelve.Shelf,
+    **simulate_games_arguments,
+) -> PlayersStatisticsStore:
+    total_game_count = simulated_action_count * simulated_hand_count
+    players_statistics = PlayersStatisticsStore()
+    if nested_simulation_process_count <= 1 or tally_start_of_hand_position_results:
+        simulate_games(
+            total_game_count,
+            total_game_count,
+            players_statistics=players_statistics,
+            tally_start_of_hand_position_results=tally_start_of_hand_position_results,
+            start_of_hand_position_results_tallies=start_of_hand_position_results_tallies,
+            **simulate_games_arguments,
+        )
+        return players_statistics
+
+    share_hand_counts = [
+        simulated_hand_count // nested_simulation_process_count
+        + (1 if share < simulated_hand_count % nested_simulation_process_count else 0)
+        for share in range(nested_simulation_process_count)
+    ]
+    share_players_statistics = get_nested_simulations_pool().starmap(
+        simulate_nested_games_share,
+        [
+            (
+                simulated_action_count * share_hand_count,
+                total_game_count,
+                random.getrandbits(128),
+                {
+                    "tally_start_of_hand_position_results": False,
+                    **simulate_games_arguments,
+                },
+            )
+            for share_hand_count in share_hand_counts
+            if share_hand_count
+        ],
+    )
+    for share_statistics in share_players_statistics:
+        players_statistics.merge(share_statistics)
+    return players_statistics
+
+
 def play_based_on_simulation(
     simulated_hand_count: int,
     hide_hand: bool,
@@ -3433,7 +5629,6 @@ def play_based_on_simulation(
         if isinstance(initial_play_action, Card)
     ]
     possible_play_count: int = KEPT_CARDS_LEN - len(played_cards)
-    total_play_simulation_count: int = possible_play_count * simulated_hand_count
     if not hide_hand:
         print(
             f"Simulating each of the {possible_play_count} possible"
@@ -3441,9 +5636,6 @@ def play_based_on_simulation(
             " times in order to select the play:"
         )
 
-    manager = Manager()
-    simulated_players_statistics: DictProxy[NextAction, Statistics] = manager.dict()
-    simulated_players_statistics_lock = Lock()
     confidence_level: int = 95
     player_to_play_is_first_pone: bool = (
         pone_is_parent_game_first_pone
@@ -3457,56 +5649,68 @@ def play_based_on_simulation(
         or not pone_is_parent_game_first_pone
         and root_simulation_first_pone_is_next_to_play
     )
-    simulate_games(
-        total_play_simulation_count,
-        total_play_simulation_count,
-        1,
-        Points(
+    simulated_players_statistics = simulate_nested_games(
+        possible_play_count,
+        simulated_hand_count,
+        tally_start_of_hand_position_results,
+        start_of_hand_position_results_tallies,
+        maximum_hands_per_game=1,
+        initial_first_pone_score=Points(
             current_game_score.first_pone_initial
             + current_game_score.first_pone_play
             + current_game_score.first_pone_hand
             + current_game_score.first_pone_crib
         ),
-        Points(
+        initial_first_dealer_score=Points(
             current_game_score.first_dealer_initial
             + current_game_score.first_dealer_play
             + current_game_score.first_dealer_hand
             + current_game_score.first_dealer_crib
         ),
-        player_to_play_dealt_hand if player_to_play_is_first_pone else [],
-        player_to_play_dealt_hand if player_to_play_is_first_dealer else [],
-        player_to_play_kept_hand if player_to_play_is_first_pone else [],
-        player_to_play_kept_hand if player_to_play_is_first_dealer else [],
-        starter,
-        initial_play_actions,
-        simulated_players_statistics,
-        simulated_players_statistics_lock,
-        DEFAULT_SELECT_PONE_KEPT_CARDS,
-        False,
-        False,
-        DEFAULT_SELECT_DEALER_KEPT_CARDS,
-        False,
-        False,
-        DEFAULT_SELECT_PLAY,
-        None,
-        DEFAULT_SELECT_PLAY,
-        None,
-        None,
-        None,
-        tally_start_of_hand_position_results,
-        estimate_first_pone_incomplete_game_wins_and_game_points,
-        estimate_first_dealer_incomplete_game_wins_and_game_points,
-        hide_missing_incomplete_game_wins_and_game_points_estimates,
-        start_of_hand_position_results_tallies,
-        True,
-        True,
-        True,
-        True,
-        sys.maxsize,
-        False,
-        confidence_level,
-        time.time_ns(),
-        False,
+        first_pone_dealt_cards=(
+            player_to_play_dealt_hand if player_to_play_is_first_pone else []
+        ),
+        first_dealer_dealt_cards=(
+            player_to_play_dealt_hand if player_to_play_is_first_dealer else []
+        ),
+        first_pone_kept_cards=(
+            player_to_play_kept_hand if player_to_play_is_first_pone else []
+        ),
+        first_dealer_kept_cards=(
+            player_to_play_kept_hand if player_to_play_is_first_dealer else []
+        ),
+        initial_starter=starter,
+        initial_play_actions=initial_play_actions,
+        first_pone_select_kept_cards=DEFAULT_SELECT_PONE_KEPT_CARDS,
+        first_pone_discard_based_on_simulations=False,
+        first_pone_select_each_possible_kept_hand=False,
+        first_dealer_select_kept_cards=DEFAULT_SELECT_DEALER_KEPT_CARDS,
+        first_dealer_discard_based_on_simulations=False,
+        first_dealer_select_each_possible_kept_hand=False,
+        first_pone_select_play=DEFAULT_SELECT_PLAY,
+        first_pone_play_based_on_simulations=None,
+        first_dealer_select_play=DEFAULT_SELECT_PLAY,
+        first_dealer_play_based_on_simulations=None,
+        coach_discard_simulated_hand_count=None,
+        coach_play_simulated_hand_count=None,
+        estimate_first_pone_incomplete_game_wins_and_game_points=(
+            estimate_first_pone_incomplete_game_wins_and_game_points
+        ),
+        estimate_first_dealer_incomplete_game_wins_and_game_points=(
+            estimate_first_dealer_incomplete_game_wins_and_game_points
+        ),
+        hide_missing_incomplete_game_wins_and_game_points_estimates=(
+            hide_missing_incomplete_game_wins_and_game_points_estimates
+        ),
+        select_each_post_initial_play=True,
+        hide_first_pone_hands=True,
+        hide_first_dealer_hands=True,
+        hide_play_actions=True,
+        games_per_update=sys.maxsize,
+        show_statistics_updates=False,
+        confidence_level=confidence_level,
+        start_time_ns=time.time_ns(),
+        show_calc_cache_usage_stats=False,
     )
 
     sorted_simulated_players_statistics = sorted(
@@ -3566,6 +5770,8 @@ def play_user_selected(
 def simulation_performance_statistics(start_time_ns, games_simulated):
     elapsed_time_ns = time.time_ns() - start_time_ns
     ns_per_s = 1000000000
+    if not games_simulated:
+        return f"0 games/s in {elapsed_time_ns / ns_per_s} s"
     return (
         f"{games_simulated / (elapsed_time_ns / ns_per_s):.3f} games/s"
         f" ({elapsed_time_ns / games_simulated:.0f} ns/game) in"
@@ -3590,75 +5796,71 @@ def player_select_kept_cards_based_on_simulation(
     hide_missing_incomplete_game_wins_and_game_points_estimates: bool,
     start_of_hand_position_results_tallies: shelve.Shelf,
 ):
-    total_discard_simulation_count: int = possible_discard_count * simulated_hand_count
     if not hide_hand:
         print(
             f"Simulating each of the {possible_discard_count} possible discards"
             f" {'with game result estimation enabled' if estimate_first_pone_incomplete_game_wins_and_game_points or estimate_first_dealer_incomplete_game_wins_and_game_points else ''}"
             f" {simulated_hand_count} times in order to select discard"
         )
-    manager = Manager()
-    simulated_players_statistics: DictProxy[NextAction, Statistics] = manager.dict()
-    simulated_players_statistics_lock = Lock()
     confidence_level: int = 95
-    simulate_games(
-        total_discard_simulation_count,
-        total_discard_simulation_count,
-        1,
-        Points(
+    simulated_players_statistics = simulate_nested_games(
+        possible_discard_count,
+        simulated_hand_count,
+        tally_start_of_hand_position_results,
+        start_of_hand_position_results_tallies,
+        maximum_hands_per_game=1,
+        initial_first_pone_score=Points(
             current_game_score.first_pone_initial
             + current_game_score.first_pone_play
             + current_game_score.first_pone_hand
             + current_game_score.first_pone_crib
         ),
-        Points(
+        initial_first_dealer_score=Points(
             current_game_score.first_dealer_initial
             + current_game_score.first_dealer_play
             + current_game_score.first_dealer_hand
             + current_game_score.first_dealer_crib
         ),
-        dealt_hand if player == PONE else [],
-        dealt_hand if player == DEALER else [],
-        [],
-        [],
-        None,
-        [],
-        simulated_players_statistics,
-        simulated_players_statistics_lock,
-        DEFAULT_SELECT_PONE_KEPT_CARDS,
-        False,
-        player == PONE,
-        DEFAULT_SELECT_DEALER_KEPT_CARDS,
-        False,
-        player == DEALER,
-        DEFAULT_SELECT_PLAY,
-        None,
-        DEFAULT_SELECT_PLAY,
-        None,
-        None,
-        None,
-        tally_start_of_hand_position_results,
-        (
+        first_pone_dealt_cards=dealt_hand if player == PONE else [],
+        first_dealer_dealt_cards=dealt_hand if player == DEALER else [],
+        first_pone_kept_cards=[],
+        first_dealer_kept_cards=[],
+        initial_starter=None,
+        initial_play_actions=[],
+        first_pone_select_kept_cards=DEFAULT_SELECT_PONE_KEPT_CARDS,
+        first_pone_discard_based_on_simulations=False,
+        first_pone_select_each_possible_kept_hand=player == PONE,
+        first_dealer_select_kept_cards=DEFAULT_SELECT_DEALER_KEPT_CARDS,
+        first_dealer_discard_based_on_simulations=False,
+        first_dealer_select_each_possible_kept_hand=player == DEALER,
+        first_pone_select_play=DEFAULT_SELECT_PLAY,
+        first_pone_play_based_on_simulations=None,
+        first_dealer_select_play=DEFAULT_SELECT_PLAY,
+        first_dealer_play_based_on_simulations=None,
+        coach_discard_simulated_hand_count=None,
+        coach_play_simulated_hand_count=None,
+        estimate_first_pone_incomplete_game_wins_and_game_points=(
             estimate_first_pone_incomplete_game_wins_and_game_points
             if player == PONE
             else estimate_first_dealer_incomplete_game_wins_and_game_points
         ),
-        (
+        estimate_first_dealer_incomplete_game_wins_and_game_points=(
             estimate_first_dealer_incomplete_game_wins_and_game_points
             if player == PONE
             else estimate_first_pone_incomplete_game_wins_and_game_points
         ),
-        hide_missing_incomplete_game_wins_and_game_points_estimates,
-        start_of_hand_position_results_tallies,
-        False,
-        True,
-        True,
-        True,
-        sys.maxsize,
-        False,
-        confidence_level,
-        time.time_ns(),
-        False,
+        hide_missing_incomplete_game_wins_and_game_points_estimates=(
+            hide_missing_incomplete_game_wins_and_game_points_estimates
+        ),
+        select_each_post_initial_play=False,
+        hide_first_pone_hands=True,
+        hide_first_dealer_hands=True,
+        hide_play_actions=True,
+        games_per_update=sys.maxsize,
+        show_statistics_updates=False,
+        confidence_level=confidence_level,
+        start_time_ns=time.time_ns(),
+        show_calc_cache_usage_stats=False,
     )
 
     sorted_simulated_players_statistics = sorted(
@@ -3698,6 +5900,20 @@ if __name__ == "__main__":
         type=int,
         default=1,
     )
+    parser.add_argument(
+        "--nested-simulation-process-count",
+        help="number of worker processes across which each simulation-based discard"
+        " or play decision spreads its nested simulations; defaults to the"
+        f" {NESTED_SIMULATION_PROCESS_COUNT_ENVIRONMENT_VARIABLE} environment variable"
+        " or 1",
+        type=int,
+    )
+    parser.add_argument(
+        "--seed",
+        help="seed from which each worker process's independent random stream is"
+        " derived, making runs reproducible for a given seed and process count",
+        type=int,
+    )
 
     first_pone_discard_algorithm_group = parser.add_mutually_exclusive_group()
     first_pone_discard_algorithm_group.add_argument(
@@ -4020,6 +6236,49 @@ if __name__ == "__main__":
         action="store_true",
         help="show calculation cache usage statistics",
     )
+    parser.add_argument(
+        "--calc-cache-usage-stats-directory",
+        help="directory to which each worker process writes its calculation cache"
+        " usage statistics as calc_cache_usage_stats.<pid>.json on exit",
+    )
+    parser.add_argument(
+        "--calc-cache-maxsizes",
+        help="comma separated name=size least recently used calculation cache"
+        " maximum entry counts, where size none is unbounded and name * sizes all"
+        " unnamed caches (e.g. '*=100000,pairs_points=none'); defaults to the"
+        f" {CALC_CACHE_MAXSIZES_ENVIRONMENT_VARIABLE} environment variable",
+        default="",
+    )
+    parser.add_argument(
+        "--calc-cache-memory-ceiling",
+        help="approximate total calculation cache memory in bytes, with optional K,"
+        " M or G suffix, above which the largest caches are cleared; defaults to the"
+        f" {CALC_CACHE_MEMORY_CEILING_ENVIRONMENT_VARIABLE} environment variable",
+        default="",
+    )
+    parser.add_argument(
+        "--game-results-directory",
+        help="directory to which each worker process writes its per-game results,"
+        " in batches of --games-per-update games, as game_results.<worker>.bin",
+    )
+    parser.add_argument(
+        "--checkpoint-directory",
+        help="directory to which each worker process atomically writes its"
+        " statistics, dropped keeps and random state as checkpoint.<worker>.pickle"
+        " at every statistics update",
+    )
+    parser.add_argument(
+        "--resume-from",
+        help="checkpoint directory of an interrupted run, with the same options and"
+        " process count, to continue from; checkpoints continue to be written there"
+        " unless --checkpoint-directory is given",
+    )
+    parser.add_argument(
+        "--statistics-snapshot",
+        help="file to which the run's configuration and statistics are written on"
+        " completion, for merging with other runs' snapshots by"
+        " scripts/merge_statistics_snapshots.py",
+    )
     parser.add_argument(
         "--games-per-update",
         help="number of games to simulate per statistics update",
@@ -4067,6 +6326,33 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    # Worker processes started by spawn re-import this module and so read the
+    # cache configuration back from the environment.
+    try:
+        if args.calc_cache_maxsizes:
+            configure_calc_cache_maxsizes(
+                parse_calc_cache_maxsizes(args.calc_cache_maxsizes)
+            )
+            os.environ[CALC_CACHE_MAXSIZES_ENVIRONMENT_VARIABLE] = (
+                args.calc_cache_maxsizes
+            )
+        if args.calc_cache_memory_ceiling:
+            configure_calc_cache_memory_ceiling(
+                parse_memory_size(args.calc_cache_memory_ceiling)
+            )
+            os.environ[CALC_CACHE_MEMORY_CEILING_ENVIRONMENT_VARIABLE] = (
+                args.calc_cache_memory_ceiling
+            )
+    except ValueError as error:
+        parser.error(str(error))
+    if args.nested_simulation_process_count is not None:
+        if args.nested_simulation_process_count < 1:
+            parser.error("--nested-simulation-process-count must be at least 1")
+        nested_simulation_process_count = args.nested_simulation_process_count
+        os.environ[NESTED_SIMULATION_PROCESS_COUNT_ENVIRONMENT_VARIABLE] = str(
+            nested_simulation_process_count
+        )
+
     [
         args_first_pone_dealt_cards,
         args_first_dealer_dealt_cards,
@@ -4088,9 +6374,38 @@ if __name__ == "__main__":
         args.initial_play_actions
     )
 
-    main_manager = Manager()
-    main_players_statistics: DictProxy[NextAction, Statistics] = main_manager.dict()
-    main_players_statistics_lock = Lock()
+    resume_checkpoints: List[Optional[SimulationCheckpoint]] = [None] * (
+        args.process_count
+    )
+    if args.resume_from:
+        try:
+            resume_checkpoints = list(
+                read_resume_checkpoints(args.resume_from, args.process_count)
+            )
+        except (OSError, ValueError, pickle.UnpicklingError) as error:
+            parser.error(f"cannot resume from {args.resume_from}: {error}")
+    checkpoint_directory: Optional[str] = args.checkpoint_directory or args.resume_from
+    checkpoint_paths = [
+        (
+            get_checkpoint_path(checkpoint_directory, process_number)
+            if checkpoint_directory
+            else None
+        )
+        for process_number in range(args.process_count)
+    ]
+
+    main_players_statistics = PlayersStatisticsStore()
+    restored_game_count = sum(
+        resume_checkpoint.game_count
+        for resume_checkpoint in resume_checkpoints
+        if resume_checkpoint is not None
+    )
+    for resume_checkpoint in resume_checkpoints:
+        if resume_checkpoint is not None:
+            if args.process_count == 1:
+                main_players_statistics = resume_checkpoint.players_statistics
+            else:
+                main_players_statistics.merge(resume_checkpoint.players_statistics)
     game_count = (
         sys.maxsize
         if args.infinite_game_count
@@ -4265,7 +6580,7 @@ if __name__ == "__main__":
         and not args.select_each_post_initial_play
     )
     args_start_of_hand_position_results_tallies: shelve.Shelf[object] = shelve.open(
-        "start_of_hand_position_results_tallies_shelf",
+        START_OF_HAND_POSITION_RESULTS_TALLIES_SHELF_FILENAME,
         flag=("c" if args_tally_start_of_hand_position_results else "r"),
     )
 
@@ -4283,7 +6598,6 @@ if __name__ == "__main__":
         args_initial_starter,
         args_initial_play_actions,
         main_players_statistics,
-        main_players_statistics_lock,
         args_first_pone_select_kept_cards,
         args.first_pone_discard_based_on_simulations,
         args.first_pone_select_each_possible_kept_hand,
@@ -4310,24 +6624,142 @@ if __name__ == "__main__":
         args.confidence_level,
         main_start_time_ns,
         args.show_calc_cache_usage_stats,
+        args.calc_cache_usage_stats_directory,
     )
+    worker_seeds = [
+        get_worker_seed(args.seed, process_number) if args.seed is not None else None
+        for process_number in range(args.process_count)
+    ]
+    game_results_paths = [
+        (
+            os.path.join(
+                args.game_results_directory, f"game_results.{process_number}.bin"
+            )
+            if args.game_results_directory
+            else None
+        )
+        for process_number in range(args.process_count)
+    ]
     if args.process_count == 1:
-        simulate_games(*simulate_games_args)
+        simulate_games(
+            *simulate_games_args,
+            worker_seeds[0],
+            None,
+            game_results_paths[0],
+            checkpoint_paths[0],
+            resume_checkpoints[0],
+            0,
+            1,
+        )
     else:
+        # Each worker accumulates into its own copy of main_players_statistics
+        # and queues its statistics deltas, which are merged and reported here,
+        # and applies the next actions dropped here from its own queue.
+        main_players_statistics_queue: Queue = MultiprocessingQueue()
+        dropped_next_actions_queues: List[Queue] = [
+            MultiprocessingQueue() for _ in range(args.process_count)
+        ]
         processes = [
-            Process(target=simulate_games, args=simulate_games_args)
-            for process_number in range(args.process_count)
+            Process(
+                target=simulate_games,
+                args=(
+                    *simulate_games_args,
+                    worker_seed,
+                    main_players_statistics_queue,
+                    game_results_path,
+                    checkpoint_path,
+                    resume_checkpoint,
+                    process_number,
+                    args.process_count,
+                    dropped_next_actions_queue,
+                ),
+            )
+            for process_number, (
+                worker_seed,
+                game_results_path,
+                checkpoint_path,
+                resume_checkpoint,
+                dropped_next_actions_queue,
+            ) in enumerate(
+                zip(
+                    worker_seeds,
+                    game_results_paths,
+                    checkpoint_paths,
+                    resume_checkpoints,
+                    dropped_next_actions_queues,
+                )
+            )
         ]
         for process in processes:
             process.start()
         try:
+            reduce_players_statistics_deltas(
+                main_players_statistics_queue,
+                args.process_count,
+                main_players_statistics,
+                game_count,
+                args_first_pone_dealt_cards,
+                args_first_dealer_dealt_cards,
+                get_kept_including_played_cards(
+                    args_first_pone_kept_cards, args_initial_play_actions[0::2]
+                ),
+                get_kept_including_played_cards(
+                    args_first_dealer_kept_cards, args_initial_play_actions[1::2]
+                ),
+                args.confidence_level,
+                main_start_time_ns,
+                restored_game_count,
+                dropped_next_actions_queues,
+            )
             for process in processes:
                 process.join()
         except KeyboardInterrupt:
-            sys.exit(0)
+            sys.exit(INTERRUPTED_EXIT_STATUS)
+        # A worker interrupted on its own or failing leaves the run incomplete.
+        worker_exit_codes = [process.exitcode for process in processes]
+        if INTERRUPTED_EXIT_STATUS in worker_exit_codes:
+            sys.exit(INTERRUPTED_EXIT_STATUS)
+        if any(worker_exit_codes):
+            sys.exit(f"Worker processes exited with status codes {worker_exit_codes}")
+
+    if args.statistics_snapshot:
+        write_statistics_snapshot(
+            args.statistics_snapshot,
+            get_simulation_configuration(
+                args_maximum_hands_per_game,
+                initial_pone_score,
+                initial_dealer_score,
+                args_first_pone_dealt_cards,
+                args_first_dealer_dealt_cards,
+                get_kept_including_played_cards(
+                    args_first_pone_kept_cards, args_initial_play_actions[0::2]
+                ),
+                get_kept_including_played_cards(
+                    args_first_dealer_kept_cards, args_initial_play_actions[1::2]
+                ),
+                args_initial_starter,
+                args_initial_play_actions,
+                args_first_pone_select_kept_cards,
+                args.first_pone_discard_based_on_simulations,
+                args.first_pone_select_each_possible_kept_hand,
+                args_first_dealer_select_kept_cards,
+                args.first_dealer_discard_based_on_simulations,
+                args.first_dealer_select_each_possible_kept_hand,
+                args_first_pone_select_play,
+                args.first_pone_play_based_on_simulations,
+                args_first_dealer_select_play,
+                args.first_dealer_play_based_on_simulations,
+                args.estimate_first_pone_incomplete_game_wins_and_game_points,
+                args.estimate_first_dealer_incomplete_game_wins_and_game_points,
+                args.select_each_post_initial_play,
+            ),
+            main_players_statistics,
+        )
 
+    simulated_game_count = get_length_across_all_keys(main_players_statistics)
+    session_game_count = simulated_game_count - restored_game_count
     print(
-        f"Simulated {get_length_across_all_keys(main_players_statistics)} games with"
+        f"Simulated {simulated_game_count} games with"
         f" {args.process_count} worker processes at"
-        f" {simulation_performance_statistics(main_start_time_ns, game_count)}"
+        f" {simulation_performance_statistics(main_start_time_ns, session_game_count)}"
     )
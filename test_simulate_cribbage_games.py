@@ -2,7 +2,19 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import contextlib
+import copy
+import io
+import itertools
+import json
+import os
+import pickle
+import queue
+import random
+import tempfile
 import unittest
+import unittest.mock
+import runstats
 import simulate_cribbage_games
 
 
@@ -61,6 +73,1114 @@ class TestSimulateCribbageGames(unittest.TestCase):
         self.assertAlmostEqual(expected_nobs(no_extra_club), 12 / 46)
         self.assertAlmostEqual(expected_nobs(extra_club), 11 / 46)
 
+    def test_pairs_runs_and_fifteens_points_table_matches_enumeration(self):
+        """The dense 5-index table matches per-hand combination enumeration."""
+        table = simulate_cribbage_games.HAND_PLUS_STARTER_PAIRS_RUNS_AND_FIFTEENS_POINTS
+        self.assertEqual(len(table), 6188)
+        ranks = set()
+        for sorted_indices in itertools.combinations_with_replacement(range(13), 5):
+            rank = simulate_cribbage_games.hand_plus_starter_index_multiset_rank(
+                sorted_indices
+            )
+            ranks.add(rank)
+            self.assertEqual(
+                simulate_cribbage_games.index_multiset_rank(sorted_indices), rank
+            )
+            self.assertEqual(
+                table[rank],
+                simulate_cribbage_games.uncached_pairs_runs_and_fifteens_points(
+                    sorted_indices
+                ),
+            )
+        self.assertEqual(ranks, set(range(6188)))
+
+    def test_cached_pairs_runs_and_fifteens_points_other_lengths(self):
+        self.assertEqual(
+            simulate_cribbage_games.cached_pairs_runs_and_fifteens_points(
+                (4, 4, 4, 4, 10)
+            ),
+            28,
+        )
+        self.assertEqual(
+            simulate_cribbage_games.cached_pairs_runs_and_fifteens_points(
+                (3, 4, 4, 5)
+            ),
+            2 + 6 + 4,
+        )
+
+    def test_card_id_scoring_matches_card_scoring(self):
+        """Integer card ID scoring agrees with the Card object scoring API."""
+        scg = simulate_cribbage_games
+        rng = random.Random(0)
+        for card in scg.DECK_LIST:
+            self.assertIs(scg.card_from_id(scg.card_id(card)), card)
+        for _ in range(2000):
+            *kept_hand, starter = rng.sample(scg.DECK_LIST, 5)
+            kept_hand_card_ids = [scg.card_id(card) for card in kept_hand]
+            starter_card_id = scg.card_id(starter)
+            for is_crib in (False, True):
+                self.assertEqual(
+                    scg.score_card_ids_hand_and_starter(
+                        kept_hand_card_ids, starter_card_id, is_crib=is_crib
+                    ),
+                    scg.score_hand_and_starter(kept_hand, starter, is_crib=is_crib),
+                )
+                self.assertEqual(
+                    scg.card_ids_flush_points(
+                        kept_hand_card_ids, starter_card_id, is_crib=is_crib
+                    ),
+                    scg.flush_points(kept_hand, starter, is_crib=is_crib),
+                )
+            self.assertEqual(
+                scg.card_ids_nobs_points(kept_hand_card_ids, starter_card_id),
+                scg.nobs_points(kept_hand, starter),
+            )
+            self.assertEqual(
+                scg.get_card_ids_current_play_run_length(kept_hand_card_ids),
+                scg.get_current_play_run_length(kept_hand),
+            )
+            self.assertEqual(
+                scg.card_ids_play_count(kept_hand_card_ids),
+                sum(card.count for card in kept_hand),
+            )
+
+    def test_score_card_ids_hands_and_starters_batch_shapes(self):
+        """Batch scoring accepts one starter or a row of starters per hand."""
+        scg = simulate_cribbage_games
+        rng = random.Random(1)
+        deals = [rng.sample(range(52), 5) for _ in range(200)]
+        kept_hands = [deal[:4] for deal in deals]
+        starters = [deal[4] for deal in deals]
+
+        for is_crib in (False, True):
+            expected = [
+                scg.score_card_ids_hand_and_starter(kept, starter, is_crib=is_crib)
+                for kept, starter in zip(kept_hands, starters)
+            ]
+            self.assertEqual(
+                scg.score_card_ids_hands_and_starters(
+                    kept_hands, starters, is_crib=is_crib
+                ),
+                expected,
+            )
+            self.assertEqual(
+                scg.score_card_ids_hands_and_starters(
+                    kept_hands, [[starter] for starter in starters], is_crib=is_crib
+                ),
+                [[score] for score in expected],
+            )
+            breakdowns = scg.score_card_ids_hands_and_starters(
+                kept_hands, starters, is_crib=is_crib, by_category=True
+            )
+            self.assertEqual([breakdown.total for breakdown in breakdowns], expected)
+
+        fives_and_jack = [scg.index_and_suit_card_id(4, suit) for suit in range(3)] + [
+            scg.index_and_suit_card_id(10, 3)
+        ]
+        self.assertEqual(
+            scg.score_card_ids_hands_and_starters(
+                [fives_and_jack],
+                [scg.index_and_suit_card_id(4, 3)],
+                by_category=True,
+            ),
+            [scg.HandPointsBreakdown(16, 12, 0, 0, 1)],
+        )
+
+    def test_score_card_ids_hand_and_starter_breakdown(self):
+        """The single-pass breakdown matches the per-category scoring helpers."""
+        scg = simulate_cribbage_games
+        rng = random.Random(2)
+        for _ in range(2000):
+            *kept_hand, starter = rng.sample(scg.DECK_LIST, 5)
+            sorted_indices = tuple(sorted(card.index for card in [*kept_hand, starter]))
+            for is_crib in (False, True):
+                self.assertEqual(
+                    scg.score_card_ids_hand_and_starter_breakdown(
+                        [scg.card_id(card) for card in kept_hand],
+                        scg.card_id(starter),
+                        is_crib=is_crib,
+                    ),
+                    (
+                        scg.fifteens_points([*kept_hand, starter]),
+                        scg.pairs_points(sorted_indices),
+                        scg.runs_points(sorted_indices),
+                        scg.flush_points(kept_hand, starter, is_crib=is_crib),
+                        scg.nobs_points(kept_hand, starter),
+                    ),
+                )
+
+    def test_kept_hand_starter_tables_match_scoring_over_remaining_deck(self):
+        """Starter-index and starter-suit tables give exact totals over starters."""
+        scg = simulate_cribbage_games
+        self.assertEqual(len(scg.KEPT_INDICES_POINTS_BY_STARTER_INDEX), 1820)
+        rng = random.Random(3)
+        for _ in range(100):
+            dealt = rng.sample(scg.DECK_LIST, 6)
+            starters = [card for card in scg.DECK_LIST if card not in dealt]
+            starter_index_counts = [0] * 13
+            starter_suit_counts = [0] * 4
+            for starter in starters:
+                starter_index_counts[starter.index] += 1
+                starter_suit_counts[starter.suit] += 1
+            for kept_hand in itertools.combinations(dealt, 4):
+                for is_crib in (False, True):
+                    self.assertEqual(
+                        scg.kept_card_ids_total_points_over_starters(
+                            [scg.card_id(card) for card in kept_hand],
+                            starter_index_counts,
+                            starter_suit_counts,
+                            is_crib=is_crib,
+                        ),
+                        sum(
+                            scg.score_hand_and_starter(
+                                kept_hand, starter, is_crib=is_crib
+                            )
+                            for starter in starters
+                        ),
+                    )
+
+    def test_cache_usage_registry_reports_and_dumps_every_cache(self):
+        """Every memoized calculation reports hits, misses, size and bytes."""
+        scg = simulate_cribbage_games
+        scg.pairs_points.cache_clear()
+        scg.pairs_points((0, 0, 4, 9, 12))
+        scg.pairs_points((0, 0, 4, 9, 12))
+        cache_usages = scg.get_cache_usages()
+        for name in (
+            "cached_fifteens_points",
+            "pairs_points",
+            "runs_points",
+            "cached_other_length_pairs_runs_and_fifteens_points",
+            "cached_get_current_play_run_length",
+            "cached_keep_max_pre_cut_hand_points_ignoring_suit",
+            "cached_keep_max_post_cut_hand_points_ignoring_suit",
+            "expected_random_opponent_discard_crib_points_ignoring_suit",
+            "cached_keep_max_post_cut_hand_plus_or_minus_crib_points_ignoring_suit",
+            "average_post_cut_hand_points_ignoring_suit_and_discarded",
+        ):
+            self.assertIn(name, cache_usages)
+        self.assertEqual(
+            cache_usages["pairs_points"],
+            scg.CacheUsage(1, 1, 1, scg.APPROXIMATE_FUNCTOOLS_CACHE_ENTRY_BYTES),
+        )
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = scg.dump_cache_usages(temporary_directory)
+            self.assertEqual(
+                os.path.basename(path), f"calc_cache_usage_stats.{os.getpid()}.json"
+            )
+            with open(path, encoding="utf-8") as cache_usages_file:
+                dumped_cache_usages = json.load(cache_usages_file)
+        self.assertEqual(dumped_cache_usages["pid"], os.getpid())
+        self.assertEqual(
+            dumped_cache_usages["caches"]["pairs_points"],
+            cache_usages["pairs_points"]._asdict(),
+        )
+
+    def test_parse_calc_cache_maxsizes_and_memory_size(self):
+        """Cache sizes parse from name=size pairs and memory sizes from suffixes."""
+        scg = simulate_cribbage_games
+        self.assertEqual(
+            scg.parse_calc_cache_maxsizes(" *=100, pairs_points=none,"),
+            {"*": 100, "pairs_points": None},
+        )
+        for calc_cache_maxsizes in ("pairs_points", "=5", "runs_points=0"):
+            with self.assertRaises(ValueError):
+                scg.parse_calc_cache_maxsizes(calc_cache_maxsizes)
+        self.assertIsNone(scg.parse_memory_size(" "))
+        self.assertEqual(scg.parse_memory_size("512"), 512)
+        self.assertEqual(scg.parse_memory_size("2k"), 2048)
+        self.assertEqual(scg.parse_memory_size("3G"), 3 * 1024**3)
+        with self.assertRaises(ValueError):
+            scg.parse_memory_size("lots")
+
+    def test_configure_calc_cache_maxsizes_and_memory_ceiling(self):
+        """Resized caches evict old entries and a memory ceiling clears caches."""
+        scg = simulate_cribbage_games
+        with self.assertRaises(ValueError):
+            scg.configure_calc_cache_maxsizes({"no_such_cache": 1})
+        try:
+            scg.configure_calc_cache_maxsizes({"runs_points": 2})
+            self.assertEqual(scg.runs_points.cache_parameters()["maxsize"], 2)
+            self.assertIs(
+                scg.runs_points.__wrapped__, scg.UNCACHED_FUNCTIONS["runs_points"]
+            )
+            for sorted_indices in ((0, 1, 2), (3, 4, 5), (6, 7, 8)):
+                self.assertEqual(scg.runs_points(sorted_indices), 3)
+            self.assertEqual(scg.get_cache_usages()["runs_points"].size, 2)
+
+            scg.pairs_points.cache_clear()
+            scg.pairs_points((0, 0, 4, 9, 12))
+            scg.configure_calc_cache_memory_ceiling(0)
+            cleared_cache_names = scg.enforce_calc_cache_memory_ceiling()
+            self.assertIn("runs_points", cleared_cache_names)
+            self.assertIn("pairs_points", cleared_cache_names)
+            self.assertEqual(scg.get_cache_usages()["runs_points"].size, 0)
+            self.assertEqual(scg.get_cache_usages()["pairs_points"].size, 0)
+        finally:
+            scg.configure_calc_cache_memory_ceiling(None)
+            scg.configure_calc_cache_maxsizes({"runs_points": None})
+        self.assertEqual(scg.enforce_calc_cache_memory_ceiling(), [])
+        self.assertIsNone(scg.runs_points.cache_parameters()["maxsize"])
+
+    def test_scoring_tables_round_trip_through_a_mapped_file(self):
+        """Written tables map back read-only until their builders change."""
+        scg = simulate_cribbage_games
+        scoring_tables = scg.prebuilt_scoring_tables()
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "scoring_tables.bin")
+            self.assertIsNone(scg.load_scoring_tables(path))
+            scg.write_scoring_tables(path, scoring_tables)
+            mapped_scoring_tables = scg.load_scoring_tables(path)
+            assert mapped_scoring_tables is not None
+            self.assertEqual(set(mapped_scoring_tables), set(scoring_tables))
+            for name, table in scoring_tables.items():
+                self.assertEqual(list(mapped_scoring_tables[name]), list(table))
+                self.assertTrue(mapped_scoring_tables[name].readonly)
+            del mapped_scoring_tables
+
+            with unittest.mock.patch.object(
+                scg,
+                "SCORING_TABLES_BUILDERS",
+                (*scg.SCORING_TABLES_BUILDERS, scg.score_hand_and_starter),
+            ):
+                changed_builders_digest = scg.scoring_tables_digest()
+            self.assertNotEqual(changed_builders_digest, scg.SCORING_TABLES_DIGEST)
+            with unittest.mock.patch.object(
+                scg, "SCORING_TABLES_DIGEST", changed_builders_digest
+            ):
+                self.assertIsNone(scg.load_scoring_tables(path))
+
+            with open(path, "r+b") as scoring_tables_file:
+                scoring_tables_file.seek(len(scg.SCORING_TABLES_MAGIC))
+                scoring_tables_file.write(
+                    (scg.SCORING_TABLES_FORMAT_VERSION + 1).to_bytes(4, "little")
+                )
+            self.assertIsNone(scg.load_scoring_tables(path))
+
+    def test_play_run_length_table_matches_adjacent_index_scan(self):
+        """The is-run tables find the same play runs as scanning sorted indices."""
+        scg = simulate_cribbage_games
+        rng = random.Random(4)
+        for _ in range(5000):
+            play_indices = tuple(rng.randrange(13) for _ in range(rng.randint(0, 8)))
+            if sum(min(index + 1, 10) for index in play_indices) > 31:
+                continue
+            expected_run_length = 0
+            for run_length in range(3, len(play_indices) + 1):
+                sorted_recent_indices = sorted(play_indices[-run_length:])
+                if sorted_recent_indices == list(
+                    range(
+                        sorted_recent_indices[0], sorted_recent_indices[0] + run_length
+                    )
+                ):
+                    expected_run_length = run_length
+            self.assertEqual(
+                scg.cached_get_current_play_run_length(play_indices),
+                expected_run_length,
+            )
+
+    def test_exact_random_opponent_discard_crib_points_matches_enumeration(self):
+        """Grouped crib EV counting equals enumerating starters and discards."""
+        scg = simulate_cribbage_games
+        for discarded_dealt_cards in (
+            (scg.Card(10, 0), scg.Card(4, 0)),
+            (scg.Card(10, 2), scg.Card(10, 1)),
+        ):
+            deck_less_discards = [
+                card for card in scg.DECK_LIST if card not in discarded_dealt_cards
+            ]
+            crib_points = [
+                scg.score_hand_and_starter(
+                    [*discarded_dealt_cards, *opponent_discard], starter, is_crib=True
+                )
+                for starter in deck_less_discards
+                for opponent_discard in itertools.combinations(
+                    [card for card in deck_less_discards if card != starter], 2
+                )
+            ]
+            self.assertEqual(
+                scg.exact_expected_random_opponent_discard_crib_points(
+                    discarded_dealt_cards
+                ),
+                sum(crib_points) / len(crib_points),
+            )
+
+    def test_expected_random_opponent_discard_crib_points_table_is_exact(self):
+        """The bundled 169 pair crib points table matches the exact evaluator."""
+        scg = simulate_cribbage_games
+        self.assertEqual(len(scg.EXPECTED_RANDOM_OPPONENT_DISCARD_CRIB_POINTS), 169)
+        for (
+            high_index,
+            low_index,
+            is_suited,
+        ), average_crib_points in (
+            scg.EXPECTED_RANDOM_OPPONENT_DISCARD_CRIB_POINTS.items()
+        ):
+            self.assertEqual(
+                scg.exact_expected_random_opponent_discard_crib_points(
+                    (
+                        scg.Card(high_index, 0),
+                        scg.Card(low_index, 0 if is_suited else 1),
+                    )
+                ),
+                average_crib_points,
+            )
+        self.assertEqual(
+            scg.expected_random_opponent_discard_crib_points(
+                [scg.Card(3, 2), scg.Card(11, 2)]
+            ),
+            scg.EXPECTED_RANDOM_OPPONENT_DISCARD_CRIB_POINTS[(11, 3, True)],
+        )
+
+    def test_expected_random_opponent_discard_crib_points_disk_cache_is_opt_in(self):
+        """Discards missing from the table are computed, or disk cached if opted in."""
+        scg = simulate_cribbage_games
+        self.assertIsNone(scg.expected_random_opponent_discard_crib_points_cache)
+        non_canonical_discard = (scg.Card(4, 2), scg.Card(5, 3))
+        expected_crib_points = scg.exact_expected_random_opponent_discard_crib_points(
+            non_canonical_discard
+        )
+        self.assertEqual(
+            scg.cached_expected_random_opponent_discard_crib_points(
+                non_canonical_discard
+            ),
+            expected_crib_points,
+        )
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            disk_cache = scg.open_expected_random_opponent_discard_crib_points_cache(
+                temporary_directory
+            )
+            try:
+                with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                    for _ in range(2):
+                        self.assertEqual(
+                            scg.cached_expected_random_opponent_discard_crib_points(
+                                non_canonical_discard
+                            ),
+                            expected_crib_points,
+                        )
+                self.assertEqual(stdout.getvalue().count("Adding to disk cache"), 1)
+                self.assertEqual(
+                    scg.get_cache_usages()[
+                        "expected_random_opponent_discard_crib_points_cache"
+                    ].size,
+                    1,
+                )
+            finally:
+                disk_cache.close()
+                scg.expected_random_opponent_discard_crib_points_cache = None
+                del scg.CACHE_USAGE_GETTERS[
+                    "expected_random_opponent_discard_crib_points_cache"
+                ]
+
+    def test_cards_are_interned_flyweights(self):
+        """Every way of making a card yields the one slotted instance per card."""
+        scg = simulate_cribbage_games
+        card = scg.Card(10, 3)
+        self.assertIs(scg.Card(10, 3), card)
+        self.assertIs(scg.Card.from_string("JS"), card)
+        self.assertIs(scg.card_from_id(scg.index_and_suit_card_id(10, 3)), card)
+        self.assertIs(pickle.loads(pickle.dumps(card)), card)
+        self.assertIs(copy.deepcopy(card), card)
+        self.assertEqual(hash(card), hash((10, 3)))
+        self.assertNotEqual(card, scg.Card(10, 2))
+        self.assertFalse(hasattr(card, "__dict__"))
+        self.assertIs(scg.Card.interned[(10, 3)], card)
+
+    def test_card_mask_deck_operations_and_sampling(self):
+        """Bitmask decks remove, test, count and uniformly sample card IDs."""
+        scg = simulate_cribbage_games
+        self.assertEqual(scg.card_mask_count(scg.FULL_DECK_CARD_MASK), 52)
+        self.assertEqual(
+            scg.card_mask_card_ids(scg.FULL_DECK_CARD_MASK), list(range(52))
+        )
+        jack_of_spades_id = scg.card_id(scg.Card(10, 3))
+        deck_mask = scg.card_mask_remove(scg.FULL_DECK_CARD_MASK, jack_of_spades_id)
+        self.assertFalse(scg.card_mask_contains(deck_mask, jack_of_spades_id))
+        self.assertTrue(scg.card_mask_contains(deck_mask, jack_of_spades_id - 1))
+        hand_mask = scg.cards_mask([scg.Card(0, 0), scg.Card(12, 3)])
+        self.assertEqual(hand_mask, scg.card_ids_mask([0, 51]))
+        deck_mask = scg.card_mask_difference(deck_mask, hand_mask)
+        self.assertEqual(scg.card_mask_count(deck_mask), 49)
+        self.assertEqual(scg.card_mask_count(scg.EMPTY_CARD_MASK), 0)
+
+        rng = random.Random(0)
+        sampled_counts = [0] * 52
+        for _ in range(2000):
+            sampled_card_ids = scg.sample_card_mask_card_ids(deck_mask, 12, rng)
+            self.assertEqual(len(set(sampled_card_ids)), 12)
+            for sampled_card_id in sampled_card_ids:
+                self.assertTrue(scg.card_mask_contains(deck_mask, sampled_card_id))
+                sampled_counts[sampled_card_id] += 1
+        expected_count = 2000 * 12 / 49
+        for deck_card_id in scg.card_mask_card_ids(deck_mask):
+            self.assertLess(abs(sampled_counts[deck_card_id] - expected_count), 120)
+        self.assertEqual(
+            sorted(scg.sample_card_mask_card_ids(hand_mask, 2, rng)), [0, 51]
+        )
+        with self.assertRaises(ValueError):
+            scg.sample_card_mask_card_ids(hand_mask, 3, rng)
+
+    def test_suit_canonical_forms_match_brute_force_and_invert(self):
+        """Sort-based suit canonicalization equals the 24-permutation minimum."""
+        scg = simulate_cribbage_games
+        rng = random.Random(0)
+        for _ in range(2000):
+            card_ids = rng.sample(range(52), rng.choice((4, 5, 6)))
+            index_suit_pairs = [
+                (scg.CARD_ID_INDICES[each_id], scg.CARD_ID_SUITS[each_id])
+                for each_id in card_ids
+            ]
+            canonical_pairs, suit_by_canonical_suit = (
+                scg.suit_canonical_index_suit_pairs(index_suit_pairs)
+            )
+            self.assertEqual(
+                canonical_pairs,
+                min(
+                    tuple(
+                        sorted(
+                            (index, permutation[suit])
+                            for index, suit in index_suit_pairs
+                        )
+                    )
+                    for permutation in itertools.permutations(range(4))
+                ),
+            )
+            canonical_card_ids, card_ids_suit_by_canonical_suit = (
+                scg.suit_canonical_card_ids(card_ids)
+            )
+            self.assertEqual(card_ids_suit_by_canonical_suit, suit_by_canonical_suit)
+            self.assertEqual(
+                sorted(
+                    scg.suit_permuted_card_ids(
+                        canonical_card_ids, suit_by_canonical_suit
+                    )
+                ),
+                sorted(card_ids),
+            )
+
+    def test_headless_game_engine_matches_simulate_game(self):
+        """The headless engine plays the same seeded games as simulate_game."""
+        scg = simulate_cribbage_games
+
+        def cards(card_strings):
+            return [scg.Card.from_string(card_string) for card_string in card_strings]
+
+        game_setups = [
+            ([], [], None, [], False),
+            (cards(["AC", "2D", "3H", "4S", "5C", "6D"]), [], None, [], True),
+            (
+                [],
+                cards(["5H", "5S", "JD", "TC"]),
+                scg.Card.from_string("5C"),
+                cards(["TC", "9D"]),
+                False,
+            ),
+        ]
+        for (
+            first_pone_dealt_cards,
+            first_pone_kept_cards,
+            initial_starter,
+            initial_play_actions,
+            select_each_possible_kept_hand,
+        ) in game_setups:
+            fixed_cards = first_pone_dealt_cards + first_pone_kept_cards
+            fixed_cards += initial_play_actions[1::2]
+            fixed_cards += [initial_starter] if initial_starter else []
+            deck_less_fixed_cards = [
+                card for card in scg.DECK_LIST if card not in fixed_cards
+            ]
+            shared_arguments = {
+                "first_pone_dealt_cards": first_pone_dealt_cards,
+                "first_dealer_dealt_cards": [],
+                "deck_less_fixed_cards": deck_less_fixed_cards,
+                "first_pone_kept_cards": first_pone_kept_cards,
+                "first_dealer_kept_cards": initial_play_actions[1::2],
+                "initial_starter": initial_starter,
+                "maximum_hands_per_game": 1000,
+                "first_pone_select_kept_cards": scg.DEFAULT_SELECT_PONE_KEPT_CARDS,
+                "first_pone_discard_based_on_simulations": None,
+                "first_pone_select_each_possible_kept_hand": (
+                    select_each_possible_kept_hand
+                ),
+                "first_dealer_select_kept_cards": scg.DEFAULT_SELECT_DEALER_KEPT_CARDS,
+                "first_dealer_discard_based_on_simulations": None,
+                "first_dealer_select_each_possible_kept_hand": False,
+                "first_pone_select_play": scg.DEFAULT_SELECT_PLAY,
+                "first_pone_play_based_on_simulations": None,
+                "first_dealer_select_play": scg.DEFAULT_SELECT_PLAY,
+                "first_dealer_play_based_on_simulations": None,
+                "tally_start_of_hand_position_results": False,
+                "estimate_first_pone_incomplete_game_wins_and_game_points": False,
+                "estimate_first_dealer_incomplete_game_wins_and_game_points": False,
+                "start_of_hand_position_results_tallies": None,
+                "dropped_keeps": set(),
+                "initial_first_pone_score": scg.Points(0),
+                "initial_first_dealer_score": scg.Points(0),
+                "post_initial_play": None,
+                "initial_play_actions": initial_play_actions,
+            }
+            for seed in range(20):
+                results = []
+                for headless in (False, True):
+                    random.seed(seed)
+                    possible_keeps_cycles = {
+                        "first_pone_dealt_cards_possible_keeps_cycle": itertools.cycle(
+                            itertools.combinations(first_pone_dealt_cards, 4)
+                        ),
+                        "first_dealer_dealt_cards_possible_keeps_cycle": (
+                            itertools.cycle([])
+                        ),
+                    }
+                    if headless:
+                        game_simulation_result = scg.simulate_headless_game(
+                            **shared_arguments, **possible_keeps_cycles
+                        )
+                    else:
+                        game_simulation_result = scg.simulate_game(
+                            **shared_arguments,
+                            **possible_keeps_cycles,
+                            coach_discard_simulated_hand_count=None,
+                            coach_play_simulated_hand_count=None,
+                            hide_first_pone_hands=True,
+                            hide_first_dealer_hands=True,
+                            hide_play_actions=True,
+                        )
+                    results += [game_simulation_result, random.getstate()]
+                self.assertEqual(results[0:2], results[2:4])
+                self.assertTrue(
+                    scg.game_over(results[2].score)
+                    or results[
+                        2
+                    ].non_kept_card_kept_or_non_kept_initial_played_card_played
+                )
+
+    def test_game_score_accumulator_matches_game_score_rebuilds(self):
+        """Accumulated scoring events agree with rebuilt GameScore tuples."""
+        scg = simulate_cribbage_games
+        rng = random.Random(0)
+        for _ in range(200):
+            initial_scores = (scg.Points(rng.randrange(100)), scg.Points(0))
+            game_score = scg.GameScore(
+                initial_scores[0], 0, 0, 0, initial_scores[1], 0, 0, 0
+            )
+            accumulator = scg.GameScoreAccumulator(*initial_scores)
+            while not scg.game_over(game_score):
+                scoring_event = (
+                    rng.choice(list(scg.GamePlayer)),
+                    rng.choice(list(scg.PointsType)),
+                    scg.Points(rng.randrange(30)),
+                )
+                game_score = scg.add_to_game_score(game_score, *scoring_event)
+                self.assertEqual(
+                    accumulator.add(*scoring_event), scg.game_over(game_score)
+                )
+                self.assertEqual(accumulator.to_game_score(), game_score)
+                self.assertEqual(str(accumulator), str(game_score))
+            self.assertTrue(accumulator.is_over)
+
+    def test_pegging_state_matches_play_history_recomputation(self):
+        """Incremental pegging state agrees with recomputing from the plays."""
+        scg = simulate_cribbage_games
+        rng = random.Random(0)
+        for _ in range(500):
+            # Low cards make pairs, runs and long plays to 31 common.
+            deck = [card for card in scg.DECK_LIST if card.index < 7]
+            rng.shuffle(deck)
+            pegging_state = scg.PeggingState()
+            play_to_31_cards = []
+            for card in deck[:12]:
+                if not pegging_state.is_playable(card):
+                    self.assertFalse(pegging_state.say_go())
+                    self.assertTrue(pegging_state.say_go())
+                    play_to_31_cards = []
+                self.assertEqual(
+                    scg.get_play_run_length_with(play_to_31_cards, card),
+                    scg.get_current_play_run_length([*play_to_31_cards, card]),
+                )
+                paired_card_count = 0
+                while (
+                    paired_card_count < len(play_to_31_cards)
+                    and play_to_31_cards[-1 - paired_card_count].index == card.index
+                ):
+                    paired_card_count += 1
+                play_to_31_cards.append(card)
+                play_count = sum(played.count for played in play_to_31_cards)
+                self.assertEqual(
+                    pegging_state.play_card(card),
+                    (
+                        scg.PAIRED_CARD_COUNT_POINTS[paired_card_count + 1],
+                        {15: scg.FIFTEENS_POINTS, 31: scg.THIRTY_ONE_COUNT_POINTS}.get(
+                            play_count, 0
+                        ),
+                        scg.get_current_play_run_length(play_to_31_cards),
+                    ),
+                )
+                self.assertEqual(pegging_state.play_count, play_count)
+                self.assertEqual(pegging_state.play_to_31_cards, play_to_31_cards)
+
+    def test_worker_seeds_are_reproducible_and_independent(self):
+        """Worker seeds repeat per seed and worker but differ across both."""
+        scg = simulate_cribbage_games
+        worker_seeds = {
+            (seed, worker_number): scg.get_worker_seed(seed, worker_number)
+            for seed in range(3)
+            for worker_number in range(8)
+        }
+        self.assertEqual(len(set(worker_seeds.values())), len(worker_seeds))
+        self.assertEqual(worker_seeds[(1, 2)], scg.get_worker_seed(1, 2))
+
+    def test_reduced_worker_statistics_deltas_match_pooled_statistics(self):
+        """Queued worker deltas merge to the statistics of all pushed games."""
+        scg = simulate_cribbage_games
+        rng = random.Random(0)
+        next_actions = [((card,), None) for card in scg.DECK_LIST[:3]]
+        statistics_queue = queue.Queue()
+        pooled_values = {}
+        for _ in range(2):
+            for _ in range(4):
+                players_statistics_delta = scg.PlayersStatisticsStore()
+                for _ in range(10):
+                    next_action = rng.choice(next_actions)
+                    values = [rng.randrange(30) for _ in scg.PLAYERS_STATISTICS]
+                    players_statistics_delta.push(next_action, values)
+                    for players_statistic, value in zip(scg.PLAYERS_STATISTICS, values):
+                        pooled_values.setdefault(
+                            (next_action, players_statistic), []
+                        ).append(value)
+                statistics_queue.put(
+                    pickle.loads(pickle.dumps(players_statistics_delta))
+                )
+            statistics_queue.put(None)
+        players_statistics = scg.PlayersStatisticsStore()
+        with contextlib.redirect_stdout(io.StringIO()):
+            scg.reduce_players_statistics_deltas(
+                statistics_queue, 2, players_statistics, 80, [], [], [], [], 95, 0
+            )
+        self.assertTrue(statistics_queue.empty())
+        self.assertEqual(scg.get_length_across_all_keys(players_statistics), 80)
+        for (next_action, players_statistic), values in pooled_values.items():
+            statistics = players_statistics[next_action][players_statistic]
+            self.assertEqual(len(statistics), len(values))
+            self.assertAlmostEqual(statistics.mean(), sum(values) / len(values))
+
+    def test_parent_dropped_next_actions_reach_every_worker(self):
+        """Keeps dropped from pooled statistics are queued to each worker."""
+        scg = simulate_cribbage_games
+        rng = random.Random(0)
+        worse_keep, better_keep = (tuple(scg.DECK_LIST[:4]), tuple(scg.DECK_LIST[4:8]))
+        statistics_queue = queue.Queue()
+        for _ in range(2):
+            players_statistics_delta = scg.PlayersStatisticsStore()
+            for _ in range(5):
+                for keep, mean in ((worse_keep, 0), (better_keep, 10)):
+                    players_statistics_delta.push(
+                        (keep, None),
+                        [mean + rng.uniform(-1, 1) for _ in scg.PLAYERS_STATISTICS],
+                    )
+            statistics_queue.put(players_statistics_delta)
+            statistics_queue.put(None)
+        dropped_next_actions_queues = [queue.Queue(), queue.Queue()]
+        with contextlib.redirect_stdout(io.StringIO()):
+            scg.reduce_players_statistics_deltas(
+                statistics_queue,
+                2,
+                scg.PlayersStatisticsStore(),
+                20,
+                [],
+                [],
+                [],
+                [],
+                95,
+                0,
+                dropped_next_actions_queues=dropped_next_actions_queues,
+            )
+        for dropped_next_actions_queue in dropped_next_actions_queues:
+            dropped_keeps = set()
+            dropped_initial_plays = set()
+            scg.receive_dropped_next_actions(
+                dropped_next_actions_queue, dropped_keeps, dropped_initial_plays
+            )
+            self.assertEqual(dropped_keeps, {worse_keep})
+            self.assertEqual(dropped_initial_plays, set())
+            self.assertTrue(dropped_next_actions_queue.empty())
+
+    def test_players_statistics_store_matches_runstats(self):
+        """Store pushes and merges match runstats Statistics exactly."""
+        scg = simulate_cribbage_games
+        rng = random.Random(1)
+        next_actions = [((card,), None) for card in scg.DECK_LIST[:2]]
+        stores = [scg.PlayersStatisticsStore() for _ in range(3)]
+        expected = {}
+        for store in stores:
+            for _ in range(7):
+                next_action = rng.choice(next_actions)
+                values = [rng.uniform(-30, 30) for _ in scg.PLAYERS_STATISTICS]
+                store.push(next_action, values)
+                for players_statistic, value in zip(scg.PLAYERS_STATISTICS, values):
+                    expected.setdefault(
+                        (next_action, players_statistic), runstats.Statistics()
+                    ).push(value)
+        merged = scg.PlayersStatisticsStore()
+        for store in stores:
+            merged.merge(store)
+        self.assertEqual(merged.game_count(), 21)
+        for (next_action, players_statistic), statistics in expected.items():
+            actual = merged[next_action][players_statistic]
+            self.assertEqual(len(actual), len(statistics))
+            self.assertAlmostEqual(actual.mean(), statistics.mean(), places=12)
+            self.assertAlmostEqual(actual.variance(), statistics.variance(), places=9)
+            self.assertEqual(actual.minimum(), statistics.minimum())
+            self.assertEqual(actual.maximum(), statistics.maximum())
+
+    def test_nested_simulation_pool_shares_are_reproducible_and_complete(self):
+        """Pooled nested simulations cover every keep and repeat per seed."""
+        scg = simulate_cribbage_games
+        dealt_cards = scg.parse_cards("AC,2D,3H,4S,5C,6D")
+        simulate_games_arguments = {
+            "maximum_hands_per_game": 1,
+            "initial_first_pone_score": scg.Points(0),
+            "initial_first_dealer_score": scg.Points(0),
+            "first_pone_dealt_cards": dealt_cards,
+            "first_dealer_dealt_cards": [],
+            "first_pone_kept_cards": [],
+            "first_dealer_kept_cards": [],
+            "initial_starter": None,
+            "initial_play_actions": [],
+            "first_pone_select_kept_cards": scg.DEFAULT_SELECT_PONE_KEPT_CARDS,
+            "first_pone_discard_based_on_simulations": False,
+            "first_pone_select_each_possible_kept_hand": True,
+            "first_dealer_select_kept_cards": scg.DEFAULT_SELECT_DEALER_KEPT_CARDS,
+            "first_dealer_discard_based_on_simulations": False,
+            "first_dealer_select_each_possible_kept_hand": False,
+            "first_pone_select_play": scg.DEFAULT_SELECT_PLAY,
+            "first_pone_play_based_on_simulations": None,
+            "first_dealer_select_play": scg.DEFAULT_SELECT_PLAY,
+            "first_dealer_play_based_on_simulations": None,
+            "coach_discard_simulated_hand_count": None,
+            "coach_play_simulated_hand_count": None,
+            "estimate_first_pone_incomplete_game_wins_and_game_points": False,
+            "estimate_first_dealer_incomplete_game_wins_and_game_points": False,
+            "hide_missing_incomplete_game_wins_and_game_points_estimates": True,
+            "select_each_post_initial_play": False,
+            "hide_first_pone_hands": True,
+            "hide_first_dealer_hands": True,
+            "hide_play_actions": True,
+            "games_per_update": scg.sys.maxsize,
+            "show_statistics_updates": False,
+            "confidence_level": 95,
+            "start_time_ns": 0,
+            "show_calc_cache_usage_stats": False,
+        }
+        original_directory = os.getcwd()
+        original_process_count = scg.nested_simulation_process_count
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            scg.shelve.open(
+                scg.START_OF_HAND_POSITION_RESULTS_TALLIES_SHELF_FILENAME, "c"
+            ).close()
+            scg.nested_simulation_process_count = 2
+            try:
+                means = []
+                for _ in range(2):
+                    random.seed(1)
+                    players_statistics = scg.simulate_nested_games(
+                        15, 3, False, None, **simulate_games_arguments
+                    )
+                    self.assertEqual(len(players_statistics), 15)
+                    self.assertEqual(
+                        scg.get_length_across_all_keys(players_statistics), 45
+                    )
+                    means.append(
+                        {
+                            next_action: statistics[
+                                "first_pone_minus_first_dealer_total_points"
+                            ].mean()
+                            for next_action, statistics in players_statistics.items()
+                        }
+                    )
+                self.assertEqual(means[0], means[1])
+            finally:
+                scg.get_nested_simulations_pool().terminate()
+                scg.nested_simulations_pool = None
+                scg.nested_simulation_process_count = original_process_count
+                os.chdir(original_directory)
+
+    def test_game_results_log_rebuilds_simulated_statistics(self):
+        """Logged per-game results rebuild the run's players statistics."""
+        scg = simulate_cribbage_games
+        players_statistics = scg.PlayersStatisticsStore()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results", "game_results.0.bin")
+            scg.simulate_games(
+                30,
+                30,
+                maximum_hands_per_game=2,
+                initial_first_pone_score=scg.Points(0),
+                initial_first_dealer_score=scg.Points(0),
+                first_pone_dealt_cards=scg.parse_cards("AC,2D,3H,4S,5C,6D"),
+                first_dealer_dealt_cards=[],
+                first_pone_kept_cards=[],
+                first_dealer_kept_cards=[],
+                initial_starter=None,
+                initial_play_actions=[],
+                players_statistics=players_statistics,
+                first_pone_select_kept_cards=scg.DEFAULT_SELECT_PONE_KEPT_CARDS,
+                first_pone_discard_based_on_simulations=None,
+                first_pone_select_each_possible_kept_hand=True,
+                first_dealer_select_kept_cards=scg.DEFAULT_SELECT_DEALER_KEPT_CARDS,
+                first_dealer_discard_based_on_simulations=None,
+                first_dealer_select_each_possible_kept_hand=False,
+                first_pone_select_play=scg.DEFAULT_SELECT_PLAY,
+                first_pone_play_based_on_simulations=None,
+                first_dealer_select_play=scg.DEFAULT_SELECT_PLAY,
+                first_dealer_play_based_on_simulations=None,
+                coach_discard_simulated_hand_count=None,
+                coach_play_simulated_hand_count=None,
+                tally_start_of_hand_position_results=False,
+                estimate_first_pone_incomplete_game_wins_and_game_points=False,
+                estimate_first_dealer_incomplete_game_wins_and_game_points=False,
+                hide_missing_incomplete_game_wins_and_game_points_estimates=True,
+                start_of_hand_position_results_tallies={},
+                select_each_post_initial_play=False,
+                hide_first_pone_hands=True,
+                hide_first_dealer_hands=True,
+                hide_play_actions=True,
+                games_per_update=7,
+                show_statistics_updates=False,
+                confidence_level=95,
+                start_time_ns=0,
+                show_calc_cache_usage_stats=False,
+                worker_seed=5,
+                game_results_path=path,
+            )
+            header, columns = scg.read_game_results(path)
+            logged_players_statistics = scg.read_game_results_players_statistics([path])
+        self.assertEqual(header["worker_seed"], 5)
+        self.assertEqual(
+            header["first_pone_select_play"], scg.DEFAULT_SELECT_PLAY.__name__
+        )
+        self.assertEqual(len(columns["hand_count"]), 30)
+        self.assertTrue(all(1 <= hands <= 2 for hands in columns["hand_count"]))
+        self.assertEqual(list(logged_players_statistics), list(players_statistics))
+        for next_action, statistics in players_statistics.items():
+            for players_statistic, statistic in statistics.items():
+                logged_statistic = logged_players_statistics[next_action][
+                    players_statistic
+                ]
+                self.assertEqual(len(logged_statistic), len(statistic))
+                self.assertEqual(logged_statistic.mean(), statistic.mean())
+                self.assertEqual(logged_statistic.maximum(), statistic.maximum())
+
+    def test_resumed_simulation_matches_uninterrupted_simulation(self):
+        """An interrupted run fails and its resumption repeats a whole run."""
+        scg = simulate_cribbage_games
+        simulate_games_arguments = {
+            "maximum_hands_per_game": 2,
+            "initial_first_pone_score": scg.Points(0),
+            "initial_first_dealer_score": scg.Points(0),
+            "first_pone_dealt_cards": scg.parse_cards("AC,2D,3H,4S,5C,6D"),
+            "first_dealer_dealt_cards": [],
+            "first_pone_kept_cards": [],
+            "first_dealer_kept_cards": [],
+            "initial_starter": None,
+            "initial_play_actions": [],
+            "first_pone_select_kept_cards": scg.DEFAULT_SELECT_PONE_KEPT_CARDS,
+            "first_pone_discard_based_on_simulations": None,
+            "first_pone_select_each_possible_kept_hand": True,
+            "first_dealer_select_kept_cards": scg.DEFAULT_SELECT_DEALER_KEPT_CARDS,
+            "first_dealer_discard_based_on_simulations": None,
+            "first_dealer_select_each_possible_kept_hand": False,
+            "first_pone_select_play": scg.DEFAULT_SELECT_PLAY,
+            "first_pone_play_based_on_simulations": None,
+            "first_dealer_select_play": scg.DEFAULT_SELECT_PLAY,
+            "first_dealer_play_based_on_simulations": None,
+            "coach_discard_simulated_hand_count": None,
+            "coach_play_simulated_hand_count": None,
+            "tally_start_of_hand_position_results": False,
+            "estimate_first_pone_incomplete_game_wins_and_game_points": False,
+            "estimate_first_dealer_incomplete_game_wins_and_game_points": False,
+            "hide_missing_incomplete_game_wins_and_game_points_estimates": True,
+            "start_of_hand_position_results_tallies": {},
+            "select_each_post_initial_play": False,
+            "hide_first_pone_hands": True,
+            "hide_first_dealer_hands": True,
+            "hide_play_actions": True,
+            "games_per_update": 5,
+            "show_statistics_updates": False,
+            "confidence_level": 95,
+            "start_time_ns": 0,
+            "show_calc_cache_usage_stats": False,
+            "worker_seed": 7,
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            uninterrupted_path = os.path.join(directory, "uninterrupted.bin")
+            uninterrupted_players_statistics = scg.PlayersStatisticsStore()
+            scg.simulate_games(
+                25,
+                25,
+                players_statistics=uninterrupted_players_statistics,
+                game_results_path=uninterrupted_path,
+                **simulate_games_arguments,
+            )
+            resumed_path = os.path.join(directory, "resumed.bin")
+            checkpoint_path = scg.get_checkpoint_path(directory, 0)
+            with unittest.mock.patch.object(
+                scg,
+                "enforce_calc_cache_memory_ceiling",
+                side_effect=[[]] * 13 + [KeyboardInterrupt()],
+            ), contextlib.redirect_stdout(io.StringIO()) as stdout:
+                with self.assertRaises(SystemExit) as interrupted_exit:
+                    scg.simulate_games(
+                        25,
+                        25,
+                        players_statistics=scg.PlayersStatisticsStore(),
+                        game_results_path=resumed_path,
+                        checkpoint_path=checkpoint_path,
+                        **simulate_games_arguments,
+                    )
+            self.assertEqual(
+                interrupted_exit.exception.code, scg.INTERRUPTED_EXIT_STATUS
+            )
+            self.assertIn("Simulation interrupted", stdout.getvalue())
+            checkpoint = scg.read_simulation_checkpoint(checkpoint_path)
+            self.assertEqual(checkpoint.game_count, 10)
+            self.assertEqual(checkpoint.players_statistics.game_count(), 10)
+            random.seed(0)
+            with unittest.mock.patch.object(
+                scg, "simulation_performance_statistics", return_value=""
+            ) as simulation_performance_statistics, contextlib.redirect_stdout(
+                io.StringIO()
+            ):
+                scg.simulate_games(
+                    25,
+                    25,
+                    players_statistics=checkpoint.players_statistics,
+                    game_results_path=resumed_path,
+                    checkpoint_path=checkpoint_path,
+                    resume_checkpoint=checkpoint,
+                    **{**simulate_games_arguments, "show_statistics_updates": True},
+                )
+            self.assertEqual(
+                simulation_performance_statistics.call_args.args[1], 25 - 10
+            )
+            self.assertEqual(
+                scg.read_simulation_checkpoint(checkpoint_path).game_count, 25
+            )
+            with open(uninterrupted_path, "rb") as uninterrupted_file, open(
+                resumed_path, "rb"
+            ) as resumed_file:
+                self.assertEqual(uninterrupted_file.read(), resumed_file.read())
+            with self.assertRaises(ValueError):
+                scg.simulate_games(
+                    25,
+                    25,
+                    players_statistics=scg.PlayersStatisticsStore(),
+                    resume_checkpoint=checkpoint,
+                    **{**simulate_games_arguments, "maximum_hands_per_game": 3},
+                )
+            with self.assertRaises(ValueError):
+                scg.simulate_games(
+                    25,
+                    25,
+                    players_statistics=scg.PlayersStatisticsStore(),
+                    resume_checkpoint=checkpoint._replace(worker_count=2),
+                    **simulate_games_arguments,
+                )
+        resumed_players_statistics = checkpoint.players_statistics
+        self.assertEqual(resumed_players_statistics.game_count(), 25)
+        for next_action, statistics in uninterrupted_players_statistics.items():
+            for players_statistic, statistic in statistics.items():
+                resumed_statistic = resumed_players_statistics[next_action][
+                    players_statistic
+                ]
+                self.assertEqual(len(resumed_statistic), len(statistic))
+                self.assertEqual(resumed_statistic.mean(), statistic.mean())
+                self.assertEqual(resumed_statistic.maximum(), statistic.maximum())
+
+    def test_resume_requires_exactly_the_checkpoints_of_each_worker(self):
+        """Resuming refuses checkpoints of another count or set of workers."""
+        scg = simulate_cribbage_games
+        with tempfile.TemporaryDirectory() as directory:
+            for worker_number in range(2):
+                scg.write_simulation_checkpoint(
+                    scg.get_checkpoint_path(directory, worker_number),
+                    scg.SimulationCheckpoint(
+                        {},
+                        worker_number,
+                        2,
+                        0,
+                        scg.PlayersStatisticsStore(),
+                        set(),
+                        set(),
+                        random.getstate(),
+                        (),
+                        None,
+                    ),
+                )
+            self.assertEqual(
+                [
+                    checkpoint.worker_number
+                    for checkpoint in scg.read_resume_checkpoints(directory, 2)
+                ],
+                [0, 1],
+            )
+            for worker_count in [1, 3]:
+                with self.assertRaises(ValueError):
+                    scg.read_resume_checkpoints(directory, worker_count)
+            scg.write_simulation_checkpoint(
+                scg.get_checkpoint_path(directory, 1),
+                scg.read_simulation_checkpoint(scg.get_checkpoint_path(directory, 0)),
+            )
+            with self.assertRaises(ValueError):
+                scg.read_resume_checkpoints(directory, 2)
+
+    def test_merged_statistics_snapshots_pool_independent_runs(self):
+        """Snapshots round-trip exactly and merge only for one configuration."""
+        scg = simulate_cribbage_games
+        rng = random.Random(2)
+        next_actions = [
+            (tuple(scg.DECK_LIST[:4]), None),
+            ((), scg.DECK_LIST[5]),
+        ]
+        stores = [scg.PlayersStatisticsStore() for _ in range(2)]
+        for store in stores:
+            for _ in range(9):
+                store.push(
+                    rng.choice(next_actions),
+                    [rng.uniform(-10, 10) for _ in scg.PLAYERS_STATISTICS],
+                )
+        configuration = {"maximum_hands_per_game": 1, "first_pone_dealt_cards": []}
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [
+                os.path.join(directory, f"snapshot.{number}.json")
+                for number in range(3)
+            ]
+            for path, store in zip(paths, stores):
+                scg.write_statistics_snapshot(path, configuration, store)
+            read_configuration, read_store = scg.read_statistics_snapshot(paths[0])
+            merged_configuration, merged_store = scg.merge_statistics_snapshots(
+                paths[:2]
+            )
+            scg.write_statistics_snapshot(
+                paths[2], {**configuration, "maximum_hands_per_game": 2}, stores[0]
+            )
+            with self.assertRaises(ValueError):
+                scg.merge_statistics_snapshots(paths)
+        self.assertEqual(read_configuration, configuration)
+        self.assertEqual(merged_configuration, configuration)
+        self.assertEqual(list(read_store), list(stores[0]))
+        for column in ("counts", "means", "m2s", "minimums", "maximums"):
+            self.assertEqual(getattr(read_store, column), getattr(stores[0], column))
+        expected_store = scg.PlayersStatisticsStore()
+        for store in stores:
+            expected_store.merge(store)
+        self.assertEqual(merged_store.game_count(), 18)
+        for column in ("counts", "means", "m2s", "minimums", "maximums"):
+            self.assertEqual(
+                getattr(merged_store, column), getattr(expected_store, column)
+            )
+
 
 if __name__ == "__main__":
     unittest.main()